@@ -0,0 +1,108 @@
+"""
+Compare JSON codecs on DM.API envelope shapes.
+
+Run from the repository root:
+
+    uv run --extra fast python -m benchmarks.codec_benchmark --items 500 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections.abc import Callable
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from src.api.codec import JsonCodec, available_codecs, select_codec
+from src.api.models.game.post_model import PostListEnvelope
+from src.api.models.messaging.messaging_model import MessageListEnvelope
+
+
+def _user(index: int) -> dict:
+    return {
+        "login": f"player_{index}",
+        "roles": ["Guest", "Player"],
+        "mediumPictureUrl": f"https://dm.am/uploads/{index}/medium.png",
+        "smallPictureUrl": f"https://dm.am/uploads/{index}/small.png",
+        "status": "Online",
+        "rating": {"enabled": True, "quality": index % 100, "quantity": index % 7},
+        "online": "2024-05-01T12:30:00+00:00",
+        "registration": "2019-01-15T08:00:00+00:00",
+    }
+
+
+def post_list_payload(items: int) -> dict:
+    posts = [
+        {
+            "id": str(uuid4()),
+            "room": {"id": str(uuid4()), "title": "Таверна «Гнутый гвоздь»"},
+            "author": _user(index),
+            "created": "2024-05-01T12:30:00+00:00",
+            "updated": "2024-05-01T12:45:00+00:00",
+            "text": {"value": "[b]Бросок[/b] на внимание. " * 20, "parseMode": "Post"},
+            "commentary": {"value": "ooc: пропускаю ход", "parseMode": "Common"},
+            "diceRolls": [{"rolls": 3, "edges": 6, "bonus": 1, "results": [{"value": 4}, {"value": 6}, {"value": 1}]}],
+        }
+        for index in range(items)
+    ]
+    return {"resources": posts, "paging": {"pages": 10, "current": 1, "size": items, "total": items * 10}}
+
+
+def message_list_payload(items: int) -> dict:
+    messages = [
+        {
+            "id": str(uuid4()),
+            "created": "2024-05-01T12:30:00+00:00",
+            "author": _user(index),
+            "text": {"value": f"Сообщение номер {index}", "parseMode": "Chat"},
+        }
+        for index in range(items)
+    ]
+    return {"resources": messages, "paging": {"pages": 1, "current": 1, "size": items, "total": items}}
+
+
+def _measure(function: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat)) * 1000
+
+
+def _codec_rows(
+    shape: str, codec: JsonCodec, payload: dict, body: bytes, model: type[BaseModel], repeat: int
+) -> list[tuple[str, str, str, float]]:
+    return [
+        (shape, codec.name, "dumps", _measure(lambda: codec.dumps(payload), repeat)),
+        (shape, codec.name, "loads", _measure(lambda: codec.loads(body), repeat)),
+        (shape, codec.name, "loads+validate", _measure(lambda: model.model_validate(codec.loads(body)), repeat)),
+    ]
+
+
+def _shape_rows(shape: str, payload: dict, model: type[BaseModel], repeat: int) -> list[tuple[str, str, str, float]]:
+    body = select_codec("stdlib").dumps(payload)
+    rows = []
+    for name in available_codecs():
+        rows.extend(_codec_rows(shape, select_codec(name), payload, body, model, repeat))
+    rows.append((shape, "pydantic", "validate_json", _measure(lambda: model.model_validate_json(body), repeat)))
+    return rows
+
+
+def run(items: int, repeat: int) -> list[tuple[str, str, str, float]]:
+    return [
+        *_shape_rows("PostListEnvelope", post_list_payload(items), PostListEnvelope, repeat),
+        *_shape_rows("MessageListEnvelope", message_list_payload(items), MessageListEnvelope, repeat),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=500, help="resources per envelope")
+    parser.add_argument("--repeat", type=int, default=30, help="best-of repetitions per measurement")
+    args = parser.parse_args()
+
+    print(f"{'shape':<22}{'codec':<10}{'operation':<16}{'best ms':>10}")
+    for shape, codec, operation, millis in run(args.items, args.repeat):
+        print(f"{shape:<22}{codec:<10}{operation:<16}{millis:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
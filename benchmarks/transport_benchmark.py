@@ -0,0 +1,91 @@
+"""
+Compare per-call client overhead of the requests session path and the urllib3 fast transport.
+
+Both transports call the same in-process HTTP server, which answers a fixed small JSON body, so the difference
+between rows is client-side work. Run from the repository root:
+
+    uv run python -m benchmarks.transport_benchmark --calls 2000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.game.game_controller import GameApi
+from src.api.transport import TRANSPORTS
+
+BODY = json.dumps({"resource": {"id": "game-1", "title": "Benchmark"}}).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = 65536
+
+    def log_message(self, format: str, *args) -> None:
+        return
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+def _serve() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _measure(game_api: GameApi, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        game_api.get_game(id="game-1")
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+def run(calls: int, repeat: int) -> list[tuple[str, float, float]]:
+    server = _serve()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    previous = BaseController.transport, BaseController.coalesce_gets
+    BaseController.coalesce_gets = False
+    rows = []
+    try:
+        for transport in TRANSPORTS:
+            BaseController.transport = transport
+            game_api = GameApi(base_url=base_url, auth_token="token")
+            _measure(game_api, min(calls, 100))
+            samples = [_measure(game_api, calls) for _ in range(repeat)]
+            rows.append((transport, min(samples), statistics.median(samples)))
+    finally:
+        BaseController.transport, BaseController.coalesce_gets = previous
+        BaseController.close_all_sessions()
+        server.shutdown()
+        server.server_close()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000, help="sequential calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per transport")
+    args = parser.parse_args()
+
+    rows = run(args.calls, args.repeat)
+    baseline = rows[0][1]
+    print(f"{'transport':<12}{'best us/call':>14}{'median us/call':>16}{'vs requests':>13}")
+    for transport, best, median in rows:
+        print(f"{transport:<12}{best:>14.1f}{median:>16.1f}{best / baseline:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from src.api.controllers.async_base_controller import AsyncBaseController
 from src.api.controllers.base_controller import BaseController
 
-__all__ = ["BaseController"]
+__all__ = ["AsyncBaseController", "BaseController"]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import ClassVar, Protocol
+
+from src.api.env import env_float
+from src.api.file_lock import FileLock
+
+TokenIssuer = Callable[[], str | None]
+
+
+@dataclass(frozen=True)
+class IssuedToken:
+    token: str
+    issued_at: float
+
+
+class TokenStore:
+    """
+    Auth tokens keyed by login, shared by every process on the host through a ``FileLock``-guarded file per ``BASE_URL``.
+
+    Tokens are trusted until they are ``max_age`` seconds old; nothing is validated up front. A caller that gets a
+    401 hands the rejected token to ``refresh``, which re-issues it unless another worker already has. The store file
+    is only locked to read and write it. Issuing happens under a host-wide lock of its own login, so concurrent callers
+    for that login wait for one login instead of each doing their own, while other logins and reads go on.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        directory: str | Path | None = None,
+        max_age: float = 1800.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        digest = hashlib.sha1(base_url.rstrip("/").encode()).hexdigest()[:12]
+        directory = Path(directory or Path(tempfile.gettempdir()) / "dm-api-tokens")
+        self.base_url = base_url
+        self.max_age = max_age
+        self.path = directory / f"tokens-{digest}.json"
+        self._clock = clock
+        self._lock = FileLock(self.path)
+        self._login_locks: dict[str, FileLock] = {}
+        self._login_locks_guard = threading.Lock()
+
+    @classmethod
+    def from_env(cls, base_url: str) -> TokenStore:
+        return cls(
+            base_url,
+            directory=os.getenv("DM_TOKEN_STORE_DIR") or None,
+            max_age=env_float("DM_TOKEN_MAX_AGE", 1800.0),
+        )
+
+    def _read(self) -> dict[str, IssuedToken]:
+        try:
+            payload = json.loads(self._lock.read() or b"{}")
+        except ValueError:
+            return {}
+        return {login: IssuedToken(**token) for login, token in payload.items()}
+
+    def _write(self, tokens: dict[str, IssuedToken]) -> None:
+        # Expired entries would be re-issued anyway; dropping them keeps the file from growing run after run.
+        fresh = {login: asdict(token) for login, token in tokens.items() if self._is_fresh(token)}
+        self._lock.write(json.dumps(fresh).encode("utf-8"))
+
+    def _is_fresh(self, token: IssuedToken) -> bool:
+        return self._clock() - token.issued_at < self.max_age
+
+    def _login_lock(self, login: str) -> FileLock:
+        with self._login_locks_guard:
+            lock = self._login_locks.get(login)
+            if lock is None:
+                digest = hashlib.sha1(login.encode()).hexdigest()[:12]
+                lock = self._login_locks[login] = FileLock(self.path.with_name(f"{self.path.stem}-{digest}.lock"))
+            return lock
+
+    def _stored(self, login: str, rejected: str | None) -> str | None:
+        with self._lock:
+            current = self._read().get(login)
+        if current is not None and current.token != rejected and self._is_fresh(current):
+            return current.token
+        return None
+
+    def _issue(self, login: str, issue: TokenIssuer, rejected: str | None = None) -> str | None:
+        stored = self._stored(login, rejected)
+        if stored is not None:
+            return stored
+        with self._login_lock(login):
+            stored = self._stored(login, rejected)
+            if stored is not None:
+                return stored
+            token = issue()
+            with self._lock:
+                tokens = self._read()
+                if token is None:
+                    tokens.pop(login, None)
+                else:
+                    tokens[login] = IssuedToken(token, self._clock())
+                self._write(tokens)
+            return token
+
+    def peek(self, login: str) -> IssuedToken | None:
+        with self._lock:
+            return self._read().get(login)
+
+    def get(self, login: str, issue: TokenIssuer) -> str | None:
+        """Return the stored token for ``login``, issuing a new one if there is none or it is past ``max_age``."""
+        return self._issue(login, issue)
+
+    def refresh(self, login: str, rejected: str, issue: TokenIssuer) -> str | None:
+        """Replace ``rejected`` after a 401, reusing a token another caller has already issued in the meantime."""
+        return self._issue(login, issue, rejected)
+
+    def put(self, login: str, token: str) -> None:
+        with self._lock:
+            tokens = self._read()
+            tokens[login] = IssuedToken(token, self._clock())
+            self._write(tokens)
+
+    def discard(self, login: str) -> None:
+        with self._lock:
+            tokens = self._read()
+            if tokens.pop(login, None) is not None:
+                self._write(tokens)
+
+
+class CredentialProvider(Protocol):
+    """What a controller needs to re-authenticate on its own: the current token and a way to replace a rejected one."""
+
+    def token(self) -> str | None: ...
+
+    def refresh(self, rejected: str | None) -> str | None: ...
+
+
+class StoredCredentials:
+    """
+    ``CredentialProvider`` backed by a ``TokenStore`` entry and a login callable.
+
+    Refreshes of one login are serialised by a per-login lock shared by every instance in the process, and the
+    store hands back a token that another thread or worker already re-issued, so a burst of 401s costs one login.
+    """
+
+    _locks_guard: ClassVar[threading.Lock] = threading.Lock()
+    _refresh_locks: ClassVar[dict[tuple[str, str], threading.Lock]] = {}
+
+    def __init__(self, store: TokenStore, login: str, issue: TokenIssuer):
+        self.store = store
+        self.login = login
+        self._issue = issue
+
+    def _refresh_lock(self) -> threading.Lock:
+        with self._locks_guard:
+            return self._refresh_locks.setdefault((str(self.store.path), self.login), threading.Lock())
+
+    def token(self) -> str | None:
+        return self.store.get(self.login, self._issue)
+
+    def refresh(self, rejected: str | None) -> str | None:
+        with self._refresh_lock():
+            if rejected is None:
+                return self.store.get(self.login, self._issue)
+            return self.store.refresh(self.login, rejected, self._issue)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.api.controllers.base_controller import BaseController
+
+
+@dataclass(frozen=True)
+class Call:
+    """One deferred controller invocation, e.g. ``Call(post_api.post_post, (room_id,), {"payload": payload})``."""
+
+    function: Callable[..., Any]
+    args: tuple = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def __call__(self) -> Any:
+        return self.function(*self.args, **self.kwargs)
+
+
+def call(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Call:
+    return Call(function, args, kwargs)
+
+
+@dataclass(frozen=True)
+class BatchOutcome:
+    index: int
+    value: Any = None
+    error: BaseException | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    outcomes: list[BatchOutcome]
+    elapsed: float
+    workers: int
+
+    @property
+    def results(self) -> list[Any]:
+        """Return values in input order; ``None`` where the call failed."""
+        return [outcome.value for outcome in self.outcomes]
+
+    @property
+    def errors(self) -> list[BaseException | None]:
+        return [outcome.error for outcome in self.outcomes]
+
+    @property
+    def failures(self) -> int:
+        return sum(not outcome.ok for outcome in self.outcomes)
+
+    @property
+    def throughput(self) -> float:
+        """Completed calls per second of wall-clock time."""
+        return len(self.outcomes) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def raise_for_failures(self) -> None:
+        failed = [outcome.error for outcome in self.outcomes if outcome.error is not None]
+        if failed:
+            raise ExceptionGroup(f"{len(failed)} of {len(self.outcomes)} batch calls failed", failed)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "calls": len(self.outcomes),
+            "failures": self.failures,
+            "workers": self.workers,
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_rps": round(self.throughput, 1),
+        }
+
+
+class BatchExecutor:
+    """
+    Fan controller calls out over a bounded thread pool.
+
+    The pool defaults to ``DM_HTTP_POOL_MAXSIZE`` so every worker can hold a pooled connection without
+    blocking on the adapter. Each call is isolated: a failure is recorded in its outcome and the rest keep running.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or BaseController.pool_maxsize()
+
+    @staticmethod
+    def _run_one(index: int, function: Callable[[], Any]) -> BatchOutcome:
+        started = time.perf_counter()
+        try:
+            value = function()
+        except Exception as exc:
+            return BatchOutcome(index=index, error=exc, elapsed=time.perf_counter() - started)
+        return BatchOutcome(index=index, value=value, elapsed=time.perf_counter() - started)
+
+    def run(self, calls: Iterable[Callable[[], Any]]) -> BatchReport:
+        calls = list(calls)
+        workers = max(1, min(self.max_workers, len(calls)))
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dm-batch") as executor:
+            outcomes = list(executor.map(self._run_one, range(len(calls)), calls))
+        return BatchReport(outcomes=outcomes, elapsed=time.perf_counter() - started, workers=workers)
+
+    def map(self, function: Callable[..., Any], *iterables: Iterable[Any]) -> BatchReport:
+        """Run ``function`` once per item, like the builtin ``map``: ``executor.map(api.post_post, rooms, payloads)``."""
+        return self.run(Call(function, args) for args in zip(*iterables, strict=True))
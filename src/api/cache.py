@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from src.api.env import env_flag
+
+CacheKey = tuple[Any, ...]
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ConditionalEntry:
+    value: Any
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validator_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """
+    Bounded LRU of GET responses that carry ``ETag``/``Last-Modified`` validators.
+
+    Values are the parsed envelopes handed back to callers, so a ``304 Not Modified`` skips both
+    the body transfer and pydantic validation. Cached envelopes are shared and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: OrderedDict[CacheKey, ConditionalEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: CacheKey) -> ConditionalEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: CacheKey, entry: ConditionalEntry) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def discard(self, key: CacheKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    family: str
+    ttl: float = 30.0
+    max_entries: int = 128
+
+
+class ResponseCache:
+    """
+    TTL cache of controller results, segmented per decorated method and grouped into resource families.
+
+    Invalidating a family evicts every segment that belongs to it and bumps the family generation,
+    so a read that was already in flight when the write happened does not store a stale value.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = Lock()
+        self._segments: dict[str, OrderedDict[CacheKey, tuple[float, Any]]] = {}
+        self._families: dict[str, set[str]] = {}
+        self._generations: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def generation(self, family: str) -> int:
+        with self._lock:
+            return self._generations.get(family, 0)
+
+    def get(self, segment: str, key: CacheKey) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entries = self._segments.get(segment)
+            item = entries.get(key) if entries else None
+            if item is None or item[0] <= now:
+                if item is not None:
+                    del entries[key]
+                self.misses += 1
+                return _MISSING
+            entries.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def put(self, segment: str, key: CacheKey, value: Any, policy: CachePolicy, generation: int) -> None:
+        with self._lock:
+            if self._generations.get(policy.family, 0) != generation:
+                return
+            entries = self._segments.setdefault(segment, OrderedDict())
+            self._families.setdefault(policy.family, set()).add(segment)
+            entries[key] = (time.monotonic() + policy.ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > policy.max_entries:
+                entries.popitem(last=False)
+
+    def invalidate(self, *families: str) -> None:
+        with self._lock:
+            for family in families:
+                self._generations[family] = self._generations.get(family, 0) + 1
+                for segment in self._families.get(family, ()):
+                    self._segments.pop(segment, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._segments.clear()
+            self._families.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+response_cache = ResponseCache(enabled=env_flag("DM_RESPONSE_CACHE"))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple | set):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def cached(family: str, ttl: float = 30.0, max_entries: int = 128) -> Callable:
+    """
+    Cache a controller read for ``ttl`` seconds, keyed by base URL, auth token and call arguments
+    (i.e. the resulting path and query). Active only while ``response_cache.enabled`` is set.
+    """
+    policy = CachePolicy(family=family, ttl=ttl, max_entries=max_entries)
+
+    def decorator(method: Callable) -> Callable:
+        segment = method.__qualname__
+        signature = inspect.signature(method)
+
+        def key_for(controller: Any, args: tuple, kwargs: dict) -> CacheKey:
+            bound = signature.bind(controller, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple((name, _freeze(value)) for name, value in list(bound.arguments.items())[1:])
+            return controller.base_url, controller.auth_token, arguments
+
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                if not response_cache.enabled:
+                    return await method(self, *args, **kwargs)
+                key = key_for(self, args, kwargs)
+                value = response_cache.get(segment, key)
+                if value is not _MISSING:
+                    return value
+                generation = response_cache.generation(family)
+                value = await method(self, *args, **kwargs)
+                response_cache.put(segment, key, value, policy, generation)
+                return value
+
+            async_wrapper.cache_policy = policy
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not response_cache.enabled:
+                return method(self, *args, **kwargs)
+            key = key_for(self, args, kwargs)
+            value = response_cache.get(segment, key)
+            if value is not _MISSING:
+                return value
+            generation = response_cache.generation(family)
+            value = method(self, *args, **kwargs)
+            response_cache.put(segment, key, value, policy, generation)
+            return value
+
+        wrapper.cache_policy = policy
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*families: str) -> Callable:
+    """Evict the given resource families once a mutating controller call finishes, successful or not."""
+
+    def decorator(method: Callable) -> Callable:
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                try:
+                    return await method(self, *args, **kwargs)
+                finally:
+                    response_cache.invalidate(*families)
+
+            async_wrapper.invalidated_families = families
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                response_cache.invalidate(*families)
+
+        wrapper.invalidated_families = families
+        return wrapper
+
+    return decorator
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec:
+    """Encodes request bodies to UTF-8 JSON bytes and decodes response bodies; the stdlib implementation."""
+
+    name = "stdlib"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """``orjson``-backed codec; its decode errors subclass ``json.JSONDecodeError``, so callers catch the same types."""
+
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+CODECS: dict[str, type[JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def available_codecs() -> list[str]:
+    return [name for name in CODECS if name != OrjsonCodec.name or orjson is not None]
+
+
+def select_codec(name: str | None = None) -> JsonCodec:
+    """
+    Resolve ``DM_JSON_CODEC`` (``auto``, ``orjson`` or ``stdlib``) to a codec instance.
+
+    ``auto`` prefers ``orjson`` when it is installed and falls back to the stdlib otherwise.
+    """
+    name = (name or os.getenv("DM_JSON_CODEC") or "auto").strip().lower()
+    if name == "auto":
+        name = OrjsonCodec.name if orjson is not None else JsonCodec.name
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}; expected one of: auto, {', '.join(CODECS)}")
+    if name not in available_codecs():
+        raise ValueError(f"JSON codec {name!r} is not installed; install the 'fast' extra")
+    return CODECS[name]()
+
+
+json_codec = select_codec()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from threading import Event, Lock
+from typing import Any
+
+
+class _Flight:
+    __slots__ = ("done", "error", "value")
+
+    def __init__(self):
+        self.done = Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is in flight block
+    and receive the same result (or exception). Once the call completes the key is forgotten,
+    so later calls start a fresh execution.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do[T](self, key: Hashable, function: Callable[[], T]) -> T:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = function()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.value
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
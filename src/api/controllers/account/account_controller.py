@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.account.account_model import (
     UserDetailsEnvelope,
     UserEnvelope,
@@ -9,16 +10,13 @@ from src.api.models.account.account_model import (
 
 class AccountApi(BaseController):
     def register(self, payload: dict) -> UserEnvelope:
-        data = self._post("/v1/account", data=payload)
-        return UserEnvelope.model_validate(data)
+        return self._post("/v1/account", data=payload, model=UserEnvelope)
 
     def get_current_user(self) -> UserDetailsEnvelope:
-        data = self._get("/v1/account")
-        return UserDetailsEnvelope.model_validate(data)
+        return self._get("/v1/account", model=UserDetailsEnvelope)
 
     def activate(self, token: str, payload: dict | None = None) -> UserEnvelope:
-        data = self._put(f"/v1/account/{token}", data=payload)
-        return UserEnvelope.model_validate(data)
+        return self._put(Route("/v1/account/{token}", token=token), data=payload, model=UserEnvelope)
 
     def reset_password(self, payload: dict) -> UserEnvelope | dict:
         data = self._post("/v1/account/password", data=payload)
@@ -27,9 +25,30 @@ class AccountApi(BaseController):
         return data
 
     def change_password(self, payload: dict) -> UserEnvelope:
-        data = self._put("/v1/account/password", data=payload)
-        return UserEnvelope.model_validate(data)
+        return self._put("/v1/account/password", data=payload, model=UserEnvelope)
 
     def change_email(self, payload: dict) -> UserEnvelope:
-        data = self._put("/v1/account/email", data=payload)
-        return UserEnvelope.model_validate(data)
+        return self._put("/v1/account/email", data=payload, model=UserEnvelope)
+
+
+class AsyncAccountApi(AsyncBaseController):
+    async def register(self, payload: dict) -> UserEnvelope:
+        return await self._post("/v1/account", data=payload, model=UserEnvelope)
+
+    async def get_current_user(self) -> UserDetailsEnvelope:
+        return await self._get("/v1/account", model=UserDetailsEnvelope)
+
+    async def activate(self, token: str, payload: dict | None = None) -> UserEnvelope:
+        return await self._put(Route("/v1/account/{token}", token=token), data=payload, model=UserEnvelope)
+
+    async def reset_password(self, payload: dict) -> UserEnvelope | dict:
+        data = await self._post("/v1/account/password", data=payload)
+        if isinstance(data, dict) and data.get("resource"):
+            return UserEnvelope.model_validate(data)
+        return data
+
+    async def change_password(self, payload: dict) -> UserEnvelope:
+        return await self._put("/v1/account/password", data=payload, model=UserEnvelope)
+
+    async def change_email(self, payload: dict) -> UserEnvelope:
+        return await self._put("/v1/account/email", data=payload, model=UserEnvelope)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from src.api.controllers.async_base_controller import AsyncBaseController
 from src.api.controllers.base_controller import BaseController
 from src.api.models.account.login_model import LoginCredentials, UserEnvelope
 
@@ -10,11 +11,11 @@ class LoginApi(BaseController):
         if x_dm_bb_render_mode is not None:
             headers["X-Dm-Bb-Render-Mode"] = x_dm_bb_render_mode
 
-        response = self._session.post(
-            self._url("/v1/account/login"),
+        response = self._send(
+            "POST",
+            "/v1/account/login",
             headers=self._headers(content_type=True, extra_headers=headers),
-            json=payload.model_dump(by_alias=True, exclude_none=True),
-            timeout=30,
+            data=self._encode(payload.model_dump(by_alias=True, exclude_none=True)),
         )
         response.raise_for_status()
         data = self._response_json(response)
@@ -43,3 +44,44 @@ class LoginApi(BaseController):
         if x_dm_bb_render_mode is not None:
             headers["X-Dm-Bb-Render-Mode"] = x_dm_bb_render_mode
         self._delete("/v1/account/login/all", headers=headers)
+
+
+class AsyncLoginApi(AsyncBaseController):
+    async def login(self, payload: LoginCredentials, x_dm_bb_render_mode: str | None = None) -> UserEnvelope:
+        headers = {}
+        if x_dm_bb_render_mode is not None:
+            headers["X-Dm-Bb-Render-Mode"] = x_dm_bb_render_mode
+
+        response = await self._send(
+            "POST",
+            "/v1/account/login",
+            headers=self._headers(content_type=True, extra_headers=headers),
+            content=self._encode(payload.model_dump(by_alias=True, exclude_none=True)),
+        )
+        response.raise_for_status()
+        data = self._response_json(response)
+        if not isinstance(data, dict):
+            data = {}
+
+        metadata = data.get("metadata")
+        if not isinstance(metadata, dict):
+            metadata = {}
+        token = response.headers.get("X-Dm-Auth-Token")
+        if token and "token" not in metadata:
+            metadata["token"] = token
+        if metadata:
+            data["metadata"] = metadata
+
+        return UserEnvelope.model_validate(data)
+
+    async def logout(self, x_dm_auth_token: str, x_dm_bb_render_mode: str | None = None) -> None:
+        headers = {"X-Dm-Auth-Token": x_dm_auth_token}
+        if x_dm_bb_render_mode is not None:
+            headers["X-Dm-Bb-Render-Mode"] = x_dm_bb_render_mode
+        await self._delete("/v1/account/login", headers=headers)
+
+    async def logout_all(self, x_dm_auth_token: str, x_dm_bb_render_mode: str | None = None) -> None:
+        headers = {"X-Dm-Auth-Token": x_dm_auth_token}
+        if x_dm_bb_render_mode is not None:
+            headers["X-Dm-Bb-Render-Mode"] = x_dm_bb_render_mode
+        await self._delete("/v1/account/login/all", headers=headers)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from threading import Lock
+from typing import ClassVar
+from weakref import WeakKeyDictionary
+
+import httpx
+from pydantic import BaseModel
+
+from src.api.controllers.base_controller import ControllerCore, route_template
+from src.api.env import env_int
+from src.api.metrics import latency_metrics
+
+
+class AsyncBaseController(ControllerCore):
+    """
+    Asyncio counterpart of ``BaseController``.
+
+    Clients are shared per base URL within one event loop, so thousands of coroutines
+    multiplex over a bounded connection pool instead of holding one thread each.
+    HTTP errors surface as ``httpx.HTTPStatusError`` with the same ``response.status_code`` contract.
+    """
+
+    _client_lock: ClassVar[Lock] = Lock()
+    _shared_clients: ClassVar[WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]] = (
+        WeakKeyDictionary()
+    )
+
+    @classmethod
+    def _create_client(cls) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=env_int("DM_ASYNC_HTTP_MAX_CONNECTIONS", 100),
+            max_keepalive_connections=env_int("DM_ASYNC_HTTP_MAX_KEEPALIVE", 20),
+        )
+        return httpx.AsyncClient(limits=limits, timeout=30)
+
+    @classmethod
+    def _get_or_create_client(cls, base_url: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with cls._client_lock:
+            clients = cls._shared_clients.setdefault(loop, {})
+            client = clients.get(base_url)
+            if client is None or client.is_closed:
+                client = cls._create_client()
+                clients[base_url] = client
+            return client
+
+    @classmethod
+    async def close_all_clients(cls) -> None:
+        loop = asyncio.get_running_loop()
+        with cls._client_lock:
+            clients = cls._shared_clients.pop(loop, {})
+        for client in clients.values():
+            await client.aclose()
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        return self._get_or_create_client(self.base_url)
+
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        owned = self._owns_token(kwargs.get("headers"))
+        response = await self._send_once(method, endpoint, **kwargs)
+        rejected = self._rejected_token(response, kwargs.get("headers")) if owned else None
+        if rejected is None:
+            return response
+        token = self._accept_refreshed(rejected, await asyncio.to_thread(self.credentials.refresh, rejected))
+        if token is None:
+            return response
+        await response.aclose()
+        return await self._send_once(
+            method, endpoint, **{**kwargs, "headers": {**kwargs["headers"], "X-Dm-Auth-Token": token}}
+        )
+
+    async def _send_once(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        await self.rate_limiter.acquire_async(self.base_url, route_template(endpoint))
+        started = time.perf_counter()
+        try:
+            return await self._client.request(method, self._url(endpoint), **kwargs)
+        finally:
+            latency_metrics.record(method, route_template(endpoint), time.perf_counter() - started)
+
+    async def _get[ModelT: BaseModel](
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        model: type[ModelT] | None = None,
+        conditional: bool = False,
+    ) -> dict | ModelT:
+        request_headers = self._headers(extra_headers=headers)
+        params = self._clean_params(params)
+        if conditional and self._conditional_cache.enabled:
+            key = self._request_key(endpoint, params, request_headers)
+            entry = self._conditional_cache.get(key)
+            if entry is not None:
+                request_headers = {**request_headers, **entry.validator_headers()}
+            response = await self._send("GET", endpoint, headers=request_headers, params=params)
+            return self._conditional_response(key, entry, response, model)
+
+        response = await self._send("GET", endpoint, headers=request_headers, params=params)
+        response.raise_for_status()
+        return self._parse(response, model)
+
+    async def _post[ModelT: BaseModel](
+        self,
+        endpoint: str,
+        data: dict | None = None,
+        params: dict | None = None,
+        headers: dict[str, str] | None = None,
+        files: dict[str, bytes] | None = None,
+        *,
+        model: type[ModelT] | None = None,
+    ) -> dict | ModelT:
+        request_headers = self._headers(content_type=files is None, extra_headers=headers)
+        response = await self._send(
+            "POST",
+            endpoint,
+            headers=request_headers,
+            params=self._clean_params(params),
+            content=self._encode(data) if files is None else None,
+            files=files,
+        )
+        response.raise_for_status()
+        return self._parse(response, model)
+
+    async def _put[ModelT: BaseModel](
+        self,
+        endpoint: str,
+        data: dict | None = None,
+        params: dict | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        model: type[ModelT] | None = None,
+    ) -> dict | ModelT:
+        response = await self._send(
+            "PUT",
+            endpoint,
+            headers=self._headers(content_type=True, extra_headers=headers),
+            params=self._clean_params(params),
+            content=self._encode(data),
+        )
+        response.raise_for_status()
+        return self._parse(response, model)
+
+    async def _patch[ModelT: BaseModel](
+        self,
+        endpoint: str,
+        data: dict | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        model: type[ModelT] | None = None,
+    ) -> dict | ModelT:
+        response = await self._send(
+            "PATCH",
+            endpoint,
+            headers=self._headers(content_type=True, extra_headers=headers),
+            content=self._encode(data),
+        )
+        response.raise_for_status()
+        return self._parse(response, model)
+
+    async def _delete(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict | None:
+        response = await self._send(
+            "DELETE",
+            endpoint,
+            headers=self._headers(extra_headers=headers),
+            params=self._clean_params(params),
+        )
+        response.raise_for_status()
+        if response.content:
+            return self._response_json(response)
+        return None
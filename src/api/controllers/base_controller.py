@@ -1,155 +1,484 @@
 from __future__ import annotations
 
 import atexit
+import functools
 import json
-import os
-from threading import Lock
-from typing import ClassVar
+import time
+from collections.abc import Mapping
+from threading import Lock, local
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar
 
 import requests
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from requests.adapters import HTTPAdapter
 
+from src.api.auth import CredentialProvider
+from src.api.cache import CacheKey, ConditionalCache, ConditionalEntry
+from src.api.codec import JsonCodec, json_codec
+from src.api.concurrency import SingleFlight
+from src.api.env import env_flag, env_int
+from src.api.metrics import latency_metrics
+from src.api.pool import InstrumentedHTTPAdapter, session_pool, warm_pool
+from src.api.rate_limit import RateLimiter, rate_limiter
+from src.api.transport import Urllib3Transport, select_session_strategy, select_transport
 
-def _env_int(name: str, default: int) -> int:
-    value = os.getenv(name)
-    if not value:
-        return default
-    try:
-        parsed = int(value)
-    except ValueError:
-        return default
-    return parsed if parsed > 0 else default
+if TYPE_CHECKING:
+    import httpx
 
 
-class BaseController:
+class Route(str):
+    """Concrete endpoint path that remembers the template it was rendered from, e.g. ``/v1/games/{id}``."""
+
+    template: str
+
+    def __new__(cls, template: str, **path_params: str) -> Route:
+        route = super().__new__(cls, template.format(**path_params) if path_params else template)
+        route.template = template
+        return route
+
+
+def route_template(endpoint: str) -> str:
+    return getattr(endpoint, "template", endpoint)
+
+
+@functools.cache
+def _type_adapter(model: type) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def _is_invalid_json(error: ValidationError) -> bool:
+    return any(detail["type"] == "json_invalid" for detail in error.errors(include_url=False))
+
+
+HeaderKey = tuple[bool, tuple[tuple[str, str], ...]]
+
+
+class ControllerCore:
+    codec: ClassVar[JsonCodec] = json_codec
+    header_variants_limit: ClassVar[int] = 64
+    rate_limiter: ClassVar[RateLimiter] = rate_limiter
+    _conditional_cache: ClassVar[ConditionalCache] = ConditionalCache(
+        env_int("DM_HTTP_CONDITIONAL_CACHE_SIZE", 256, minimum=0)
+    )
+
+    def __init__(
+        self,
+        base_url: str,
+        auth_token: str | None = None,
+        default_headers: dict[str, str] | None = None,
+        credentials: CredentialProvider | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.credentials = credentials
+        self._header_variants: dict[HeaderKey, Mapping[str, str]] = {}
+        self._auth_token = auth_token
+        if auth_token is None and credentials is not None:
+            self._auth_token = credentials.token()
+        self._default_headers: Mapping[str, str] = MappingProxyType(dict(default_headers or {}))
+
+    @property
+    def auth_token(self) -> str | None:
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, token: str | None) -> None:
+        self._auth_token = token
+        self._header_variants = {}
+
+    @property
+    def default_headers(self) -> Mapping[str, str]:
+        return self._default_headers
+
+    @default_headers.setter
+    def default_headers(self, headers: Mapping[str, str] | None) -> None:
+        self._default_headers = MappingProxyType(dict(headers or {}))
+        self._header_variants = {}
+
+    def _url(self, endpoint: str) -> str:
+        return f"{self.base_url}{endpoint}"
+
+    def _build_headers(self, content_type: bool, extra_headers: tuple[tuple[str, str], ...]) -> Mapping[str, str]:
+        headers = dict(self._default_headers)
+        token = self._auth_token
+        if token:
+            headers["X-Dm-Auth-Token"] = token
+        if content_type:
+            headers["Content-Type"] = "application/json"
+        headers.update(extra_headers)
+        return MappingProxyType(headers)
+
+    def _headers(
+        self, *, content_type: bool = False, extra_headers: Mapping[str, str] | None = None
+    ) -> Mapping[str, str]:
+        """
+        Return the read-only header set for this request shape.
+
+        Variants are built once per content type and set of extra headers (e.g. a render mode) and reused until
+        ``auth_token`` or ``default_headers`` is reassigned.
+        """
+        key = (content_type, tuple(extra_headers.items()) if extra_headers else ())
+        variants = self._header_variants
+        headers = variants.get(key)
+        if headers is None:
+            headers = self._build_headers(content_type, key[1])
+            if len(variants) >= self.header_variants_limit:
+                variants.clear()
+            variants[key] = headers
+        return headers
+
+    @staticmethod
+    def _rejected_token(response: requests.Response | httpx.Response, headers: Mapping[str, str] | None) -> str | None:
+        if response.status_code != 401 or not headers:
+            return None
+        return headers.get("X-Dm-Auth-Token")
+
+    def _owns_token(self, headers: Mapping[str, str] | None) -> bool:
+        """Whether the request carries this controller's own token, which is the only one it may refresh."""
+        if self.credentials is None or not headers or self.auth_token is None:
+            return False
+        return headers.get("X-Dm-Auth-Token") == self.auth_token
+
+    def _accept_refreshed(self, rejected: str, token: str | None) -> str | None:
+        if not token or token == rejected:
+            return None
+        self.auth_token = token
+        return token
+
+    @staticmethod
+    def _extract_data(payload: dict | list) -> dict | list:
+        if isinstance(payload, dict) and "data" in payload:
+            return payload["data"]
+        return payload
+
+    @staticmethod
+    def _clean_params(params: dict | None) -> dict | None:
+        if params is None:
+            return None
+        return {key: value for key, value in params.items() if value is not None}
+
+    @classmethod
+    def _encode(cls, data: dict | list | None) -> bytes | None:
+        if data is None:
+            return None
+        return cls.codec.dumps(data)
+
+    @classmethod
+    def _response_json(cls, response: requests.Response | httpx.Response) -> dict | list:
+        if not response.content:
+            return {}
+        try:
+            return cls.codec.loads(response.content)
+        except UnicodeDecodeError, json.JSONDecodeError, ValueError:
+            text = response.content.decode("utf-8", errors="replace")
+            return {"raw": text}
+
+    @classmethod
+    def _parse[ModelT: BaseModel](
+        cls, response: requests.Response | httpx.Response, model: type[ModelT] | None = None
+    ) -> dict | list | ModelT:
+        """
+        Validate the raw body straight into ``model`` without materialising an intermediate dict.
+
+        Bodies that are not JSON fall back to ``_response_json`` so the ``{"raw": text}`` shape is preserved.
+        """
+        if model is None:
+            return cls._response_json(response)
+        content = response.content
+        if not content:
+            return model.model_validate({})
+        is_model = isinstance(model, type) and issubclass(model, BaseModel)
+        try:
+            return model.model_validate_json(content) if is_model else _type_adapter(model).validate_json(content)
+        except ValidationError as error:
+            if not _is_invalid_json(error):
+                raise
+        data = cls._response_json(response)
+        return model.model_validate(data) if is_model else _type_adapter(model).validate_python(data)
+
+    def _request_key(self, endpoint: str, params: dict | None, headers: Mapping[str, str]) -> CacheKey:
+        frozen_params = tuple(
+            sorted(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in (self._clean_params(params) or {}).items()
+            )
+        )
+        return self._url(endpoint), frozen_params, tuple(sorted(headers.items()))
+
+    def _conditional_response[ModelT: BaseModel](
+        self,
+        key: CacheKey,
+        entry: ConditionalEntry | None,
+        response: requests.Response | httpx.Response,
+        model: type[ModelT] | None,
+    ) -> dict | list | ModelT:
+        cache = self._conditional_cache
+        if entry is not None and response.status_code == 304:
+            cache.record(hit=True)
+            return entry.value
+        cache.record(hit=False)
+        response.raise_for_status()
+        value = self._parse(response, model)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            cache.put(key, ConditionalEntry(value=value, etag=etag, last_modified=last_modified))
+        else:
+            cache.discard(key)
+        return value
+
+
+class BaseController(ControllerCore):
+    """
+    Sync controller over ``requests``.
+
+    With the ``shared`` session strategy every thread uses one ``requests.Session`` per base URL. With
+    ``thread_local`` each thread gets its own session (own cookie jar, no shared session state), and all of them
+    mount the same ``HTTPAdapter``, so the urllib3 connection pool is still shared per base URL.
+    """
+
     _session_lock: ClassVar[Lock] = Lock()
     _shared_sessions: ClassVar[dict[str, requests.Session]] = {}
+    _shared_adapters: ClassVar[dict[str, HTTPAdapter]] = {}
+    _thread_sessions: ClassVar[local] = local()
+    _session_generation: ClassVar[int] = 0
+    _in_flight_gets: ClassVar[SingleFlight] = SingleFlight()
+    coalesce_gets: ClassVar[bool] = env_flag("DM_HTTP_COALESCE_GETS")
+    transport: ClassVar[str] = select_transport()
+    session_strategy: ClassVar[str] = select_session_strategy()
+    _fast_transports: ClassVar[dict[str, Urllib3Transport]] = {}
+
+    @staticmethod
+    def pool_maxsize() -> int:
+        return env_int("DM_HTTP_POOL_MAXSIZE", 8)
 
     @classmethod
-    def _create_session(cls) -> requests.Session:
-        session = requests.Session()
-        adapter = HTTPAdapter(
-            pool_connections=_env_int("DM_HTTP_POOL_CONNECTIONS", 8),
-            pool_maxsize=_env_int("DM_HTTP_POOL_MAXSIZE", 8),
+    def _create_adapter(cls) -> HTTPAdapter:
+        return InstrumentedHTTPAdapter(
+            pool_connections=env_int("DM_HTTP_POOL_CONNECTIONS", 8),
+            pool_maxsize=cls.pool_maxsize(),
             pool_block=True,
         )
+
+    @staticmethod
+    def _create_session(adapter: HTTPAdapter) -> requests.Session:
+        session = requests.Session()
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
 
+    @classmethod
+    def _get_or_create_adapter(cls, base_url: str) -> HTTPAdapter:
+        with cls._session_lock:
+            return cls._adapter_locked(base_url)
+
+    @classmethod
+    def _adapter_locked(cls, base_url: str) -> HTTPAdapter:
+        adapter = cls._shared_adapters.get(base_url)
+        if adapter is None:
+            adapter = cls._create_adapter()
+            cls._shared_adapters[base_url] = adapter
+        return adapter
+
     @classmethod
     def _get_or_create_session(cls, base_url: str) -> requests.Session:
+        session = cls._shared_sessions.get(base_url)
+        if session is not None:
+            return session
         with cls._session_lock:
             session = cls._shared_sessions.get(base_url)
             if session is None:
-                session = cls._create_session()
+                session = cls._create_session(cls._adapter_locked(base_url))
                 cls._shared_sessions[base_url] = session
             return session
 
+    @classmethod
+    def _get_or_create_thread_session(cls, base_url: str) -> requests.Session:
+        """Session owned by the calling thread; it is rebuilt after ``close_all_sessions`` closed its adapter."""
+        sessions = getattr(cls._thread_sessions, "sessions", None)
+        if sessions is None or cls._thread_sessions.generation != cls._session_generation:
+            sessions = cls._thread_sessions.sessions = {}
+            cls._thread_sessions.generation = cls._session_generation
+        session = sessions.get(base_url)
+        if session is None:
+            session = sessions[base_url] = cls._create_session(cls._get_or_create_adapter(base_url))
+        return session
+
+    @classmethod
+    def _get_or_create_fast_transport(cls) -> Urllib3Transport:
+        transport = cls._fast_transports.get("urllib3")
+        if transport is not None:
+            return transport
+        with cls._session_lock:
+            transport = cls._fast_transports.get("urllib3")
+            if transport is None:
+                transport = Urllib3Transport(
+                    num_pools=env_int("DM_HTTP_POOL_CONNECTIONS", 8), maxsize=cls.pool_maxsize(), block=True
+                )
+                cls._fast_transports["urllib3"] = transport
+            return transport
+
+    @classmethod
+    def warm_up(cls, base_url: str, connections: int) -> int:
+        """Open ``connections`` pooled connections to ``base_url`` in parallel for the configured transport."""
+        base_url = base_url.rstrip("/")
+        if cls.transport == "urllib3":
+            return cls._get_or_create_fast_transport().warm_up(base_url, connections)
+        session = cls._create_session(cls._get_or_create_adapter(base_url))
+        return warm_pool(session_pool(session, base_url), connections)
+
     @classmethod
     def close_all_sessions(cls) -> None:
         with cls._session_lock:
             for session in cls._shared_sessions.values():
                 session.close()
             cls._shared_sessions.clear()
+            for adapter in cls._shared_adapters.values():
+                adapter.close()
+            cls._shared_adapters.clear()
+            cls._session_generation += 1
+            for transport in cls._fast_transports.values():
+                transport.close()
+            cls._fast_transports.clear()
 
-    def __init__(self, base_url: str, auth_token: str | None = None, default_headers: dict[str, str] | None = None):
-        self.base_url = base_url.rstrip("/")
-        self.auth_token: str | None = auth_token
-        self.default_headers = default_headers or {}
-        self._session = self._get_or_create_session(self.base_url)
-
-    def _url(self, endpoint: str) -> str:
-        return f"{self.base_url}{endpoint}"
+    def __init__(
+        self,
+        base_url: str,
+        auth_token: str | None = None,
+        default_headers: dict[str, str] | None = None,
+        credentials: CredentialProvider | None = None,
+    ):
+        super().__init__(base_url, auth_token=auth_token, default_headers=default_headers, credentials=credentials)
 
-    def _headers(self, *, content_type: bool = False, extra_headers: dict[str, str] | None = None) -> dict[str, str]:
-        headers = dict(self.default_headers)
-        token = self.auth_token
-        if token:
-            headers["X-Dm-Auth-Token"] = token
-        if content_type:
-            headers["Content-Type"] = "application/json"
-        if extra_headers:
-            headers.update(extra_headers)
-        return headers
+    @property
+    def _session(self) -> requests.Session:
+        if self.session_strategy == "thread_local":
+            return self._get_or_create_thread_session(self.base_url)
+        return self._get_or_create_session(self.base_url)
 
-    @staticmethod
-    def _extract_data(payload: dict | list) -> dict | list:
-        if isinstance(payload, dict) and "data" in payload:
-            return payload["data"]
-        return payload
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send one request; with ``credentials``, a 401 on the controller's own token is replayed with a fresh one."""
+        owned = self._owns_token(kwargs.get("headers"))
+        response = self._send_once(method, endpoint, **kwargs)
+        rejected = self._rejected_token(response, kwargs.get("headers")) if owned else None
+        if rejected is None:
+            return response
+        token = self._accept_refreshed(rejected, self.credentials.refresh(rejected))
+        if token is None:
+            return response
+        response.close()
+        return self._send_once(
+            method, endpoint, **{**kwargs, "headers": {**kwargs["headers"], "X-Dm-Auth-Token": token}}
+        )
 
-    @staticmethod
-    def _response_json(response: requests.Response) -> dict | list:
-        if not response.content:
-            return {}
+    def _send_once(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        self.rate_limiter.acquire(self.base_url, route_template(endpoint))
+        started = time.perf_counter()
         try:
-            return response.json()
-        except UnicodeDecodeError, json.JSONDecodeError, ValueError:
-            text = response.content.decode("utf-8", errors="replace")
-            return {"raw": text}
+            if self.transport == "urllib3" and kwargs.get("files") is None:
+                kwargs.pop("files", None)
+                return self._get_or_create_fast_transport().request(method, self._url(endpoint), timeout=30, **kwargs)
+            return self._session.request(method, self._url(endpoint), timeout=30, **kwargs)
+        finally:
+            latency_metrics.record(method, route_template(endpoint), time.perf_counter() - started)
 
-    def _get(
+    def _get[ModelT: BaseModel](
         self,
         endpoint: str,
         params: dict | None = None,
         headers: dict[str, str] | None = None,
-    ) -> dict:
-        response = self._session.get(
-            self._url(endpoint),
-            headers=self._headers(extra_headers=headers),
-            params=params,
-            timeout=30,
-        )
+        *,
+        model: type[ModelT] | None = None,
+        conditional: bool = False,
+    ) -> dict | ModelT:
+        request_headers = self._headers(extra_headers=headers)
+        key = self._request_key(endpoint, params, request_headers)
+
+        def fetch() -> dict | ModelT:
+            return self._fetch(key, endpoint, params, request_headers, model=model, conditional=conditional)
+
+        if self.coalesce_gets:
+            return self._in_flight_gets.do((key, model, conditional), fetch)
+        return fetch()
+
+    def _fetch[ModelT: BaseModel](
+        self,
+        key: CacheKey,
+        endpoint: str,
+        params: dict | None,
+        request_headers: Mapping[str, str],
+        *,
+        model: type[ModelT] | None,
+        conditional: bool,
+    ) -> dict | ModelT:
+        if conditional and self._conditional_cache.enabled:
+            entry = self._conditional_cache.get(key)
+            if entry is not None:
+                request_headers = {**request_headers, **entry.validator_headers()}
+            response = self._send("GET", endpoint, headers=request_headers, params=params)
+            return self._conditional_response(key, entry, response, model)
+
+        response = self._send("GET", endpoint, headers=request_headers, params=params)
         response.raise_for_status()
-        return self._response_json(response)
+        return self._parse(response, model)
 
-    def _post(
+    def _post[ModelT: BaseModel](
         self,
         endpoint: str,
         data: dict | None = None,
         params: dict | None = None,
         headers: dict[str, str] | None = None,
         files: dict[str, bytes] | None = None,
-    ) -> dict:
+        *,
+        model: type[ModelT] | None = None,
+    ) -> dict | ModelT:
         request_headers = self._headers(content_type=files is None, extra_headers=headers)
-        response = self._session.post(
-            self._url(endpoint),
+        response = self._send(
+            "POST",
+            endpoint,
             headers=request_headers,
             params=params,
-            json=data if files is None else None,
+            data=self._encode(data) if files is None else None,
             files=files,
-            timeout=30,
         )
         response.raise_for_status()
-        return self._response_json(response)
+        return self._parse(response, model)
 
-    def _put(
+    def _put[ModelT: BaseModel](
         self,
         endpoint: str,
         data: dict | None = None,
         params: dict | None = None,
         headers: dict[str, str] | None = None,
-    ) -> dict:
-        response = self._session.put(
-            self._url(endpoint),
+        *,
+        model: type[ModelT] | None = None,
+    ) -> dict | ModelT:
+        response = self._send(
+            "PUT",
+            endpoint,
             headers=self._headers(content_type=True, extra_headers=headers),
             params=params,
-            json=data,
-            timeout=30,
+            data=self._encode(data),
         )
         response.raise_for_status()
-        return self._response_json(response)
+        return self._parse(response, model)
 
-    def _patch(self, endpoint: str, data: dict | None = None, headers: dict[str, str] | None = None) -> dict:
-        response = self._session.patch(
-            self._url(endpoint),
+    def _patch[ModelT: BaseModel](
+        self,
+        endpoint: str,
+        data: dict | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        model: type[ModelT] | None = None,
+    ) -> dict | ModelT:
+        response = self._send(
+            "PATCH",
+            endpoint,
             headers=self._headers(content_type=True, extra_headers=headers),
-            json=data,
-            timeout=30,
+            data=self._encode(data),
         )
         response.raise_for_status()
-        return self._response_json(response)
+        return self._parse(response, model)
 
     def _delete(
         self,
@@ -157,11 +486,11 @@ class BaseController:
         params: dict | None = None,
         headers: dict[str, str] | None = None,
     ) -> dict | None:
-        response = self._session.delete(
-            self._url(endpoint),
+        response = self._send(
+            "DELETE",
+            endpoint,
             headers=self._headers(extra_headers=headers),
             params=params,
-            timeout=30,
         )
         response.raise_for_status()
         if response.content:
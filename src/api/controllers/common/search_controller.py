@@ -1,5 +1,10 @@
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+
+from src.api.controllers.async_base_controller import AsyncBaseController
 from src.api.controllers.base_controller import BaseController
 from src.api.models.common.search_model import ObjectListEnvelope
+from src.api.pagination import aiter_resources, iter_resources
 
 
 class SearchApi(BaseController):
@@ -14,5 +19,24 @@ class SearchApi(BaseController):
         }
         # Remove None values from params to avoid sending them in the request
         params = {k: v for k, v in params.items() if v is not None}
-        data = self._get("/v1/search", params=params)
-        return ObjectListEnvelope.model_validate(data)
+        return self._get("/v1/search", params=params, model=ObjectListEnvelope)
+
+    def iter_search(self, query: str, size: int | None = None, window: int | None = None) -> Iterator[dict]:
+        return iter_resources(partial(self.search, query), size=size, window=window)
+
+
+class AsyncSearchApi(AsyncBaseController):
+    async def search(
+        self, query: str, skip: int | None = None, number: int | None = None, size: int | None = None
+    ) -> ObjectListEnvelope:
+        params = {
+            "query": query,
+            "skip": skip,
+            "number": number,
+            "size": size,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        return await self._get("/v1/search", params=params, model=ObjectListEnvelope)
+
+    def iter_search(self, query: str, size: int | None = None, window: int | None = None) -> AsyncIterator[dict]:
+        return aiter_resources(partial(self.search, query), size=size, window=window)
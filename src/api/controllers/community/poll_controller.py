@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.community.poll_model import PollEnvelope, PollListEnvelope
 
 
@@ -15,19 +16,40 @@ class PollApi(BaseController):
             "size": size,
         }
         params = {k: v for k, v in params.items() if v is not None}
-        data = self._get("/v1/polls", params=params)
-        return PollListEnvelope.model_validate(data)
+        return self._get("/v1/polls", params=params, model=PollListEnvelope)
 
     def create(self, payload: dict) -> PollEnvelope:
-        data = self._post("/v1/polls", data=payload)
-        return PollEnvelope.model_validate(data)
+        return self._post("/v1/polls", data=payload, model=PollEnvelope)
 
     def get(self, id: str) -> PollEnvelope:
-        data = self._get(f"/v1/polls/{id}")
-        return PollEnvelope.model_validate(data)
+        return self._get(Route("/v1/polls/{id}", id=id), model=PollEnvelope)
 
     def vote(self, id: str, option_id: str = None) -> PollEnvelope:
         params = {"optionId": option_id}
         params = {k: v for k, v in params.items() if v is not None}
-        data = self._put(f"/v1/polls/{id}", params=params)
-        return PollEnvelope.model_validate(data)
+        return self._put(Route("/v1/polls/{id}", id=id), params=params, model=PollEnvelope)
+
+
+class AsyncPollApi(AsyncBaseController):
+    async def list(
+        self, only_active: bool = None, skip: int = None, number: int = None, size: int = None
+    ) -> PollListEnvelope:
+        params = {
+            "onlyActive": only_active,
+            "skip": skip,
+            "number": number,
+            "size": size,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        return await self._get("/v1/polls", params=params, model=PollListEnvelope)
+
+    async def create(self, payload: dict) -> PollEnvelope:
+        return await self._post("/v1/polls", data=payload, model=PollEnvelope)
+
+    async def get(self, id: str) -> PollEnvelope:
+        return await self._get(Route("/v1/polls/{id}", id=id), model=PollEnvelope)
+
+    async def vote(self, id: str, option_id: str = None) -> PollEnvelope:
+        params = {"optionId": option_id}
+        params = {k: v for k, v in params.items() if v is not None}
+        return await self._put(Route("/v1/polls/{id}", id=id), params=params, model=PollEnvelope)
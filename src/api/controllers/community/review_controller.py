@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.community.review_model import ReviewEnvelope, ReviewListEnvelope
 
 
@@ -18,20 +19,45 @@ class ReviewApi(BaseController):
             "number": number,
             "size": size,
         }
-        data = self._get("/v1/reviews", params=params)
-        return ReviewListEnvelope.model_validate(data)
+        return self._get("/v1/reviews", params=params, model=ReviewListEnvelope)
 
     def create(self, payload: dict) -> ReviewEnvelope:
-        data = self._post("/v1/reviews", data=payload)
-        return ReviewEnvelope.model_validate(data)
+        return self._post("/v1/reviews", data=payload, model=ReviewEnvelope)
 
     def get_by_id(self, id: str) -> ReviewEnvelope:
-        data = self._get(f"/v1/reviews/{id}")
-        return ReviewEnvelope.model_validate(data)
+        return self._get(Route("/v1/reviews/{id}", id=id), model=ReviewEnvelope)
 
     def update(self, id: str, payload: dict) -> ReviewEnvelope:
-        data = self._patch(f"/v1/reviews/{id}", data=payload)
-        return ReviewEnvelope.model_validate(data)
+        return self._patch(Route("/v1/reviews/{id}", id=id), data=payload, model=ReviewEnvelope)
 
     def delete(self, id: str) -> None:
-        self._delete(f"/v1/reviews/{id}")
+        self._delete(Route("/v1/reviews/{id}", id=id))
+
+
+class AsyncReviewApi(AsyncBaseController):
+    async def list(
+        self,
+        only_approved: bool | None = None,
+        skip: int | None = None,
+        number: int | None = None,
+        size: int | None = None,
+    ) -> ReviewListEnvelope:
+        params = {
+            "onlyApproved": only_approved,
+            "skip": skip,
+            "number": number,
+            "size": size,
+        }
+        return await self._get("/v1/reviews", params=params, model=ReviewListEnvelope)
+
+    async def create(self, payload: dict) -> ReviewEnvelope:
+        return await self._post("/v1/reviews", data=payload, model=ReviewEnvelope)
+
+    async def get_by_id(self, id: str) -> ReviewEnvelope:
+        return await self._get(Route("/v1/reviews/{id}", id=id), model=ReviewEnvelope)
+
+    async def update(self, id: str, payload: dict) -> ReviewEnvelope:
+        return await self._patch(Route("/v1/reviews/{id}", id=id), data=payload, model=ReviewEnvelope)
+
+    async def delete(self, id: str) -> None:
+        await self._delete(Route("/v1/reviews/{id}", id=id))
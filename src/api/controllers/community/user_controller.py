@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.community.user_model import UserDetailsEnvelope, UserEnvelope, UserListEnvelope
 
 
@@ -18,17 +19,41 @@ class UserApi(BaseController):
             "number": number,
             "size": size,
         }
-        data = self._get("/v1/users", params=params)
-        return UserListEnvelope.model_validate(data)
+        return self._get("/v1/users", params=params, model=UserListEnvelope)
 
     def get_by_login(self, login: str) -> UserEnvelope:
-        data = self._get(f"/v1/users/{login}")
-        return UserEnvelope.model_validate(data)
+        return self._get(Route("/v1/users/{login}", login=login), model=UserEnvelope)
 
     def get_details_by_login(self, login: str) -> UserDetailsEnvelope:
-        data = self._get(f"/v1/users/{login}/details")
-        return UserDetailsEnvelope.model_validate(data)
+        return self._get(Route("/v1/users/{login}/details", login=login), model=UserDetailsEnvelope)
 
     def update_details_by_login(self, login: str, payload: dict) -> UserDetailsEnvelope:
-        data = self._patch(f"/v1/users/{login}/details", data=payload)
-        return UserDetailsEnvelope.model_validate(data)
+        return self._patch(Route("/v1/users/{login}/details", login=login), data=payload, model=UserDetailsEnvelope)
+
+
+class AsyncUserApi(AsyncBaseController):
+    async def list(
+        self,
+        inactive: bool | None = None,
+        skip: int | None = None,
+        number: int | None = None,
+        size: int | None = None,
+    ) -> UserListEnvelope:
+        params = {
+            "inactive": inactive,
+            "skip": skip,
+            "number": number,
+            "size": size,
+        }
+        return await self._get("/v1/users", params=params, model=UserListEnvelope)
+
+    async def get_by_login(self, login: str) -> UserEnvelope:
+        return await self._get(Route("/v1/users/{login}", login=login), model=UserEnvelope)
+
+    async def get_details_by_login(self, login: str) -> UserDetailsEnvelope:
+        return await self._get(Route("/v1/users/{login}/details", login=login), model=UserDetailsEnvelope)
+
+    async def update_details_by_login(self, login: str, payload: dict) -> UserDetailsEnvelope:
+        return await self._patch(
+            Route("/v1/users/{login}/details", login=login), data=payload, model=UserDetailsEnvelope
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.community.userupload_model import UserDetailsEnvelope
 
 
@@ -10,5 +11,17 @@ class UserUploadApi(BaseController):
         headers = {}
         if render_mode:
             headers["X-Dm-Bb-Render-Mode"] = render_mode
-        data = self._post(f"/v1/users/{login}/uploads", files=files, headers=headers)
-        return UserDetailsEnvelope.model_validate(data)
+        return self._post(
+            Route("/v1/users/{login}/uploads", login=login), files=files, headers=headers, model=UserDetailsEnvelope
+        )
+
+
+class AsyncUserUploadApi(AsyncBaseController):
+    async def post_user_upload(self, login: str, file: bytes, render_mode: str | None = None) -> UserDetailsEnvelope:
+        files = {"file": ("upload.png", file, "image/png")}
+        headers = {}
+        if render_mode:
+            headers["X-Dm-Bb-Render-Mode"] = render_mode
+        return await self._post(
+            Route("/v1/users/{login}/uploads", login=login), files=files, headers=headers, model=UserDetailsEnvelope
+        )
@@ -1,37 +1,82 @@
-from src.api.controllers.base_controller import BaseController
+from src.api.cache import cached, invalidates
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.forum.comment_model import CommentEnvelope, UserEnvelope
 
 
 class CommentController(BaseController):
+    @cached("forum_comments")
     def get_comment(self, id: str, render_mode: str | None = None) -> CommentEnvelope:
         headers = {}
         if render_mode:
             headers["X-Dm-Bb-Render-Mode"] = render_mode
-        data = self._get(f"/v1/forum/comments/{id}", headers=headers)
-        return CommentEnvelope.model_validate(data)
+        return self._get(Route("/v1/forum/comments/{id}", id=id), headers=headers, model=CommentEnvelope)
 
+    @invalidates("forum_comments")
     def update_comment(self, id: str, payload: dict, render_mode: str | None = None) -> CommentEnvelope:
         headers = {}
         if render_mode:
             headers["X-Dm-Bb-Render-Mode"] = render_mode
-        data = self._patch(f"/v1/forum/comments/{id}", data=payload, headers=headers)
-        return CommentEnvelope.model_validate(data)
+        return self._patch(
+            Route("/v1/forum/comments/{id}", id=id), data=payload, headers=headers, model=CommentEnvelope
+        )
 
+    @invalidates("forum_comments", "topics")
     def delete_comment(self, id: str, render_mode: str | None = None) -> dict | None:
         headers = {}
         if render_mode:
             headers["X-Dm-Bb-Render-Mode"] = render_mode
-        return self._delete(f"/v1/forum/comments/{id}", headers=headers)
+        return self._delete(Route("/v1/forum/comments/{id}", id=id), headers=headers)
 
+    @invalidates("forum_comments")
     def like_comment(self, id: str, render_mode: str | None = None) -> UserEnvelope:
         headers = {}
         if render_mode:
             headers["X-Dm-Bb-Render-Mode"] = render_mode
-        data = self._post(f"/v1/forum/comments/{id}/likes", headers=headers)
-        return UserEnvelope.model_validate(data)
+        return self._post(Route("/v1/forum/comments/{id}/likes", id=id), headers=headers, model=UserEnvelope)
 
+    @invalidates("forum_comments")
     def unlike_comment(self, id: str, render_mode: str | None = None) -> dict | None:
         headers = {}
         if render_mode:
             headers["X-Dm-Bb-Render-Mode"] = render_mode
-        return self._delete(f"/v1/forum/comments/{id}/likes", headers=headers)
+        return self._delete(Route("/v1/forum/comments/{id}/likes", id=id), headers=headers)
+
+
+class AsyncCommentController(AsyncBaseController):
+    @cached("forum_comments")
+    async def get_comment(self, id: str, render_mode: str | None = None) -> CommentEnvelope:
+        headers = {}
+        if render_mode:
+            headers["X-Dm-Bb-Render-Mode"] = render_mode
+        return await self._get(Route("/v1/forum/comments/{id}", id=id), headers=headers, model=CommentEnvelope)
+
+    @invalidates("forum_comments")
+    async def update_comment(self, id: str, payload: dict, render_mode: str | None = None) -> CommentEnvelope:
+        headers = {}
+        if render_mode:
+            headers["X-Dm-Bb-Render-Mode"] = render_mode
+        return await self._patch(
+            Route("/v1/forum/comments/{id}", id=id), data=payload, headers=headers, model=CommentEnvelope
+        )
+
+    @invalidates("forum_comments", "topics")
+    async def delete_comment(self, id: str, render_mode: str | None = None) -> dict | None:
+        headers = {}
+        if render_mode:
+            headers["X-Dm-Bb-Render-Mode"] = render_mode
+        return await self._delete(Route("/v1/forum/comments/{id}", id=id), headers=headers)
+
+    @invalidates("forum_comments")
+    async def like_comment(self, id: str, render_mode: str | None = None) -> UserEnvelope:
+        headers = {}
+        if render_mode:
+            headers["X-Dm-Bb-Render-Mode"] = render_mode
+        return await self._post(Route("/v1/forum/comments/{id}/likes", id=id), headers=headers, model=UserEnvelope)
+
+    @invalidates("forum_comments")
+    async def unlike_comment(self, id: str, render_mode: str | None = None) -> dict | None:
+        headers = {}
+        if render_mode:
+            headers["X-Dm-Bb-Render-Mode"] = render_mode
+        return await self._delete(Route("/v1/forum/comments/{id}/likes", id=id), headers=headers)
@@ -1,31 +1,40 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+
+from src.api.cache import cached, invalidates
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.forum.forum_model import (
     ForumEnvelope,
     ForumListEnvelope,
+    Topic,
     TopicEnvelope,
     TopicListEnvelope,
     UserListEnvelope,
 )
+from src.api.pagination import aiter_resources, iter_resources
 
 
 class ForumApi(BaseController):
+    @cached("fora", ttl=300)
     def get_fora(self) -> ForumListEnvelope:
-        data = self._get("/v1/fora")
-        return ForumListEnvelope.model_validate(data)
+        return self._get("/v1/fora", model=ForumListEnvelope, conditional=True)
 
+    @cached("fora", ttl=300)
     def get_forum(self, id: str) -> ForumEnvelope:
-        data = self._get(f"/v1/fora/{id}")
-        return ForumEnvelope.model_validate(data)
+        return self._get(Route("/v1/fora/{id}", id=id), model=ForumEnvelope)
 
+    @invalidates("fora", "topics")
     def read_forum_comments(self, id: str) -> None:
-        self._delete(f"/v1/fora/{id}/comments/unread")
+        self._delete(Route("/v1/fora/{id}/comments/unread", id=id))
 
+    @cached("fora", ttl=300)
     def get_moderators(self, id: str) -> UserListEnvelope:
-        data = self._get(f"/v1/fora/{id}/moderators")
-        return UserListEnvelope.model_validate(data)
+        return self._get(Route("/v1/fora/{id}/moderators", id=id), model=UserListEnvelope)
 
+    @cached("topics")
     def get_topics(
         self,
         id: str,
@@ -40,9 +49,57 @@ class ForumApi(BaseController):
             "number": number,
             "size": size,
         }
-        data = self._get(f"/v1/fora/{id}/topics", params=params)
-        return TopicListEnvelope.model_validate(data)
+        return self._get(Route("/v1/fora/{id}/topics", id=id), params=params, model=TopicListEnvelope)
+
+    def iter_topics(
+        self, id: str, attached: bool | None = None, size: int | None = None, window: int | None = None
+    ) -> Iterator[Topic]:
+        return iter_resources(partial(self.get_topics, id, attached=attached), size=size, window=window)
 
+    @invalidates("topics")
     def post_topic(self, id: str, payload: dict) -> TopicEnvelope:
-        data = self._post(f"/v1/fora/{id}/topics", data=payload)
-        return TopicEnvelope.model_validate(data)
+        return self._post(Route("/v1/fora/{id}/topics", id=id), data=payload, model=TopicEnvelope)
+
+
+class AsyncForumApi(AsyncBaseController):
+    @cached("fora", ttl=300)
+    async def get_fora(self) -> ForumListEnvelope:
+        return await self._get("/v1/fora", model=ForumListEnvelope, conditional=True)
+
+    @cached("fora", ttl=300)
+    async def get_forum(self, id: str) -> ForumEnvelope:
+        return await self._get(Route("/v1/fora/{id}", id=id), model=ForumEnvelope)
+
+    @invalidates("fora", "topics")
+    async def read_forum_comments(self, id: str) -> None:
+        await self._delete(Route("/v1/fora/{id}/comments/unread", id=id))
+
+    @cached("fora", ttl=300)
+    async def get_moderators(self, id: str) -> UserListEnvelope:
+        return await self._get(Route("/v1/fora/{id}/moderators", id=id), model=UserListEnvelope)
+
+    @cached("topics")
+    async def get_topics(
+        self,
+        id: str,
+        attached: bool | None = None,
+        skip: int | None = None,
+        number: int | None = None,
+        size: int | None = None,
+    ) -> TopicListEnvelope:
+        params = {
+            "attached": attached,
+            "skip": skip,
+            "number": number,
+            "size": size,
+        }
+        return await self._get(Route("/v1/fora/{id}/topics", id=id), params=params, model=TopicListEnvelope)
+
+    def iter_topics(
+        self, id: str, attached: bool | None = None, size: int | None = None, window: int | None = None
+    ) -> AsyncIterator[Topic]:
+        return aiter_resources(partial(self.get_topics, id, attached=attached), size=size, window=window)
+
+    @invalidates("topics")
+    async def post_topic(self, id: str, payload: dict) -> TopicEnvelope:
+        return await self._post(Route("/v1/fora/{id}/topics", id=id), data=payload, model=TopicEnvelope)
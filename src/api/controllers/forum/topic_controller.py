@@ -1,28 +1,37 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
-from src.api.models.forum.topic_model import CommentEnvelope, CommentListEnvelope, TopicEnvelope, UserEnvelope
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+
+from src.api.cache import cached, invalidates
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
+from src.api.models.forum.topic_model import Comment, CommentEnvelope, CommentListEnvelope, TopicEnvelope, UserEnvelope
+from src.api.pagination import aiter_resources, iter_resources
 
 
 class TopicController(BaseController):
+    @cached("topics")
     def get_topic(self, id: str) -> TopicEnvelope:
-        data = self._get(f"/v1/topics/{id}")
-        return TopicEnvelope.model_validate(data)
+        return self._get(Route("/v1/topics/{id}", id=id), model=TopicEnvelope)
 
+    @invalidates("topics")
     def put_topic(self, id: str, payload: dict) -> TopicEnvelope:
-        data = self._patch(f"/v1/topics/{id}", data=payload)
-        return TopicEnvelope.model_validate(data)
+        return self._patch(Route("/v1/topics/{id}", id=id), data=payload, model=TopicEnvelope)
 
+    @invalidates("topics", "forum_comments")
     def delete_topic(self, id: str) -> dict | None:
-        return self._delete(f"/v1/topics/{id}")
+        return self._delete(Route("/v1/topics/{id}", id=id))
 
+    @invalidates("topics")
     def post_topic_like(self, id: str) -> UserEnvelope:
-        data = self._post(f"/v1/topics/{id}/likes")
-        return UserEnvelope.model_validate(data)
+        return self._post(Route("/v1/topics/{id}/likes", id=id), model=UserEnvelope)
 
+    @invalidates("topics")
     def delete_topic_like(self, id: str) -> dict | None:
-        return self._delete(f"/v1/topics/{id}/likes")
+        return self._delete(Route("/v1/topics/{id}/likes", id=id))
 
+    @cached("forum_comments")
     def get_forum_comments(
         self, id: str, skip: int | None = None, number: int | None = None, size: int | None = None
     ) -> CommentListEnvelope:
@@ -33,12 +42,63 @@ class TopicController(BaseController):
             params["number"] = number
         if size is not None:
             params["size"] = size
-        data = self._get(f"/v1/topics/{id}/comments", params=params)
-        return CommentListEnvelope.model_validate(data)
+        return self._get(Route("/v1/topics/{id}/comments", id=id), params=params, model=CommentListEnvelope)
+
+    def iter_forum_comments(self, id: str, size: int | None = None, window: int | None = None) -> Iterator[Comment]:
+        return iter_resources(partial(self.get_forum_comments, id), size=size, window=window)
 
+    @invalidates("forum_comments", "topics")
     def post_forum_comment(self, id: str, payload: dict) -> CommentEnvelope:
-        data = self._post(f"/v1/topics/{id}/comments", data=payload)
-        return CommentEnvelope.model_validate(data)
+        return self._post(Route("/v1/topics/{id}/comments", id=id), data=payload, model=CommentEnvelope)
 
+    @invalidates("topics")
     def read_topic_comments(self, id: str) -> dict | None:
-        return self._delete(f"/v1/topics/{id}/comments/unread")
+        return self._delete(Route("/v1/topics/{id}/comments/unread", id=id))
+
+
+class AsyncTopicController(AsyncBaseController):
+    @cached("topics")
+    async def get_topic(self, id: str) -> TopicEnvelope:
+        return await self._get(Route("/v1/topics/{id}", id=id), model=TopicEnvelope)
+
+    @invalidates("topics")
+    async def put_topic(self, id: str, payload: dict) -> TopicEnvelope:
+        return await self._patch(Route("/v1/topics/{id}", id=id), data=payload, model=TopicEnvelope)
+
+    @invalidates("topics", "forum_comments")
+    async def delete_topic(self, id: str) -> dict | None:
+        return await self._delete(Route("/v1/topics/{id}", id=id))
+
+    @invalidates("topics")
+    async def post_topic_like(self, id: str) -> UserEnvelope:
+        return await self._post(Route("/v1/topics/{id}/likes", id=id), model=UserEnvelope)
+
+    @invalidates("topics")
+    async def delete_topic_like(self, id: str) -> dict | None:
+        return await self._delete(Route("/v1/topics/{id}/likes", id=id))
+
+    @cached("forum_comments")
+    async def get_forum_comments(
+        self, id: str, skip: int | None = None, number: int | None = None, size: int | None = None
+    ) -> CommentListEnvelope:
+        params = {}
+        if skip is not None:
+            params["skip"] = skip
+        if number is not None:
+            params["number"] = number
+        if size is not None:
+            params["size"] = size
+        return await self._get(Route("/v1/topics/{id}/comments", id=id), params=params, model=CommentListEnvelope)
+
+    def iter_forum_comments(
+        self, id: str, size: int | None = None, window: int | None = None
+    ) -> AsyncIterator[Comment]:
+        return aiter_resources(partial(self.get_forum_comments, id), size=size, window=window)
+
+    @invalidates("forum_comments", "topics")
+    async def post_forum_comment(self, id: str, payload: dict) -> CommentEnvelope:
+        return await self._post(Route("/v1/topics/{id}/comments", id=id), data=payload, model=CommentEnvelope)
+
+    @invalidates("topics")
+    async def read_topic_comments(self, id: str) -> dict | None:
+        return await self._delete(Route("/v1/topics/{id}/comments/unread", id=id))
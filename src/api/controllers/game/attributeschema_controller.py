@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from src.api.cache import cached, invalidates
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.game.attributeschema_model import (
     AttributeSchemaEnvelope,
     AttributeSchemaListEnvelope,
@@ -8,21 +10,44 @@ from src.api.models.game.attributeschema_model import (
 
 
 class AttributeSchemaController(BaseController):
+    @cached("schemata")
     def get_schemas(self) -> AttributeSchemaListEnvelope:
-        data = self._get("/v1/schemata")
-        return AttributeSchemaListEnvelope.model_validate(data)
+        return self._get("/v1/schemata", model=AttributeSchemaListEnvelope, conditional=True)
 
+    @invalidates("schemata")
     def post_schema(self, payload: dict) -> AttributeSchemaEnvelope:
-        data = self._post("/v1/schemata", data=payload)
-        return AttributeSchemaEnvelope.model_validate(data)
+        return self._post("/v1/schemata", data=payload, model=AttributeSchemaEnvelope)
 
+    @cached("schemata")
     def get_schema(self, id: str) -> AttributeSchemaEnvelope:
-        data = self._get(f"/v1/schemata/{id}")
-        return AttributeSchemaEnvelope.model_validate(data)
+        return self._get(Route("/v1/schemata/{id}", id=id), model=AttributeSchemaEnvelope)
 
+    @invalidates("schemata")
     def put_schema(self, id: str, payload: dict) -> AttributeSchemaEnvelope:
-        data = self._patch(f"/v1/schemata/{id}", data=payload)
-        return AttributeSchemaEnvelope.model_validate(data)
+        return self._patch(Route("/v1/schemata/{id}", id=id), data=payload, model=AttributeSchemaEnvelope)
 
+    @invalidates("schemata")
     def delete_schema(self, id: str) -> dict | None:
-        return self._delete(f"/v1/schemata/{id}")
+        return self._delete(Route("/v1/schemata/{id}", id=id))
+
+
+class AsyncAttributeSchemaController(AsyncBaseController):
+    @cached("schemata")
+    async def get_schemas(self) -> AttributeSchemaListEnvelope:
+        return await self._get("/v1/schemata", model=AttributeSchemaListEnvelope, conditional=True)
+
+    @invalidates("schemata")
+    async def post_schema(self, payload: dict) -> AttributeSchemaEnvelope:
+        return await self._post("/v1/schemata", data=payload, model=AttributeSchemaEnvelope)
+
+    @cached("schemata")
+    async def get_schema(self, id: str) -> AttributeSchemaEnvelope:
+        return await self._get(Route("/v1/schemata/{id}", id=id), model=AttributeSchemaEnvelope)
+
+    @invalidates("schemata")
+    async def put_schema(self, id: str, payload: dict) -> AttributeSchemaEnvelope:
+        return await self._patch(Route("/v1/schemata/{id}", id=id), data=payload, model=AttributeSchemaEnvelope)
+
+    @invalidates("schemata")
+    async def delete_schema(self, id: str) -> dict | None:
+        return await self._delete(Route("/v1/schemata/{id}", id=id))
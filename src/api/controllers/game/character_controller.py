@@ -1,28 +1,58 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from src.api.cache import cached, invalidates
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.game.character_model import CharacterEnvelope, CharacterListEnvelope
 
 
 class CharacterApi(BaseController):
+    @cached("characters")
     def get_game_characters(self, id: str) -> CharacterListEnvelope:
-        data = self._get(f"/v1/games/{id}/characters")
-        return CharacterListEnvelope.model_validate(data)
+        return self._get(Route("/v1/games/{id}/characters", id=id), model=CharacterListEnvelope)
 
+    @invalidates("characters")
     def post_character(self, id: str, payload: dict) -> CharacterEnvelope:
-        data = self._post(f"/v1/games/{id}/characters", data=payload)
-        return CharacterEnvelope.model_validate(data)
+        return self._post(Route("/v1/games/{id}/characters", id=id), data=payload, model=CharacterEnvelope)
 
+    @invalidates("characters")
     def read_game_characters(self, id: str) -> None:
-        self._delete(f"/v1/game/{id}/characters/unread")
+        self._delete(Route("/v1/game/{id}/characters/unread", id=id))
 
+    @cached("characters")
     def get_character(self, id: str) -> CharacterEnvelope:
-        data = self._get(f"/v1/characters/{id}")
-        return CharacterEnvelope.model_validate(data)
+        return self._get(Route("/v1/characters/{id}", id=id), model=CharacterEnvelope)
 
+    @invalidates("characters")
     def put_character(self, id: str, payload: dict) -> CharacterEnvelope:
-        data = self._patch(f"/v1/characters/{id}", data=payload)
-        return CharacterEnvelope.model_validate(data)
+        return self._patch(Route("/v1/characters/{id}", id=id), data=payload, model=CharacterEnvelope)
 
+    @invalidates("characters")
     def delete_character(self, id: str) -> None:
-        self._delete(f"/v1/characters/{id}")
+        self._delete(Route("/v1/characters/{id}", id=id))
+
+
+class AsyncCharacterApi(AsyncBaseController):
+    @cached("characters")
+    async def get_game_characters(self, id: str) -> CharacterListEnvelope:
+        return await self._get(Route("/v1/games/{id}/characters", id=id), model=CharacterListEnvelope)
+
+    @invalidates("characters")
+    async def post_character(self, id: str, payload: dict) -> CharacterEnvelope:
+        return await self._post(Route("/v1/games/{id}/characters", id=id), data=payload, model=CharacterEnvelope)
+
+    @invalidates("characters")
+    async def read_game_characters(self, id: str) -> None:
+        await self._delete(Route("/v1/game/{id}/characters/unread", id=id))
+
+    @cached("characters")
+    async def get_character(self, id: str) -> CharacterEnvelope:
+        return await self._get(Route("/v1/characters/{id}", id=id), model=CharacterEnvelope)
+
+    @invalidates("characters")
+    async def put_character(self, id: str, payload: dict) -> CharacterEnvelope:
+        return await self._patch(Route("/v1/characters/{id}", id=id), data=payload, model=CharacterEnvelope)
+
+    @invalidates("characters")
+    async def delete_character(self, id: str) -> None:
+        await self._delete(Route("/v1/characters/{id}", id=id))
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from src.api.cache import cached, invalidates
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.game.comment_model import (
     CommentEnvelope,
     CommentListEnvelope,
@@ -9,6 +11,7 @@ from src.api.models.game.comment_model import (
 
 
 class CommentApi(BaseController):
+    @cached("game_comments")
     def get_game_comments(
         self,
         game_id: str,
@@ -24,51 +27,134 @@ class CommentApi(BaseController):
             "number": number,
             "size": size,
         }
-        data = self._get(f"/v1/games/{game_id}/comments", params=params)
-        return CommentListEnvelope.model_validate(data)
+        return self._get(
+            Route("/v1/games/{game_id}/comments", game_id=game_id), params=params, model=CommentListEnvelope
+        )
 
+    @invalidates("game_comments")
     def post_game_comment(self, game_id: str, payload: dict) -> CommentEnvelope:
         """
         Post a new game comment.
         """
-        data = self._post(f"/v1/games/{game_id}/comments", data=payload)
-        return CommentEnvelope.model_validate(data)
+        return self._post(Route("/v1/games/{game_id}/comments", game_id=game_id), data=payload, model=CommentEnvelope)
 
+    @invalidates("game_comments")
     def read_game_comments(self, game_id: str) -> None:
         """
         Mark all game comments as read.
         """
-        self._delete(f"/v1/games/{game_id}/comments/unread")
+        self._delete(Route("/v1/games/{game_id}/comments/unread", game_id=game_id))
 
+    @cached("game_comments")
     def get_game_comment(self, comment_id: str) -> CommentEnvelope:
         """
         Get a specific game comment.
         """
-        data = self._get(f"/v1/games/comments/{comment_id}")
-        return CommentEnvelope.model_validate(data)
+        return self._get(Route("/v1/games/comments/{comment_id}", comment_id=comment_id), model=CommentEnvelope)
 
+    @invalidates("game_comments")
     def update_game_comment(self, comment_id: str, payload: dict) -> CommentEnvelope:
         """
         Update a game comment.
         """
-        data = self._patch(f"/v1/games/comments/{comment_id}", data=payload)
-        return CommentEnvelope.model_validate(data)
+        return self._patch(
+            Route("/v1/games/comments/{comment_id}", comment_id=comment_id), data=payload, model=CommentEnvelope
+        )
 
+    @invalidates("game_comments")
     def delete_game_comment(self, comment_id: str) -> None:
         """
         Delete a game comment.
         """
-        self._delete(f"/v1/games/comments/{comment_id}")
+        self._delete(Route("/v1/games/comments/{comment_id}", comment_id=comment_id))
 
+    @invalidates("game_comments")
     def post_game_comment_like(self, comment_id: str) -> UserEnvelope:
         """
         Post a new like for a comment.
         """
-        data = self._post(f"/v1/games/comments/{comment_id}/likes")
-        return UserEnvelope.model_validate(data)
+        return self._post(Route("/v1/games/comments/{comment_id}/likes", comment_id=comment_id), model=UserEnvelope)
 
+    @invalidates("game_comments")
     def delete_game_comment_like(self, comment_id: str) -> None:
         """
         Delete a like from a comment.
         """
-        self._delete(f"/v1/games/comments/{comment_id}/likes")
+        self._delete(Route("/v1/games/comments/{comment_id}/likes", comment_id=comment_id))
+
+
+class AsyncCommentApi(AsyncBaseController):
+    @cached("game_comments")
+    async def get_game_comments(
+        self,
+        game_id: str,
+        skip: int | None = None,
+        number: int | None = None,
+        size: int | None = None,
+    ) -> CommentListEnvelope:
+        """
+        Get list of comments for a game.
+        """
+        params = {
+            "skip": skip,
+            "number": number,
+            "size": size,
+        }
+        return await self._get(
+            Route("/v1/games/{game_id}/comments", game_id=game_id), params=params, model=CommentListEnvelope
+        )
+
+    @invalidates("game_comments")
+    async def post_game_comment(self, game_id: str, payload: dict) -> CommentEnvelope:
+        """
+        Post a new game comment.
+        """
+        return await self._post(
+            Route("/v1/games/{game_id}/comments", game_id=game_id), data=payload, model=CommentEnvelope
+        )
+
+    @invalidates("game_comments")
+    async def read_game_comments(self, game_id: str) -> None:
+        """
+        Mark all game comments as read.
+        """
+        await self._delete(Route("/v1/games/{game_id}/comments/unread", game_id=game_id))
+
+    @cached("game_comments")
+    async def get_game_comment(self, comment_id: str) -> CommentEnvelope:
+        """
+        Get a specific game comment.
+        """
+        return await self._get(Route("/v1/games/comments/{comment_id}", comment_id=comment_id), model=CommentEnvelope)
+
+    @invalidates("game_comments")
+    async def update_game_comment(self, comment_id: str, payload: dict) -> CommentEnvelope:
+        """
+        Update a game comment.
+        """
+        return await self._patch(
+            Route("/v1/games/comments/{comment_id}", comment_id=comment_id), data=payload, model=CommentEnvelope
+        )
+
+    @invalidates("game_comments")
+    async def delete_game_comment(self, comment_id: str) -> None:
+        """
+        Delete a game comment.
+        """
+        await self._delete(Route("/v1/games/comments/{comment_id}", comment_id=comment_id))
+
+    @invalidates("game_comments")
+    async def post_game_comment_like(self, comment_id: str) -> UserEnvelope:
+        """
+        Post a new like for a comment.
+        """
+        return await self._post(
+            Route("/v1/games/comments/{comment_id}/likes", comment_id=comment_id), model=UserEnvelope
+        )
+
+    @invalidates("game_comments")
+    async def delete_game_comment_like(self, comment_id: str) -> None:
+        """
+        Delete a like from a comment.
+        """
+        await self._delete(Route("/v1/games/comments/{comment_id}/likes", comment_id=comment_id))
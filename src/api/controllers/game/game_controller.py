@@ -1,16 +1,24 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+
+from src.api.cache import cached, invalidates
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.game.game_model import (
+    Game,
     GameEnvelope,
     GameListEnvelope,
     TagListEnvelope,
     UserEnvelope,
     UserListEnvelope,
 )
+from src.api.pagination import aiter_resources, iter_resources
 
 
 class GameApi(BaseController):
+    @cached("games")
     def get_games(
         self,
         statuses: list[str] | None = None,
@@ -26,58 +34,154 @@ class GameApi(BaseController):
             "number": number,
             "size": size,
         }
-        data = self._get("/v1/games", params=params)
-        return GameListEnvelope.model_validate(data)
+        return self._get("/v1/games", params=params, model=GameListEnvelope)
+
+    def iter_games(
+        self,
+        statuses: list[str] | None = None,
+        tag: list[str] | None = None,
+        size: int | None = None,
+        window: int | None = None,
+    ) -> Iterator[Game]:
+        return iter_resources(partial(self.get_games, statuses=statuses, tag=tag), size=size, window=window)
 
+    @invalidates("games")
     def post_game(self, payload: dict) -> GameEnvelope:
-        data = self._post("/v1/games", data=payload)
-        return GameEnvelope.model_validate(data)
+        return self._post("/v1/games", data=payload, model=GameEnvelope)
 
+    @cached("games")
     def get_own_games(self) -> GameListEnvelope:
-        data = self._get("/v1/games/own")
-        return GameListEnvelope.model_validate(data)
+        return self._get("/v1/games/own", model=GameListEnvelope)
 
+    @cached("games")
     def get_popular_games(self) -> GameListEnvelope:
-        data = self._get("/v1/games/popular")
-        return GameListEnvelope.model_validate(data)
+        return self._get("/v1/games/popular", model=GameListEnvelope)
 
+    @cached("game_tags", ttl=300)
     def get_tags(self) -> TagListEnvelope:
-        data = self._get("/v1/games/tags")
-        return TagListEnvelope.model_validate(data)
+        return self._get("/v1/games/tags", model=TagListEnvelope, conditional=True)
 
+    @cached("games")
     def get_game(self, id: str) -> GameEnvelope:
-        data = self._get(f"/v1/games/{id}")
-        return GameEnvelope.model_validate(data)
+        return self._get(Route("/v1/games/{id}", id=id), model=GameEnvelope)
 
+    @invalidates("games", "rooms", "posts", "characters", "game_comments")
     def delete_game(self, id: str) -> None:
-        self._delete(f"/v1/games/{id}")
+        self._delete(Route("/v1/games/{id}", id=id))
 
+    @cached("games")
     def get_game_details(self, id: str) -> GameEnvelope:
-        data = self._get(f"/v1/games/{id}/details")
-        return GameEnvelope.model_validate(data)
+        return self._get(Route("/v1/games/{id}/details", id=id), model=GameEnvelope)
 
+    @invalidates("games")
     def put_game(self, id: str, payload: dict) -> GameEnvelope:
-        data = self._patch(f"/v1/games/{id}/details", data=payload)
-        return GameEnvelope.model_validate(data)
+        return self._patch(Route("/v1/games/{id}/details", id=id), data=payload, model=GameEnvelope)
 
+    @cached("game_readers")
     def get_readers(self, id: str) -> UserListEnvelope:
-        data = self._get(f"/v1/games/{id}/readers")
-        return UserListEnvelope.model_validate(data)
+        return self._get(Route("/v1/games/{id}/readers", id=id), model=UserListEnvelope)
 
+    @invalidates("game_readers", "games")
     def post_reader(self, id: str) -> UserEnvelope:
-        data = self._post(f"/v1/games/{id}/readers")
-        return UserEnvelope.model_validate(data)
+        return self._post(Route("/v1/games/{id}/readers", id=id), model=UserEnvelope)
 
+    @invalidates("game_readers", "games")
     def delete_reader(self, id: str) -> None:
-        self._delete(f"/v1/games/{id}/readers")
+        self._delete(Route("/v1/games/{id}/readers", id=id))
 
+    @cached("game_blacklist")
     def get_blacklist(self, id: str) -> UserListEnvelope:
-        data = self._get(f"/v1/games/{id}/blacklist/users")
-        return UserListEnvelope.model_validate(data)
+        return self._get(Route("/v1/games/{id}/blacklist/users", id=id), model=UserListEnvelope)
 
+    @invalidates("game_blacklist")
     def post_blacklist(self, id: str, payload: dict) -> UserEnvelope:
-        data = self._post(f"/v1/games/{id}/blacklist/users", data=payload)
-        return UserEnvelope.model_validate(data)
+        return self._post(Route("/v1/games/{id}/blacklist/users", id=id), data=payload, model=UserEnvelope)
 
+    @invalidates("game_blacklist")
     def delete_blacklist(self, id: str, login: str) -> None:
-        self._delete(f"/v1/games/{id}/blacklist/users/{login}")
+        self._delete(Route("/v1/games/{id}/blacklist/users/{login}", id=id, login=login))
+
+
+class AsyncGameApi(AsyncBaseController):
+    @cached("games")
+    async def get_games(
+        self,
+        statuses: list[str] | None = None,
+        tag: list[str] | None = None,
+        skip: int | None = None,
+        number: int | None = None,
+        size: int | None = None,
+    ) -> GameListEnvelope:
+        params = {
+            "statuses": statuses,
+            "tag": tag,
+            "skip": skip,
+            "number": number,
+            "size": size,
+        }
+        return await self._get("/v1/games", params=params, model=GameListEnvelope)
+
+    def iter_games(
+        self,
+        statuses: list[str] | None = None,
+        tag: list[str] | None = None,
+        size: int | None = None,
+        window: int | None = None,
+    ) -> AsyncIterator[Game]:
+        return aiter_resources(partial(self.get_games, statuses=statuses, tag=tag), size=size, window=window)
+
+    @invalidates("games")
+    async def post_game(self, payload: dict) -> GameEnvelope:
+        return await self._post("/v1/games", data=payload, model=GameEnvelope)
+
+    @cached("games")
+    async def get_own_games(self) -> GameListEnvelope:
+        return await self._get("/v1/games/own", model=GameListEnvelope)
+
+    @cached("games")
+    async def get_popular_games(self) -> GameListEnvelope:
+        return await self._get("/v1/games/popular", model=GameListEnvelope)
+
+    @cached("game_tags", ttl=300)
+    async def get_tags(self) -> TagListEnvelope:
+        return await self._get("/v1/games/tags", model=TagListEnvelope, conditional=True)
+
+    @cached("games")
+    async def get_game(self, id: str) -> GameEnvelope:
+        return await self._get(Route("/v1/games/{id}", id=id), model=GameEnvelope)
+
+    @invalidates("games", "rooms", "posts", "characters", "game_comments")
+    async def delete_game(self, id: str) -> None:
+        await self._delete(Route("/v1/games/{id}", id=id))
+
+    @cached("games")
+    async def get_game_details(self, id: str) -> GameEnvelope:
+        return await self._get(Route("/v1/games/{id}/details", id=id), model=GameEnvelope)
+
+    @invalidates("games")
+    async def put_game(self, id: str, payload: dict) -> GameEnvelope:
+        return await self._patch(Route("/v1/games/{id}/details", id=id), data=payload, model=GameEnvelope)
+
+    @cached("game_readers")
+    async def get_readers(self, id: str) -> UserListEnvelope:
+        return await self._get(Route("/v1/games/{id}/readers", id=id), model=UserListEnvelope)
+
+    @invalidates("game_readers", "games")
+    async def post_reader(self, id: str) -> UserEnvelope:
+        return await self._post(Route("/v1/games/{id}/readers", id=id), model=UserEnvelope)
+
+    @invalidates("game_readers", "games")
+    async def delete_reader(self, id: str) -> None:
+        await self._delete(Route("/v1/games/{id}/readers", id=id))
+
+    @cached("game_blacklist")
+    async def get_blacklist(self, id: str) -> UserListEnvelope:
+        return await self._get(Route("/v1/games/{id}/blacklist/users", id=id), model=UserListEnvelope)
+
+    @invalidates("game_blacklist")
+    async def post_blacklist(self, id: str, payload: dict) -> UserEnvelope:
+        return await self._post(Route("/v1/games/{id}/blacklist/users", id=id), data=payload, model=UserEnvelope)
+
+    @invalidates("game_blacklist")
+    async def delete_blacklist(self, id: str, login: str) -> None:
+        await self._delete(Route("/v1/games/{id}/blacklist/users/{login}", id=id, login=login))
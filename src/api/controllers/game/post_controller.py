@@ -1,13 +1,21 @@
-from src.api.controllers.base_controller import BaseController
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+
+from src.api.cache import cached, invalidates
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.game.post_model import (
+    Post,
     PostEnvelope,
     PostListEnvelope,
     VoteEnvelope,
     VoteListEnvelope,
 )
+from src.api.pagination import aiter_resources, iter_resources
 
 
 class PostApi(BaseController):
+    @cached("posts")
     def get_posts(
         self,
         room_id: str,
@@ -20,31 +28,85 @@ class PostApi(BaseController):
             "number": number,
             "size": size,
         }
-        data = self._get(f"/v1/rooms/{room_id}/posts", params=params)
-        return PostListEnvelope.model_validate(data)
+        return self._get(Route("/v1/rooms/{room_id}/posts", room_id=room_id), params=params, model=PostListEnvelope)
+
+    def iter_posts(self, room_id: str, size: int | None = None, window: int | None = None) -> Iterator[Post]:
+        return iter_resources(partial(self.get_posts, room_id), size=size, window=window)
 
+    @invalidates("posts")
     def post_post(self, room_id: str, payload: dict) -> PostEnvelope:
-        data = self._post(f"/v1/rooms/{room_id}/posts", data=payload)
-        return PostEnvelope.model_validate(data)
+        return self._post(Route("/v1/rooms/{room_id}/posts", room_id=room_id), data=payload, model=PostEnvelope)
 
+    @invalidates("posts")
     def mark_posts_as_read(self, room_id: str) -> None:
-        self._delete(f"/v1/rooms/{room_id}/posts/unread")
+        self._delete(Route("/v1/rooms/{room_id}/posts/unread", room_id=room_id))
 
+    @cached("posts")
     def get_post(self, post_id: str) -> PostEnvelope:
-        data = self._get(f"/v1/posts/{post_id}")
-        return PostEnvelope.model_validate(data)
+        return self._get(Route("/v1/posts/{post_id}", post_id=post_id), model=PostEnvelope)
 
+    @invalidates("posts")
     def put_post(self, post_id: str, payload: dict) -> PostEnvelope:
-        data = self._patch(f"/v1/posts/{post_id}", data=payload)
-        return PostEnvelope.model_validate(data)
+        return self._patch(Route("/v1/posts/{post_id}", post_id=post_id), data=payload, model=PostEnvelope)
 
+    @invalidates("posts", "post_votes")
     def delete_post(self, post_id: str) -> None:
-        self._delete(f"/v1/posts/{post_id}")
+        self._delete(Route("/v1/posts/{post_id}", post_id=post_id))
 
+    @cached("post_votes")
     def get_post_votes(self, post_id: str) -> VoteListEnvelope:
-        data = self._get(f"/v1/posts/{post_id}/votes")
-        return VoteListEnvelope.model_validate(data)
+        return self._get(Route("/v1/posts/{post_id}/votes", post_id=post_id), model=VoteListEnvelope)
 
+    @invalidates("post_votes", "posts")
     def post_vote(self, post_id: str, payload: dict) -> VoteEnvelope:
-        data = self._post(f"/v1/posts/{post_id}/votes", data=payload)
-        return VoteEnvelope.model_validate(data)
+        return self._post(Route("/v1/posts/{post_id}/votes", post_id=post_id), data=payload, model=VoteEnvelope)
+
+
+class AsyncPostApi(AsyncBaseController):
+    @cached("posts")
+    async def get_posts(
+        self,
+        room_id: str,
+        skip: int | None = None,
+        number: int | None = None,
+        size: int | None = None,
+    ) -> PostListEnvelope:
+        params = {
+            "skip": skip,
+            "number": number,
+            "size": size,
+        }
+        return await self._get(
+            Route("/v1/rooms/{room_id}/posts", room_id=room_id), params=params, model=PostListEnvelope
+        )
+
+    def iter_posts(self, room_id: str, size: int | None = None, window: int | None = None) -> AsyncIterator[Post]:
+        return aiter_resources(partial(self.get_posts, room_id), size=size, window=window)
+
+    @invalidates("posts")
+    async def post_post(self, room_id: str, payload: dict) -> PostEnvelope:
+        return await self._post(Route("/v1/rooms/{room_id}/posts", room_id=room_id), data=payload, model=PostEnvelope)
+
+    @invalidates("posts")
+    async def mark_posts_as_read(self, room_id: str) -> None:
+        await self._delete(Route("/v1/rooms/{room_id}/posts/unread", room_id=room_id))
+
+    @cached("posts")
+    async def get_post(self, post_id: str) -> PostEnvelope:
+        return await self._get(Route("/v1/posts/{post_id}", post_id=post_id), model=PostEnvelope)
+
+    @invalidates("posts")
+    async def put_post(self, post_id: str, payload: dict) -> PostEnvelope:
+        return await self._patch(Route("/v1/posts/{post_id}", post_id=post_id), data=payload, model=PostEnvelope)
+
+    @invalidates("posts", "post_votes")
+    async def delete_post(self, post_id: str) -> None:
+        await self._delete(Route("/v1/posts/{post_id}", post_id=post_id))
+
+    @cached("post_votes")
+    async def get_post_votes(self, post_id: str) -> VoteListEnvelope:
+        return await self._get(Route("/v1/posts/{post_id}/votes", post_id=post_id), model=VoteListEnvelope)
+
+    @invalidates("post_votes", "posts")
+    async def post_vote(self, post_id: str, payload: dict) -> VoteEnvelope:
+        return await self._post(Route("/v1/posts/{post_id}/votes", post_id=post_id), data=payload, model=VoteEnvelope)
@@ -1,43 +1,100 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from src.api.cache import cached, invalidates
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.game.room_model import PendingPostEnvelope, RoomClaimEnvelope, RoomEnvelope, RoomListEnvelope
 
 
 class RoomApi(BaseController):
+    @cached("rooms")
     def get_rooms(self, game_id: str) -> RoomListEnvelope:
-        data = self._get(f"/v1/games/{game_id}/rooms")
-        return RoomListEnvelope.model_validate(data)
+        return self._get(Route("/v1/games/{game_id}/rooms", game_id=game_id), model=RoomListEnvelope)
 
+    @invalidates("rooms")
     def post_room(self, game_id: str, payload: dict) -> RoomEnvelope:
-        data = self._post(f"/v1/games/{game_id}/rooms", data=payload)
-        return RoomEnvelope.model_validate(data)
+        return self._post(Route("/v1/games/{game_id}/rooms", game_id=game_id), data=payload, model=RoomEnvelope)
 
+    @cached("rooms")
     def get_room(self, room_id: str) -> RoomEnvelope:
-        data = self._get(f"/v1/rooms/{room_id}")
-        return RoomEnvelope.model_validate(data)
+        return self._get(Route("/v1/rooms/{room_id}", room_id=room_id), model=RoomEnvelope)
 
+    @invalidates("rooms")
     def put_room(self, room_id: str, payload: dict) -> RoomEnvelope:
-        data = self._patch(f"/v1/rooms/{room_id}", data=payload)
-        return RoomEnvelope.model_validate(data)
+        return self._patch(Route("/v1/rooms/{room_id}", room_id=room_id), data=payload, model=RoomEnvelope)
 
+    @invalidates("rooms", "posts")
     def delete_room(self, room_id: str) -> dict | None:
-        return self._delete(f"/v1/rooms/{room_id}")
+        return self._delete(Route("/v1/rooms/{room_id}", room_id=room_id))
 
+    @invalidates("rooms")
     def post_claim(self, room_id: str, payload: dict) -> RoomClaimEnvelope:
-        data = self._post(f"/v1/rooms/{room_id}/claims", data=payload)
-        return RoomClaimEnvelope.model_validate(data)
+        return self._post(Route("/v1/rooms/{room_id}/claims", room_id=room_id), data=payload, model=RoomClaimEnvelope)
 
+    @invalidates("rooms")
     def update_claim(self, claim_id: str, payload: dict) -> RoomClaimEnvelope:
-        data = self._patch(f"/v1/rooms/claims/{claim_id}", data=payload)
-        return RoomClaimEnvelope.model_validate(data)
+        return self._patch(
+            Route("/v1/rooms/claims/{claim_id}", claim_id=claim_id), data=payload, model=RoomClaimEnvelope
+        )
 
+    @invalidates("rooms")
     def delete_claim(self, claim_id: str) -> dict | None:
-        return self._delete(f"/v1/rooms/claims/{claim_id}")
+        return self._delete(Route("/v1/rooms/claims/{claim_id}", claim_id=claim_id))
 
+    @invalidates("rooms", "posts")
     def create_pending_post(self, room_id: str, payload: dict) -> PendingPostEnvelope:
-        data = self._post(f"/v1/rooms/{room_id}/pendings", data=payload)
-        return PendingPostEnvelope.model_validate(data)
+        return self._post(
+            Route("/v1/rooms/{room_id}/pendings", room_id=room_id), data=payload, model=PendingPostEnvelope
+        )
 
+    @invalidates("rooms", "posts")
     def delete_pending_post(self, pending_post_id: str) -> dict | None:
-        return self._delete(f"/v1/rooms/pendings/{pending_post_id}")
+        return self._delete(Route("/v1/rooms/pendings/{pending_post_id}", pending_post_id=pending_post_id))
+
+
+class AsyncRoomApi(AsyncBaseController):
+    @cached("rooms")
+    async def get_rooms(self, game_id: str) -> RoomListEnvelope:
+        return await self._get(Route("/v1/games/{game_id}/rooms", game_id=game_id), model=RoomListEnvelope)
+
+    @invalidates("rooms")
+    async def post_room(self, game_id: str, payload: dict) -> RoomEnvelope:
+        return await self._post(Route("/v1/games/{game_id}/rooms", game_id=game_id), data=payload, model=RoomEnvelope)
+
+    @cached("rooms")
+    async def get_room(self, room_id: str) -> RoomEnvelope:
+        return await self._get(Route("/v1/rooms/{room_id}", room_id=room_id), model=RoomEnvelope)
+
+    @invalidates("rooms")
+    async def put_room(self, room_id: str, payload: dict) -> RoomEnvelope:
+        return await self._patch(Route("/v1/rooms/{room_id}", room_id=room_id), data=payload, model=RoomEnvelope)
+
+    @invalidates("rooms", "posts")
+    async def delete_room(self, room_id: str) -> dict | None:
+        return await self._delete(Route("/v1/rooms/{room_id}", room_id=room_id))
+
+    @invalidates("rooms")
+    async def post_claim(self, room_id: str, payload: dict) -> RoomClaimEnvelope:
+        return await self._post(
+            Route("/v1/rooms/{room_id}/claims", room_id=room_id), data=payload, model=RoomClaimEnvelope
+        )
+
+    @invalidates("rooms")
+    async def update_claim(self, claim_id: str, payload: dict) -> RoomClaimEnvelope:
+        return await self._patch(
+            Route("/v1/rooms/claims/{claim_id}", claim_id=claim_id), data=payload, model=RoomClaimEnvelope
+        )
+
+    @invalidates("rooms")
+    async def delete_claim(self, claim_id: str) -> dict | None:
+        return await self._delete(Route("/v1/rooms/claims/{claim_id}", claim_id=claim_id))
+
+    @invalidates("rooms", "posts")
+    async def create_pending_post(self, room_id: str, payload: dict) -> PendingPostEnvelope:
+        return await self._post(
+            Route("/v1/rooms/{room_id}/pendings", room_id=room_id), data=payload, model=PendingPostEnvelope
+        )
+
+    @invalidates("rooms", "posts")
+    async def delete_pending_post(self, pending_post_id: str) -> dict | None:
+        return await self._delete(Route("/v1/rooms/pendings/{pending_post_id}", pending_post_id=pending_post_id))
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
-from src.api.models.messaging.chat_model import ChatMessageEnvelope, ChatMessageListEnvelope
+from collections.abc import AsyncIterator, Iterator
+
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
+from src.api.models.messaging.chat_model import ChatMessage, ChatMessageEnvelope, ChatMessageListEnvelope
+from src.api.pagination import aiter_resources, iter_resources
 
 
 class ChatApi(BaseController):
@@ -16,19 +20,55 @@ class ChatApi(BaseController):
             "number": number,
             "size": size,
         }
-        data = self._get("/v1/chat", params=params)
-        return ChatMessageListEnvelope.model_validate(data)
+        return self._get("/v1/chat", params=params, model=ChatMessageListEnvelope)
+
+    def iter_chat_messages(self, size: int | None = None, window: int | None = None) -> Iterator[ChatMessage]:
+        """
+        Iterate over all chat messages, prefetching pages concurrently.
+        """
+        return iter_resources(self.get_chat_messages, size=size, window=window)
 
     def post_chat_message(self, payload: dict) -> ChatMessageEnvelope:
         """
         Create new chat message.
         """
-        data = self._post("/v1/chat", data=payload)
-        return ChatMessageEnvelope.model_validate(data)
+        return self._post("/v1/chat", data=payload, model=ChatMessageEnvelope)
 
     def get_chat_message(self, id: str) -> ChatMessageEnvelope:
         """
         Get single chat message.
         """
-        data = self._get(f"/v1/chat/{id}")
-        return ChatMessageEnvelope.model_validate(data)
+        return self._get(Route("/v1/chat/{id}", id=id), model=ChatMessageEnvelope)
+
+
+class AsyncChatApi(AsyncBaseController):
+    async def get_chat_messages(
+        self, skip: int | None = None, number: int | None = None, size: int | None = None
+    ) -> ChatMessageListEnvelope:
+        """
+        Get chat messages.
+        """
+        params = {
+            "skip": skip,
+            "number": number,
+            "size": size,
+        }
+        return await self._get("/v1/chat", params=params, model=ChatMessageListEnvelope)
+
+    def iter_chat_messages(self, size: int | None = None, window: int | None = None) -> AsyncIterator[ChatMessage]:
+        """
+        Iterate over all chat messages, prefetching pages concurrently.
+        """
+        return aiter_resources(self.get_chat_messages, size=size, window=window)
+
+    async def post_chat_message(self, payload: dict) -> ChatMessageEnvelope:
+        """
+        Create new chat message.
+        """
+        return await self._post("/v1/chat", data=payload, model=ChatMessageEnvelope)
+
+    async def get_chat_message(self, id: str) -> ChatMessageEnvelope:
+        """
+        Get single chat message.
+        """
+        return await self._get(Route("/v1/chat/{id}", id=id), model=ChatMessageEnvelope)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from src.api.controllers.base_controller import BaseController
+from collections.abc import AsyncIterator, Iterator
+from functools import partial
+
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.base_controller import BaseController, Route
 from src.api.models.messaging.messaging_model import (
     ConversationEnvelope,
     ConversationListEnvelope,
+    Message,
     MessageEnvelope,
     MessageListEnvelope,
 )
+from src.api.pagination import aiter_resources, iter_resources
 
 
 class MessagingApi(BaseController):
@@ -21,16 +27,13 @@ class MessagingApi(BaseController):
         if size is not None:
             params["size"] = size
 
-        data = self._get("/v1/dialogues", params=params)
-        return ConversationListEnvelope.model_validate(data)
+        return self._get("/v1/dialogues", params=params, model=ConversationListEnvelope)
 
     def get_visavi_conversation(self, login: str) -> ConversationEnvelope:
-        data = self._get(f"/v1/dialogues/visavi/{login}")
-        return ConversationEnvelope.model_validate(data)
+        return self._get(Route("/v1/dialogues/visavi/{login}", login=login), model=ConversationEnvelope)
 
     def get_conversation(self, id: str) -> ConversationEnvelope:
-        data = self._get(f"/v1/dialogues/{id}")
-        return ConversationEnvelope.model_validate(data)
+        return self._get(Route("/v1/dialogues/{id}", id=id), model=ConversationEnvelope)
 
     def get_messages(
         self, id: str, skip: int | None = None, number: int | None = None, size: int | None = None
@@ -43,19 +46,68 @@ class MessagingApi(BaseController):
         if size is not None:
             params["size"] = size
 
-        data = self._get(f"/v1/dialogues/{id}/messages", params=params)
-        return MessageListEnvelope.model_validate(data)
+        return self._get(Route("/v1/dialogues/{id}/messages", id=id), params=params, model=MessageListEnvelope)
+
+    def iter_messages(self, id: str, size: int | None = None, window: int | None = None) -> Iterator[Message]:
+        return iter_resources(partial(self.get_messages, id), size=size, window=window)
 
     def post_message(self, id: str, message: dict) -> MessageListEnvelope:
-        data = self._post(f"/v1/dialogues/{id}/messages", data=message)
-        return MessageListEnvelope.model_validate(data)
+        return self._post(Route("/v1/dialogues/{id}/messages", id=id), data=message, model=MessageListEnvelope)
 
     def delete_unread_messages(self, id: str) -> dict | None:
-        return self._delete(f"/v1/dialogues/{id}/messages/unread")
+        return self._delete(Route("/v1/dialogues/{id}/messages/unread", id=id))
 
     def get_message(self, id: str) -> MessageEnvelope:
-        data = self._get(f"/v1/messages/{id}")
-        return MessageEnvelope.model_validate(data)
+        return self._get(Route("/v1/messages/{id}", id=id), model=MessageEnvelope)
 
     def delete_message(self, id: str) -> dict | None:
-        return self._delete(f"/v1/messages/{id}")
+        return self._delete(Route("/v1/messages/{id}", id=id))
+
+
+class AsyncMessagingApi(AsyncBaseController):
+    async def get_conversations(
+        self, skip: int | None = None, number: int | None = None, size: int | None = None
+    ) -> ConversationListEnvelope:
+        params = {}
+        if skip is not None:
+            params["skip"] = skip
+        if number is not None:
+            params["number"] = number
+        if size is not None:
+            params["size"] = size
+
+        return await self._get("/v1/dialogues", params=params, model=ConversationListEnvelope)
+
+    async def get_visavi_conversation(self, login: str) -> ConversationEnvelope:
+        return await self._get(Route("/v1/dialogues/visavi/{login}", login=login), model=ConversationEnvelope)
+
+    async def get_conversation(self, id: str) -> ConversationEnvelope:
+        return await self._get(Route("/v1/dialogues/{id}", id=id), model=ConversationEnvelope)
+
+    async def get_messages(
+        self, id: str, skip: int | None = None, number: int | None = None, size: int | None = None
+    ) -> MessageListEnvelope:
+        params = {}
+        if skip is not None:
+            params["skip"] = skip
+        if number is not None:
+            params["number"] = number
+        if size is not None:
+            params["size"] = size
+
+        return await self._get(Route("/v1/dialogues/{id}/messages", id=id), params=params, model=MessageListEnvelope)
+
+    def iter_messages(self, id: str, size: int | None = None, window: int | None = None) -> AsyncIterator[Message]:
+        return aiter_resources(partial(self.get_messages, id), size=size, window=window)
+
+    async def post_message(self, id: str, message: dict) -> MessageListEnvelope:
+        return await self._post(Route("/v1/dialogues/{id}/messages", id=id), data=message, model=MessageListEnvelope)
+
+    async def delete_unread_messages(self, id: str) -> dict | None:
+        return await self._delete(Route("/v1/dialogues/{id}/messages/unread", id=id))
+
+    async def get_message(self, id: str) -> MessageEnvelope:
+        return await self._get(Route("/v1/messages/{id}", id=id), model=MessageEnvelope)
+
+    async def delete_message(self, id: str) -> dict | None:
+        return await self._delete(Route("/v1/messages/{id}", id=id))
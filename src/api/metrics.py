@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+
+_PRECISION_BITS = 7
+_MICROS_PER_SECOND = 1_000_000
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of latencies in microseconds.
+
+    Values below ``2**precision_bits`` are counted exactly; larger values share buckets whose width
+    doubles every power of two, which keeps the relative error under ``2**-(precision_bits - 1)``.
+    """
+
+    def __init__(self, precision_bits: int = _PRECISION_BITS):
+        self.precision_bits = precision_bits
+        self._counts: dict[tuple[int, int], int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: int | None = None
+        self.max: int | None = None
+
+    def _bucket(self, value: int) -> tuple[int, int]:
+        shift = max(0, value.bit_length() - self.precision_bits)
+        return shift, value >> shift
+
+    def record(self, value: int, count: int = 1) -> None:
+        value = max(0, value)
+        bucket = self._bucket(value)
+        self._counts[bucket] = self._counts.get(bucket, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percent: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * percent / 100))
+        seen = 0
+        for shift, mantissa in sorted(self._counts):
+            seen += self._counts[shift, mantissa]
+            if seen >= rank:
+                highest_equivalent = ((mantissa + 1) << shift) - 1
+                return min(highest_equivalent, self.max or 0)
+        return self.max or 0
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for bucket, count in other._counts.items():
+            self._counts[bucket] = self._counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def summary(self) -> dict[str, float | int]:
+        def _ms(value: int | float | None) -> float:
+            return round((value or 0) / 1000, 3)
+
+        return {
+            "count": self.count,
+            "min_ms": _ms(self.min),
+            "mean_ms": _ms(self.total / self.count if self.count else 0),
+            "p50_ms": _ms(self.percentile(50)),
+            "p95_ms": _ms(self.percentile(95)),
+            "p99_ms": _ms(self.percentile(99)),
+            "max_ms": _ms(self.max),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "precision_bits": self.precision_bits,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": [[shift, mantissa, count] for (shift, mantissa), count in sorted(self._counts.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> LatencyHistogram:
+        histogram = cls(precision_bits=data.get("precision_bits", _PRECISION_BITS))
+        histogram._counts = {(shift, mantissa): count for shift, mantissa, count in data.get("buckets", [])}
+        histogram.count = data.get("count", 0)
+        histogram.total = data.get("total", 0)
+        histogram.min = data.get("min")
+        histogram.max = data.get("max")
+        return histogram
+
+
+class LatencyRecorder:
+    """Thread-safe registry of latency histograms keyed by ``"<METHOD> <route template>"``."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def record(self, method: str, route: str, seconds: float) -> None:
+        key = f"{method.upper()} {route}"
+        micros = int(seconds * _MICROS_PER_SECOND)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(micros)
+
+    def histogram(self, method: str, route: str) -> LatencyHistogram | None:
+        with self._lock:
+            return self._histograms.get(f"{method.upper()} {route}")
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {key: histogram.summary() for key, histogram in sorted(self._histograms.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def merge(self, other: LatencyRecorder) -> None:
+        with other._lock:
+            incoming = {key: LatencyHistogram.from_dict(h.to_dict()) for key, h in other._histograms.items()}
+        with self._lock:
+            for key, histogram in incoming.items():
+                existing = self._histograms.get(key)
+                if existing is None:
+                    self._histograms[key] = histogram
+                else:
+                    existing.merge(histogram)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            histograms = {key: histogram.to_dict() for key, histogram in sorted(self._histograms.items())}
+        return {"summary": self.snapshot(), "histograms": histograms}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> LatencyRecorder:
+        recorder = cls()
+        for key, histogram in data.get("histograms", {}).items():
+            recorder._histograms[key] = LatencyHistogram.from_dict(histogram)
+        return recorder
+
+    def dump_json(self, path: str | Path) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return target
+
+
+latency_metrics = LatencyRecorder()
+
+
+@dataclass
+class PoolStats:
+    """Checkout counters of one connection pool (``scheme://host:port``)."""
+
+    maxsize: int = 0
+    checkouts: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    in_use: int = 0
+    peak_in_use: int = 0
+    grown: int = 0
+
+    def merge(self, other: PoolStats) -> None:
+        self.maxsize = max(self.maxsize, other.maxsize)
+        self.checkouts += other.checkouts
+        self.new_connections += other.new_connections
+        self.reused_connections += other.reused_connections
+        self.waits += other.waits
+        self.wait_seconds += other.wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, other.max_wait_seconds)
+        self.in_use += other.in_use
+        self.peak_in_use = max(self.peak_in_use, other.peak_in_use)
+        self.grown += other.grown
+
+    def summary(self) -> dict[str, float | int]:
+        summary = asdict(self)
+        summary["wait_seconds"] = round(self.wait_seconds, 6)
+        summary["max_wait_seconds"] = round(self.max_wait_seconds, 6)
+        return summary
+
+
+class PoolRecorder:
+    """Thread-safe registry of ``PoolStats`` keyed by ``scheme://host:port``, fed by the instrumented pools."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._pools: dict[str, PoolStats] = {}
+
+    def _stats(self, pool: str) -> PoolStats:
+        stats = self._pools.get(pool)
+        if stats is None:
+            stats = self._pools[pool] = PoolStats()
+        return stats
+
+    def opened(self, pool: str, maxsize: int) -> None:
+        with self._lock:
+            stats = self._stats(pool)
+            stats.maxsize = max(stats.maxsize, maxsize)
+
+    def checkout(self, pool: str, *, reused: bool, waited: float | None, grown: bool, maxsize: int) -> None:
+        """Record one connection handed out; ``waited`` is the time blocked on a full pool, or None if it did not."""
+        with self._lock:
+            stats = self._stats(pool)
+            stats.checkouts += 1
+            if reused:
+                stats.reused_connections += 1
+            else:
+                stats.new_connections += 1
+            if waited is not None:
+                stats.waits += 1
+                stats.wait_seconds += waited
+                stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+            stats.grown += grown
+            stats.maxsize = max(stats.maxsize, maxsize)
+            stats.in_use += 1
+            stats.peak_in_use = max(stats.peak_in_use, stats.in_use)
+
+    def checkin(self, pool: str) -> None:
+        with self._lock:
+            stats = self._stats(pool)
+            stats.in_use = max(0, stats.in_use - 1)
+
+    def stats(self, pool: str) -> PoolStats | None:
+        with self._lock:
+            stats = self._pools.get(pool)
+            return None if stats is None else PoolStats(**asdict(stats))
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {pool: stats.summary() for pool, stats in sorted(self._pools.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pools.clear()
+
+    def merge(self, other: PoolRecorder) -> None:
+        with other._lock:
+            incoming = {pool: PoolStats(**asdict(stats)) for pool, stats in other._pools.items()}
+        with self._lock:
+            for pool, stats in incoming.items():
+                self._stats(pool).merge(stats)
+
+    def to_dict(self) -> dict:
+        return {"pools": self.snapshot()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PoolRecorder:
+        recorder = cls()
+        for pool, stats in data.get("pools", {}).items():
+            recorder._pools[pool] = PoolStats(**stats)
+        return recorder
+
+    def dump_json(self, path: str | Path) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return target
+
+
+pool_metrics = PoolRecorder()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Protocol
+
+from src.api.env import env_int
+
+
+class PagingInfo(Protocol):
+    pages: int | None
+    size: int | None
+
+
+class PageEnvelope(Protocol):
+    resources: list | None
+    paging: PagingInfo | None
+
+
+PageFetcher = Callable[..., PageEnvelope]
+AsyncPageFetcher = Callable[..., Awaitable[PageEnvelope]]
+
+
+def prefetch_window() -> int:
+    return env_int("DM_PAGINATION_WINDOW", 4)
+
+
+def _remaining_skips(first: PageEnvelope, size: int | None) -> tuple[int | None, list[int]]:
+    """
+    Work out the page size and the ``skip`` offsets still to fetch after the first page.
+
+    The API reports ``paging.pages`` for the size it actually served, which may be its default or a cap below the
+    requested ``size``. That ``paging.size`` is therefore preferred and pinned for every following request; the
+    caller's ``size`` (or the length of the first page) only applies when the server does not report one.
+    """
+    paging = first.paging
+    page_size = (paging.size if paging else None) or size or len(first.resources or [])
+    pages = paging.pages if paging else None
+    if not pages or pages <= 1 or not page_size:
+        return page_size, []
+    return page_size, [page * page_size for page in range(1, pages)]
+
+
+def iter_pages(fetch: PageFetcher, *, size: int | None = None, window: int | None = None) -> Iterator[Any]:
+    """
+    Yield every page of a skip/size paginated endpoint in order.
+
+    ``fetch`` is called as ``fetch(skip=..., size=...)``. After the first page, up to ``window`` following pages
+    (``DM_PAGINATION_WINDOW``, default 4) are requested concurrently; closing the generator early cancels pages
+    that have not started yet.
+    """
+    first = fetch(skip=0, size=size)
+    yield first
+    page_size, skips = _remaining_skips(first, size)
+    if not skips:
+        return
+
+    window = max(1, window or prefetch_window())
+    offsets = iter(skips)
+    pending: deque[Future] = deque()
+    executor = ThreadPoolExecutor(max_workers=min(window, len(skips)), thread_name_prefix="dm-pagination")
+    try:
+        for skip in offsets:
+            pending.append(executor.submit(fetch, skip=skip, size=page_size))
+            if len(pending) >= window:
+                break
+        while pending:
+            page = pending.popleft().result()
+            skip = next(offsets, None)
+            if skip is not None:
+                pending.append(executor.submit(fetch, skip=skip, size=page_size))
+            yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_resources(fetch: PageFetcher, *, size: int | None = None, window: int | None = None) -> Iterator[Any]:
+    """Stream the ``resources`` of every page, see ``iter_pages``."""
+    for page in iter_pages(fetch, size=size, window=window):
+        yield from page.resources or []
+
+
+async def aiter_pages(
+    fetch: AsyncPageFetcher, *, size: int | None = None, window: int | None = None
+) -> AsyncIterator[Any]:
+    """Asyncio counterpart of ``iter_pages``: following pages run as a bounded window of tasks."""
+    first = await fetch(skip=0, size=size)
+    yield first
+    page_size, skips = _remaining_skips(first, size)
+    if not skips:
+        return
+
+    window = max(1, window or prefetch_window())
+    offsets = iter(skips)
+    pending: deque[asyncio.Task] = deque()
+    try:
+        for skip in offsets:
+            pending.append(asyncio.ensure_future(fetch(skip=skip, size=page_size)))
+            if len(pending) >= window:
+                break
+        while pending:
+            page = await pending.popleft()
+            skip = next(offsets, None)
+            if skip is not None:
+                pending.append(asyncio.ensure_future(fetch(skip=skip, size=page_size)))
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def aiter_resources(
+    fetch: AsyncPageFetcher, *, size: int | None = None, window: int | None = None
+) -> AsyncIterator[Any]:
+    """Stream the ``resources`` of every page, see ``aiter_pages``."""
+    async for page in aiter_pages(fetch, size=size, window=window):
+        for resource in page.resources or []:
+            yield resource
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import HTTPError
+
+from src.api.env import env_flag, env_int
+from src.api.metrics import PoolRecorder, pool_metrics
+
+
+def pool_maxsize_cap() -> int:
+    return env_int("DM_HTTP_POOL_MAXSIZE_CAP", 64)
+
+
+def pool_adaptive() -> bool:
+    return env_flag("DM_HTTP_POOL_ADAPTIVE")
+
+
+class InstrumentedPoolMixin:
+    """
+    Reports every checkout of a urllib3 connection pool to ``pool_metrics``.
+
+    Each checkout is counted as a new or a reused connection. When the pool has no free slot, the time spent
+    blocked is recorded as a wait. With ``adaptive`` the pool adds a slot in that case, until it holds
+    ``maxsize_cap`` connections. It therefore grows to the concurrency callers actually reach and only waits
+    beyond the cap. Connections are still opened lazily, so growing a slot costs nothing until it is used.
+    """
+
+    recorder: ClassVar[PoolRecorder] = pool_metrics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.adaptive = pool_adaptive()
+        self.maxsize_cap = pool_maxsize_cap()
+        self.metrics_key = f"{self.scheme}://{self.host}:{self.port}"
+        self.recorder.opened(self.metrics_key, self.pool.maxsize)
+
+    def _grow(self) -> bool:
+        pool = self.pool
+        if pool is None:
+            return False
+        with pool.mutex:
+            if pool.maxsize >= self.maxsize_cap:
+                return False
+            pool.maxsize += 1
+        pool.put(None, block=False)
+        return True
+
+    def _get_conn(self, timeout: float | None = None) -> HTTPConnection:
+        pool = self.pool
+        exhausted = pool is not None and self.block and pool.empty()
+        grown = exhausted and self.adaptive and self._grow()
+        started = time.perf_counter()
+        conn = super()._get_conn(timeout)
+        waited = time.perf_counter() - started if exhausted and not grown else None
+        self.recorder.checkout(
+            self.metrics_key,
+            reused=conn.is_connected,
+            waited=waited,
+            grown=grown,
+            maxsize=pool.maxsize if pool is not None else 0,
+        )
+        return conn
+
+    def _put_conn(self, conn: HTTPConnection | None) -> None:
+        try:
+            super()._put_conn(conn)
+        finally:
+            self.recorder.checkin(self.metrics_key)
+
+
+class InstrumentedHTTPConnectionPool(InstrumentedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class InstrumentedHTTPSConnectionPool(InstrumentedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+POOL_CLASSES_BY_SCHEME = {"http": InstrumentedHTTPConnectionPool, "https": InstrumentedHTTPSConnectionPool}
+
+
+def instrument_pool_manager(manager: PoolManager) -> PoolManager:
+    """Make ``manager`` create instrumented pools; pools it already holds are left as they are."""
+    manager.pool_classes_by_scheme = POOL_CLASSES_BY_SCHEME
+    return manager
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose pool manager creates instrumented pools."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        instrument_pool_manager(self.poolmanager)
+
+
+def session_pool(session: requests.Session, url: str) -> HTTPConnectionPool:
+    """
+    Return the pool ``session`` would send a request for ``url`` through.
+
+    ``requests`` keys its pools by TLS settings too, and may take those from the environment.
+    """
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    request = session.prepare_request(requests.Request("GET", url))
+    return session.get_adapter(url).get_connection_with_tls_context(
+        request, settings["verify"], settings["proxies"], settings["cert"]
+    )
+
+
+def warm_pool(pool: HTTPConnectionPool, connections: int) -> int:
+    """
+    Open up to ``connections`` connections of ``pool`` in parallel and leave them idle in it.
+
+    Only free slots are used, so the call never blocks on a busy pool. Connections that fail to open are
+    dropped, and the next request opens them lazily as before. Returns the number of connections opened.
+    """
+    checked_out = []
+    while len(checked_out) < connections:
+        try:
+            conn = pool.pool.get(block=False)
+        except queue.Empty:
+            break
+        checked_out.append(conn or pool._new_conn())
+
+    def connect(conn: HTTPConnection) -> bool:
+        if conn.is_connected:
+            return False
+        try:
+            conn.connect()
+        except OSError, HTTPError:
+            conn.close()
+            return False
+        return True
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(checked_out))) as executor:
+            opened = sum(executor.map(connect, checked_out))
+    finally:
+        for conn in checked_out:
+            pool.pool.put(conn, block=False)
+    return opened
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+from src.api.env import env_float
+from src.api.file_lock import FileLock
+
+_STATE = struct.Struct("<dd")
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """``rate`` requests per second with bursts up to ``burst`` for routes starting with ``prefix`` ("" = all)."""
+
+    prefix: str
+    rate: float
+    burst: float
+
+
+def parse_rules(spec: str) -> list[RateLimitRule]:
+    """
+    Parse ``DM_RATE_LIMIT_RULES``: comma-separated ``prefix=rps[:burst]`` items, e.g. ``/v1/account=2,/v1/games=20:40``.
+    """
+    rules = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        invalid = ValueError(f"Invalid rate limit rule {item!r}; expected '/prefix=rps[:burst]'")
+        prefix, separator, limit = item.partition("=")
+        if not separator or not prefix.startswith("/"):
+            raise invalid
+        rps, _, burst = limit.partition(":")
+        try:
+            rate = float(rps)
+            capacity = float(burst) if burst else max(1.0, rate)
+        except ValueError:
+            raise invalid from None
+        if not rate > 0 or not capacity > 0:
+            raise invalid
+        rules.append(RateLimitRule(prefix=prefix.strip(), rate=rate, burst=capacity))
+    return rules
+
+
+class SharedTokenBucket:
+    """
+    Token bucket whose state lives in a locked file, so every process on the host draws from the same budget.
+
+    ``reserve`` always takes the token and returns how long the caller has to wait for it; the balance may go
+    negative, which queues later callers behind earlier ones instead of letting them race on retries.
+    """
+
+    def __init__(self, path: str | Path, rate: float, burst: float, clock: Callable[[], float] = time.time):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._clock = clock
+        self._lock = FileLock(path)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            now = self._clock()
+            state = self._lock.read()
+            if len(state) == _STATE.size:
+                balance, updated = _STATE.unpack(state)
+                balance = min(self.burst, balance + max(0.0, now - updated) * self.rate)
+            else:
+                balance = self.burst
+            balance -= tokens
+            self._lock.write(_STATE.pack(balance, now))
+        return -balance / self.rate if balance < 0 else 0.0
+
+
+class RateLimiter:
+    """
+    Client-side throttle applied by the controllers before each request.
+
+    Every request takes a token from the global bucket (``DM_RATE_LIMIT_RPS``) and from the bucket of the longest
+    matching route prefix in ``DM_RATE_LIMIT_RULES``. Buckets are files under ``DM_RATE_LIMIT_DIR`` keyed by base URL
+    and prefix, so all xdist workers hitting the same stand share them.
+    """
+
+    def __init__(self, rules: list[RateLimitRule], directory: str | Path):
+        self.rules = sorted(rules, key=lambda rule: len(rule.prefix), reverse=True)
+        self.directory = Path(directory)
+        self._lock = Lock()
+        self._buckets: dict[tuple[str, str], SharedTokenBucket] = {}
+
+    @classmethod
+    def from_env(cls) -> RateLimiter:
+        rules = parse_rules(os.getenv("DM_RATE_LIMIT_RULES", ""))
+        rate = env_float("DM_RATE_LIMIT_RPS", 0.0)
+        if rate > 0:
+            rules.append(RateLimitRule(prefix="", rate=rate, burst=env_float("DM_RATE_LIMIT_BURST", max(1.0, rate))))
+        directory = os.getenv("DM_RATE_LIMIT_DIR") or Path(tempfile.gettempdir()) / "dm-api-rate-limit"
+        return cls(rules, directory)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.rules)
+
+    def _bucket(self, base_url: str, rule: RateLimitRule) -> SharedTokenBucket:
+        key = base_url, rule.prefix
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                digest = hashlib.sha1(f"{base_url}|{rule.prefix}".encode()).hexdigest()[:16]
+                bucket = SharedTokenBucket(self.directory / f"{digest}.bucket", rule.rate, rule.burst)
+                self._buckets[key] = bucket
+            return bucket
+
+    def _matching_rules(self, route: str) -> list[RateLimitRule]:
+        matched = [rule for rule in self.rules if not rule.prefix]
+        specific = next((rule for rule in self.rules if rule.prefix and route.startswith(rule.prefix)), None)
+        if specific is not None:
+            matched.append(specific)
+        return matched
+
+    def delay_for(self, base_url: str, route: str) -> float:
+        delays = [self._bucket(base_url, rule).reserve() for rule in self._matching_rules(route)]
+        return max(delays, default=0.0)
+
+    def acquire(self, base_url: str, route: str) -> None:
+        if not self.enabled:
+            return
+        delay = self.delay_for(base_url, route)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, base_url: str, route: str) -> None:
+        if not self.enabled:
+            return
+        # Reserving takes a blocking file lock, so it runs off the event loop.
+        delay = await asyncio.to_thread(self.delay_for, base_url, route)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+rate_limiter = RateLimiter.from_env()
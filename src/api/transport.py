@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Mapping
+from datetime import timedelta
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+from requests.utils import default_headers, get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+from src.api.pool import instrument_pool_manager, warm_pool
+
+TRANSPORTS = ("requests", "urllib3")
+SESSION_STRATEGIES = ("shared", "thread_local")
+# Follow redirects up to the ``requests`` limit and hand back the last one past it; never retry a failed request.
+FOLLOW_REDIRECTS = Retry(total=None, connect=False, read=False, status=0, other=0, redirect=30, raise_on_redirect=False)
+
+
+def select_transport(name: str | None = None) -> str:
+    """Resolve ``DM_HTTP_TRANSPORT`` (``requests`` by default, or ``urllib3``)."""
+    name = (name or os.getenv("DM_HTTP_TRANSPORT") or "requests").strip().lower()
+    if name not in TRANSPORTS:
+        raise ValueError(f"Unknown HTTP transport {name!r}; expected one of {', '.join(TRANSPORTS)}")
+    return name
+
+
+def select_session_strategy(name: str | None = None) -> str:
+    """Resolve ``DM_HTTP_SESSION_STRATEGY`` (``shared`` by default, or ``thread_local``)."""
+    name = (name or os.getenv("DM_HTTP_SESSION_STRATEGY") or "shared").strip().lower()
+    if name not in SESSION_STRATEGIES:
+        raise ValueError(f"Unknown HTTP session strategy {name!r}; expected one of {', '.join(SESSION_STRATEGIES)}")
+    return name
+
+
+def _query(params: Mapping | None) -> str:
+    if not params:
+        return ""
+    pairs = []
+    for name, value in params.items():
+        if value is None:
+            continue
+        for item in value if isinstance(value, list | tuple) else (value,):
+            pairs.append((name, item))
+    return urlencode(pairs)
+
+
+class Urllib3Transport:
+    """
+    Sends requests straight through a pooled ``urllib3.PoolManager`` and wraps the result in a ``requests.Response``.
+
+    It skips what ``Session.request`` does on every call: merging proxy/CA settings from the environment,
+    building a ``PreparedRequest``, cookie handling and hooks. The ``requests`` default headers are computed once.
+    Proxies and ``REQUESTS_CA_BUNDLE`` are therefore not honoured, and multipart uploads stay on the session path.
+    Redirects are followed like ``requests`` does, and ``url`` of the response is the final one. Connection failures
+    and timeouts are raised as their ``requests`` counterparts, so callers see the same errors.
+    """
+
+    def __init__(self, num_pools: int = 8, maxsize: int = 8, block: bool = True):
+        self.base_headers = dict(default_headers())
+        self._pool = instrument_pool_manager(urllib3.PoolManager(num_pools=num_pools, maxsize=maxsize, block=block))
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping | None = None,
+        data: bytes | None = None,
+        timeout: float = 30,
+    ) -> requests.Response:
+        query = _query(params)
+        if query:
+            url = f"{url}&{query}" if "?" in url else f"{url}?{query}"
+        request_headers = {**self.base_headers, **headers} if headers else self.base_headers
+        started = time.perf_counter()
+        try:
+            raw = self._pool.request(
+                method, url, body=data, headers=request_headers, timeout=timeout, retries=FOLLOW_REDIRECTS
+            )
+        except urllib3.exceptions.MaxRetryError as error:
+            raise requests.ConnectionError(error.reason or error) from error
+        except urllib3.exceptions.ConnectTimeoutError as error:
+            raise requests.ConnectTimeout(error) from error
+        except urllib3.exceptions.ReadTimeoutError as error:
+            raise requests.ReadTimeout(error) from error
+        except urllib3.exceptions.HTTPError as error:
+            raise requests.ConnectionError(error) from error
+        return self._response(raw, raw.url or url, time.perf_counter() - started)
+
+    @staticmethod
+    def _response(raw: urllib3.BaseHTTPResponse, url: str, elapsed: float) -> requests.Response:
+        response = requests.Response()
+        response.status_code = raw.status
+        response.reason = raw.reason
+        response.headers = CaseInsensitiveDict(raw.headers)
+        response.url = url
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(seconds=elapsed)
+        response._content = raw.data
+        response.raw = raw
+        return response
+
+    def warm_up(self, url: str, connections: int) -> int:
+        return warm_pool(self._pool.connection_from_url(url), connections)
+
+    def close(self) -> None:
+        self._pool.clear()
@@ -3,17 +3,43 @@ from __future__ import annotations
 import pytest
 from faker import Faker
 
+from src.api.auth import StoredCredentials, TokenStore
 from src.api.controllers.account.account_controller import AccountApi
+from src.api.controllers.account.login_controller import LoginApi
 from src.api.models.account.login_model import LoginCredentials
-from tests.fixtures.api import SessionUser
+from tests.fixtures.api import SessionUser, _user_credentials
 from tests.fixtures.config import Config
 
 fake = Faker()
 
 
+def _uses_private_user(request: pytest.FixtureRequest) -> bool:
+    return request.node.get_closest_marker("private_user") is not None
+
+
+@pytest.fixture(scope="function")
+def account_user(request: pytest.FixtureRequest, session_user: SessionUser) -> SessionUser:
+    # Pooled and session users are shared across tests, runs and workers, so tests that change the account's email
+    # or password get a freshly registered user of their own.
+    if _uses_private_user(request):
+        return request.getfixturevalue("fresh_session_user")
+    return session_user
+
+
 @pytest.fixture(scope="function")
-def authed_account_api(configs: Config, auth_token: str) -> AccountApi:
-    return AccountApi(base_url=configs.base_url, auth_token=auth_token)
+def authed_account_api(
+    request: pytest.FixtureRequest,
+    configs: Config,
+    account_user: SessionUser,
+    login_api: LoginApi,
+    token_store: TokenStore,
+) -> AccountApi:
+    if not _uses_private_user(request):
+        auth_token: str = request.getfixturevalue("auth_token")
+        session_credentials: StoredCredentials = request.getfixturevalue("session_credentials")
+        return AccountApi(base_url=configs.base_url, auth_token=auth_token, credentials=session_credentials)
+    credentials = _user_credentials(token_store, login_api, account_user)
+    return AccountApi(base_url=configs.base_url, auth_token=account_user.token, credentials=credentials)
 
 
 @pytest.fixture(scope="function")
@@ -7,6 +7,7 @@ from src.api.controllers.account.account_controller import AccountApi
 from src.api.models.account.account_model import UserEnvelope
 from src.api.models.account.login_model import LoginCredentials
 from tests.fixtures.allure_helpers import hidden_env, masked_env, step
+from tests.fixtures.api import SessionUser
 
 
 @pytest.mark.smoke
@@ -94,12 +95,9 @@ def test_reset_password_invalid_payload_returns_400(account_api: AccountApi):
 
 
 @pytest.mark.regression
-def test_change_password_success_and_revert(
-    authed_account_api: AccountApi,
-    login_api,
-    user_login: str,
-    user_password: str,
-):
+@pytest.mark.private_user
+def test_change_password_success_and_revert(authed_account_api: AccountApi, login_api, account_user: SessionUser):
+    user_login, user_password = account_user.login, account_user.password
     with step("Mark sensitive fields as env references"):
         masked_env("LOGIN", "login")
         masked_env("PASSWORD", "old_password")
@@ -151,7 +149,9 @@ def test_change_password_invalid_payload_returns_400(authed_account_api: Account
 
 
 @pytest.mark.regression
-def test_change_email_success(authed_account_api: AccountApi, user_login: str, user_password: str):
+@pytest.mark.private_user
+def test_change_email_success(authed_account_api: AccountApi, account_user: SessionUser):
+    user_login, user_password = account_user.login, account_user.password
     with step("Mark sensitive fields as env references"):
         masked_env("LOGIN", "login")
         masked_env("PASSWORD", "password")
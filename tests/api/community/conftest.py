@@ -3,15 +3,18 @@ from __future__ import annotations
 import datetime as dt
 import struct
 import zlib
+from collections.abc import Iterator
 
 import pytest
 from faker import Faker
 
+from src.api.auth import StoredCredentials, TokenStore
+from src.api.controllers.account.login_controller import LoginApi
 from src.api.controllers.community.poll_controller import PollApi
 from src.api.controllers.community.review_controller import ReviewApi
 from src.api.controllers.community.user_controller import UserApi
 from src.api.controllers.community.userupload_controller import UserUploadApi
-from tests.fixtures.api import SessionUser, _create_active_session_user
+from tests.fixtures.api import SessionUser, _leased_session_users, _user_credentials
 from tests.fixtures.config import Config
 
 fake = Faker()
@@ -32,13 +35,20 @@ def _build_valid_png() -> bytes:
 
 
 @pytest.fixture(scope="module")
-def community_session_user(configs: Config, login_api, account_api) -> SessionUser:
-    return _create_active_session_user(configs, login_api, account_api, prefix="community")
+def community_session_users(configs: Config, login_api, account_api, user_pool) -> Iterator[tuple[SessionUser, ...]]:
+    prefixes = ("community", "community_alt")
+    with _leased_session_users(user_pool, configs, login_api, account_api, prefixes=prefixes) as users:
+        yield users
 
 
 @pytest.fixture(scope="module")
-def community_another_session_user(configs: Config, login_api, account_api) -> SessionUser:
-    return _create_active_session_user(configs, login_api, account_api, prefix="community_alt")
+def community_session_user(community_session_users: tuple[SessionUser, ...]) -> SessionUser:
+    return community_session_users[0]
+
+
+@pytest.fixture(scope="module")
+def community_another_session_user(community_session_users: tuple[SessionUser, ...]) -> SessionUser:
+    return community_session_users[1]
 
 
 @pytest.fixture(scope="module")
@@ -46,6 +56,13 @@ def community_auth_token(community_session_user: SessionUser) -> str:
     return community_session_user.token
 
 
+@pytest.fixture(scope="module")
+def community_credentials(
+    community_session_user: SessionUser, login_api: LoginApi, token_store: TokenStore
+) -> StoredCredentials:
+    return _user_credentials(token_store, login_api, community_session_user)
+
+
 @pytest.fixture(scope="module")
 def community_user_login(community_session_user: SessionUser) -> str:
     return community_session_user.login
@@ -57,23 +74,27 @@ def community_another_user_login(community_another_session_user: SessionUser) ->
 
 
 @pytest.fixture(scope="function")
-def poll_api(configs: Config, community_auth_token: str) -> PollApi:
-    return PollApi(base_url=configs.app_base_url, auth_token=community_auth_token)
+def poll_api(configs: Config, community_auth_token: str, community_credentials: StoredCredentials) -> PollApi:
+    return PollApi(base_url=configs.app_base_url, auth_token=community_auth_token, credentials=community_credentials)
 
 
 @pytest.fixture(scope="function")
-def review_api(configs: Config, community_auth_token: str) -> ReviewApi:
-    return ReviewApi(base_url=configs.app_base_url, auth_token=community_auth_token)
+def review_api(configs: Config, community_auth_token: str, community_credentials: StoredCredentials) -> ReviewApi:
+    return ReviewApi(base_url=configs.app_base_url, auth_token=community_auth_token, credentials=community_credentials)
 
 
 @pytest.fixture(scope="function")
-def user_api(configs: Config, community_auth_token: str) -> UserApi:
-    return UserApi(base_url=configs.app_base_url, auth_token=community_auth_token)
+def user_api(configs: Config, community_auth_token: str, community_credentials: StoredCredentials) -> UserApi:
+    return UserApi(base_url=configs.app_base_url, auth_token=community_auth_token, credentials=community_credentials)
 
 
 @pytest.fixture(scope="function")
-def user_upload_api(configs: Config, community_auth_token: str) -> UserUploadApi:
-    return UserUploadApi(base_url=configs.app_base_url, auth_token=community_auth_token)
+def user_upload_api(
+    configs: Config, community_auth_token: str, community_credentials: StoredCredentials
+) -> UserUploadApi:
+    return UserUploadApi(
+        base_url=configs.app_base_url, auth_token=community_auth_token, credentials=community_credentials
+    )
 
 
 @pytest.fixture(scope="function")
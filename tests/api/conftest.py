@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.api.controllers.base_controller import BaseController
+from src.api.env import env_int
+from tests.fixtures.config import Config
+from tests.fixtures.mailhog import mailhog_indexer
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_connections(configs: Config) -> dict[str, int]:
+    """Open ``DM_HTTP_WARM_CONNECTIONS`` pooled connections to DM.API and MailHog in parallel before the first test."""
+    connections = env_int("DM_HTTP_WARM_CONNECTIONS", 4, minimum=0)
+    if not connections:
+        return {}
+    targets = {configs.base_url: lambda: BaseController.warm_up(configs.base_url, connections)}
+    if configs.mail_hog_url:
+        targets[configs.mail_hog_url] = lambda: mailhog_indexer(configs.mail_hog_url).warm_up(connections)
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        opened = {url: executor.submit(warm_up) for url, warm_up in targets.items()}
+    return {url: future.result() for url, future in opened.items()}
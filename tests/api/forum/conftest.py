@@ -1,23 +1,33 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pytest
-import requests
 from faker import Faker
 
+from src.api.auth import StoredCredentials, TokenStore
+from src.api.controllers.account.login_controller import LoginApi
 from src.api.controllers.forum.comment_controller import CommentController
 from src.api.controllers.forum.forum_controller import ForumApi
 from src.api.controllers.forum.topic_controller import TopicController
 from src.api.models.forum.comment_model import Comment
 from src.api.models.forum.topic_model import Topic
-from tests.fixtures.api import SessionUser, _create_active_session_user
+from tests.fixtures.api import SessionUser, _leased_session_users, _user_credentials
 from tests.fixtures.config import Config
+from tests.fixtures.reaper import ResourceReaper
 
 fake = Faker()
 
 
 @pytest.fixture(scope="module")
-def forum_session_user(configs: Config, login_api, account_api) -> SessionUser:
-    return _create_active_session_user(configs, login_api, account_api, prefix="forum")
+def forum_session_users(configs: Config, login_api, account_api, user_pool) -> Iterator[tuple[SessionUser, ...]]:
+    with _leased_session_users(user_pool, configs, login_api, account_api, prefixes=("forum", "forum_alt")) as users:
+        yield users
+
+
+@pytest.fixture(scope="module")
+def forum_session_user(forum_session_users: tuple[SessionUser, ...]) -> SessionUser:
+    return forum_session_users[0]
 
 
 @pytest.fixture(scope="module")
@@ -26,8 +36,8 @@ def forum_auth_token(forum_session_user: SessionUser) -> str:
 
 
 @pytest.fixture(scope="module")
-def forum_another_session_user(configs: Config, login_api, account_api) -> SessionUser:
-    return _create_active_session_user(configs, login_api, account_api, prefix="forum_alt")
+def forum_another_session_user(forum_session_users: tuple[SessionUser, ...]) -> SessionUser:
+    return forum_session_users[1]
 
 
 @pytest.fixture(scope="module")
@@ -35,6 +45,20 @@ def forum_another_auth_token(forum_another_session_user: SessionUser) -> str:
     return forum_another_session_user.token
 
 
+@pytest.fixture(scope="module")
+def forum_credentials(
+    forum_session_user: SessionUser, login_api: LoginApi, token_store: TokenStore
+) -> StoredCredentials:
+    return _user_credentials(token_store, login_api, forum_session_user)
+
+
+@pytest.fixture(scope="module")
+def forum_another_credentials(
+    forum_another_session_user: SessionUser, login_api: LoginApi, token_store: TokenStore
+) -> StoredCredentials:
+    return _user_credentials(token_store, login_api, forum_another_session_user)
+
+
 @pytest.fixture(scope="module")
 def forum_user_login(forum_session_user: SessionUser) -> str:
     return forum_session_user.login
@@ -46,32 +70,41 @@ def forum_another_user_login(forum_another_session_user: SessionUser) -> str:
 
 
 @pytest.fixture(scope="function")
-def forum_api(configs: Config, forum_auth_token: str) -> ForumApi:
-    return ForumApi(base_url=configs.app_base_url, auth_token=forum_auth_token)
+def forum_api(configs: Config, forum_auth_token: str, forum_credentials: StoredCredentials) -> ForumApi:
+    return ForumApi(base_url=configs.app_base_url, auth_token=forum_auth_token, credentials=forum_credentials)
 
 
 @pytest.fixture(scope="function")
-def topic_api(configs: Config, forum_auth_token: str) -> TopicController:
-    return TopicController(base_url=configs.app_base_url, auth_token=forum_auth_token)
+def topic_api(configs: Config, forum_auth_token: str, forum_credentials: StoredCredentials) -> TopicController:
+    return TopicController(base_url=configs.app_base_url, auth_token=forum_auth_token, credentials=forum_credentials)
 
 
 @pytest.fixture(scope="function")
-def topic_api_liker(configs: Config, forum_another_auth_token: str) -> TopicController:
-    return TopicController(base_url=configs.app_base_url, auth_token=forum_another_auth_token)
+def topic_api_liker(
+    configs: Config, forum_another_auth_token: str, forum_another_credentials: StoredCredentials
+) -> TopicController:
+    return TopicController(
+        base_url=configs.app_base_url, auth_token=forum_another_auth_token, credentials=forum_another_credentials
+    )
 
 
 @pytest.fixture(scope="function")
-def forum_comment_api(configs: Config, forum_auth_token: str) -> CommentController:
-    return CommentController(base_url=configs.app_base_url, auth_token=forum_auth_token)
+def forum_comment_api(
+    configs: Config, forum_auth_token: str, forum_credentials: StoredCredentials
+) -> CommentController:
+    return CommentController(base_url=configs.app_base_url, auth_token=forum_auth_token, credentials=forum_credentials)
 
 
 @pytest.fixture(scope="function")
-def forum_comment_api_liker(configs: Config, forum_another_auth_token: str) -> CommentController:
-    return CommentController(base_url=configs.app_base_url, auth_token=forum_another_auth_token)
+def forum_comment_api_liker(
+    configs: Config, forum_another_auth_token: str, forum_another_credentials: StoredCredentials
+) -> CommentController:
+    return CommentController(
+        base_url=configs.app_base_url, auth_token=forum_another_auth_token, credentials=forum_another_credentials
+    )
 
 
-@pytest.fixture(scope="function")
-def valid_forum_id(forum_api: ForumApi) -> str:
+def _first_forum_id(forum_api: ForumApi) -> str:
     fora = forum_api.get_fora()
     if not fora.resources:
         pytest.fail("No fora available for forum tests.")
@@ -81,55 +114,124 @@ def valid_forum_id(forum_api: ForumApi) -> str:
     return forum_id
 
 
-@pytest.fixture(scope="function")
-def valid_topic_payload() -> dict:
+def _topic_payload() -> dict:
     return {
         "title": fake.sentence(nb_words=6),
         "description": fake.paragraph(nb_sentences=2),
     }
 
 
-@pytest.fixture(scope="function")
-def valid_comment_payload() -> dict:
+def _comment_payload() -> dict:
     return {
         "text": fake.sentence(nb_words=8),
     }
 
 
-@pytest.fixture(scope="function")
-def created_topic(forum_api: ForumApi, topic_api: TopicController, valid_forum_id: str, valid_topic_payload: dict) -> Topic:
-    created_envelope = forum_api.post_topic(id=valid_forum_id, payload=valid_topic_payload)
-
-    created = created_envelope.resource
+def _create_topic(forum_api: ForumApi, forum_id: str, payload: dict) -> Topic:
+    created = forum_api.post_topic(id=forum_id, payload=payload).resource
     if created is None or not created.id:
         pytest.fail("Topic was not created or id is missing in response.")
+    return created
+
+
+def _create_comment(topic_api: TopicController, topic_id: str, payload: dict) -> Comment:
+    created = topic_api.post_forum_comment(id=topic_id, payload=payload).resource
+    if created is None or not created.id:
+        pytest.fail("Comment was not created or id is missing in response.")
+    return created
+
+
+def _uses_private_resources(request: pytest.FixtureRequest) -> bool:
+    return request.node.get_closest_marker("private_resources") is not None
+
+
+@pytest.fixture(scope="function")
+def valid_forum_id(forum_api: ForumApi) -> str:
+    return _first_forum_id(forum_api)
+
+
+@pytest.fixture(scope="function")
+def valid_topic_payload() -> dict:
+    return _topic_payload()
+
+
+@pytest.fixture(scope="function")
+def valid_comment_payload() -> dict:
+    return _comment_payload()
+
+
+@pytest.fixture(scope="module")
+def shared_topic(
+    configs: Config, forum_auth_token: str, forum_credentials: StoredCredentials, resource_reaper: ResourceReaper
+) -> Iterator[Topic]:
+    forum_api = ForumApi(base_url=configs.app_base_url, auth_token=forum_auth_token, credentials=forum_credentials)
+    topic_api = TopicController(
+        base_url=configs.app_base_url, auth_token=forum_auth_token, credentials=forum_credentials
+    )
+    created = _create_topic(forum_api, _first_forum_id(forum_api), _topic_payload())
+
+    yield created
+
+    resource_reaper.register(f"topic {created.id}", topic_api.delete_topic, id=created.id)
+
+
+@pytest.fixture(scope="function")
+def private_topic(
+    forum_api: ForumApi,
+    topic_api: TopicController,
+    valid_forum_id: str,
+    valid_topic_payload: dict,
+    resource_reaper: ResourceReaper,
+) -> Iterator[Topic]:
+    created = _create_topic(forum_api, valid_forum_id, valid_topic_payload)
 
     yield created
 
-    try:
-        topic_api.delete_topic(id=created.id)
-    except requests.HTTPError as exc:
-        if exc.response is None or exc.response.status_code not in (403, 404, 410):
-            raise
+    resource_reaper.register(f"topic {created.id}", topic_api.delete_topic, id=created.id)
 
 
 @pytest.fixture(scope="function")
-def created_comment(
+def created_topic(request: pytest.FixtureRequest) -> Topic:
+    # Read-only tests share one topic per module; tests marked ``private_resources`` get their own.
+    return request.getfixturevalue("private_topic" if _uses_private_resources(request) else "shared_topic")
+
+
+@pytest.fixture(scope="module")
+def shared_comment(
+    configs: Config,
+    forum_auth_token: str,
+    forum_credentials: StoredCredentials,
+    shared_topic: Topic,
+    resource_reaper: ResourceReaper,
+) -> Iterator[Comment]:
+    topic_api = TopicController(
+        base_url=configs.app_base_url, auth_token=forum_auth_token, credentials=forum_credentials
+    )
+    comment_api = CommentController(
+        base_url=configs.app_base_url, auth_token=forum_auth_token, credentials=forum_credentials
+    )
+    created = _create_comment(topic_api, shared_topic.id, _comment_payload())
+
+    yield created
+
+    resource_reaper.register(f"comment {created.id}", comment_api.delete_comment, id=created.id)
+
+
+@pytest.fixture(scope="function")
+def private_comment(
     topic_api: TopicController,
     forum_comment_api: CommentController,
     created_topic: Topic,
     valid_comment_payload: dict,
-) -> Comment:
-    created_envelope = topic_api.post_forum_comment(id=created_topic.id, payload=valid_comment_payload)
-
-    created = created_envelope.resource
-    if created is None or not created.id:
-        pytest.fail("Comment was not created or id is missing in response.")
+    resource_reaper: ResourceReaper,
+) -> Iterator[Comment]:
+    created = _create_comment(topic_api, created_topic.id, valid_comment_payload)
 
     yield created
 
-    try:
-        forum_comment_api.delete_comment(id=created.id)
-    except requests.HTTPError as exc:
-        if exc.response is None or exc.response.status_code not in (403, 404, 410):
-            raise
+    resource_reaper.register(f"comment {created.id}", forum_comment_api.delete_comment, id=created.id)
+
+
+@pytest.fixture(scope="function")
+def created_comment(request: pytest.FixtureRequest) -> Comment:
+    return request.getfixturevalue("private_comment" if _uses_private_resources(request) else "shared_comment")
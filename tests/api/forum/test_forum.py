@@ -58,6 +58,7 @@ def test_get_topics_in_forum(forum_api, valid_forum_id: str):
 
 
 @pytest.mark.regression
+@pytest.mark.private_resources
 def test_post_topic_in_forum(created_topic, valid_topic_payload: dict):
     with step("Verify created topic payload values"):
         assert created_topic.id is not None
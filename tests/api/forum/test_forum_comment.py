@@ -30,6 +30,7 @@ def test_get_comment_roundtrip(forum_comment_api, created_comment):
 
 
 @pytest.mark.regression
+@pytest.mark.private_resources
 def test_update_comment_success(forum_comment_api, created_comment):
     with step("Prepare comment update payload"):
         new_text_value = fake.sentence()
@@ -95,6 +96,7 @@ def test_delete_comment_not_found(forum_comment_api):
 
 
 @pytest.mark.regression
+@pytest.mark.private_resources
 def test_like_comment_success(
     forum_comment_api, forum_comment_api_liker, created_comment, forum_another_user_login: str
 ):
@@ -111,6 +113,7 @@ def test_like_comment_success(
 
 
 @pytest.mark.regression
+@pytest.mark.private_resources
 def test_like_comment_already_liked(forum_comment_api_liker, created_comment):
     with step("Like comment first time"):
         forum_comment_api_liker.like_comment(id=created_comment.id)
@@ -131,6 +134,7 @@ def test_like_comment_not_found(forum_comment_api):
 
 
 @pytest.mark.regression
+@pytest.mark.private_resources
 def test_unlike_comment_success(
     forum_comment_api, forum_comment_api_liker, created_comment, forum_another_user_login: str
 ):
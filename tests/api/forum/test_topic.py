@@ -32,6 +32,7 @@ def test_create_and_get_topic_roundtrip(topic_api, created_topic: Topic):
 
 
 @pytest.mark.regression
+@pytest.mark.private_resources
 def test_put_topic_roundtrip(topic_api, created_topic: Topic):
     with step("Prepare topic update payload"):
         new_title = fake.sentence(nb_words=5)
@@ -52,6 +53,7 @@ def test_put_topic_roundtrip(topic_api, created_topic: Topic):
 
 
 @pytest.mark.regression
+@pytest.mark.private_resources
 def test_like_and_unlike_topic(topic_api_liker, created_topic: Topic, forum_another_user_login: str):
     with step("Like topic"):
         like_envelope = topic_api_liker.post_topic_like(id=created_topic.id)
@@ -79,6 +81,7 @@ def test_get_forum_comments(topic_api, created_topic: Topic):
 
 
 @pytest.mark.regression
+@pytest.mark.private_resources
 def test_post_comment_and_read_comments(topic_api, created_topic: Topic, valid_comment_payload: dict):
     with step("Post comment to topic"):
         created_comment_envelope = topic_api.post_forum_comment(id=created_topic.id, payload=valid_comment_payload)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 from faker import Faker
 
+from src.api.auth import StoredCredentials
 from src.api.controllers.game.attributeschema_controller import AttributeSchemaController
 from src.api.controllers.game.character_controller import CharacterApi
 from src.api.controllers.game.comment_controller import CommentApi
@@ -16,33 +17,37 @@ fake = Faker()
 
 
 @pytest.fixture(scope="function")
-def game_api(configs: Config, auth_token: str) -> GameApi:
-    return GameApi(base_url=configs.app_base_url, auth_token=auth_token)
+def game_api(configs: Config, auth_token: str, session_credentials: StoredCredentials) -> GameApi:
+    return GameApi(base_url=configs.app_base_url, auth_token=auth_token, credentials=session_credentials)
 
 
 @pytest.fixture(scope="function")
-def room_api(configs: Config, auth_token: str) -> RoomApi:
-    return RoomApi(base_url=configs.app_base_url, auth_token=auth_token)
+def room_api(configs: Config, auth_token: str, session_credentials: StoredCredentials) -> RoomApi:
+    return RoomApi(base_url=configs.app_base_url, auth_token=auth_token, credentials=session_credentials)
 
 
 @pytest.fixture(scope="function")
-def post_api(configs: Config, auth_token: str) -> PostApi:
-    return PostApi(base_url=configs.app_base_url, auth_token=auth_token)
+def post_api(configs: Config, auth_token: str, session_credentials: StoredCredentials) -> PostApi:
+    return PostApi(base_url=configs.app_base_url, auth_token=auth_token, credentials=session_credentials)
 
 
 @pytest.fixture(scope="function")
-def comment_api(configs: Config, auth_token: str) -> CommentApi:
-    return CommentApi(base_url=configs.app_base_url, auth_token=auth_token)
+def comment_api(configs: Config, auth_token: str, session_credentials: StoredCredentials) -> CommentApi:
+    return CommentApi(base_url=configs.app_base_url, auth_token=auth_token, credentials=session_credentials)
 
 
 @pytest.fixture(scope="function")
-def character_api(configs: Config, auth_token: str) -> CharacterApi:
-    return CharacterApi(base_url=configs.app_base_url, auth_token=auth_token)
+def character_api(configs: Config, auth_token: str, session_credentials: StoredCredentials) -> CharacterApi:
+    return CharacterApi(base_url=configs.app_base_url, auth_token=auth_token, credentials=session_credentials)
 
 
 @pytest.fixture(scope="function")
-def attribute_schema_api(configs: Config, auth_token: str) -> AttributeSchemaController:
-    return AttributeSchemaController(base_url=configs.app_base_url, auth_token=auth_token)
+def attribute_schema_api(
+    configs: Config, auth_token: str, session_credentials: StoredCredentials
+) -> AttributeSchemaController:
+    return AttributeSchemaController(
+        base_url=configs.app_base_url, auth_token=auth_token, credentials=session_credentials
+    )
 
 
 @pytest.fixture(scope="function")
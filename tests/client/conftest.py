@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import queue
+import struct
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import BinaryIO
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src.api.metrics import latency_metrics
+
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OP_TEXT, _OP_CLOSE, _OP_PING, _OP_PONG = 0x1, 0x8, 0x9, 0xA
+
+
+def _accept_key(key: str) -> str:
+    return base64.b64encode(hashlib.sha1((key + _WEBSOCKET_GUID).encode("ascii")).digest()).decode("ascii")
+
+
+def _server_frame(opcode: int, payload: bytes) -> bytes:
+    length = len(payload)
+    if length < 126:
+        return struct.pack("!BB", 0x80 | opcode, length) + payload
+    if length < 1 << 16:
+        return struct.pack("!BBH", 0x80 | opcode, 126, length) + payload
+    return struct.pack("!BBQ", 0x80 | opcode, 127, length) + payload
+
+
+def _read_client_frame(rfile: BinaryIO) -> tuple[int, bytes]:
+    head = rfile.read(2)
+    if len(head) < 2:
+        raise EOFError
+    length = head[1] & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", rfile.read(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", rfile.read(8))
+    mask = rfile.read(4) if head[1] & 0x80 else b"\0\0\0\0"
+    payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(rfile.read(length)))
+    return head[0] & 0x0F, payload
+
+
+@dataclass
+class StubResponse:
+    status: int = 200
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+    upgrade: Callable[[BinaryIO, BinaryIO], None] | None = None
+
+    @classmethod
+    def json(cls, payload: dict | list, status: int = 200, headers: dict[str, str] | None = None) -> StubResponse:
+        return cls(
+            status=status,
+            body=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json", **(headers or {})},
+        )
+
+
+@dataclass(frozen=True)
+class RecordedRequest:
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    body: bytes
+
+
+StubHandler = Callable[[RecordedRequest], StubResponse]
+
+
+class StubApi:
+    """In-process DM.API stand-in: routes are registered per test, every request is recorded."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], StubHandler] = {}
+        self.requests: list[RecordedRequest] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add(
+        self,
+        method: str,
+        path: str,
+        response: StubResponse | StubHandler | None = None,
+        *,
+        payload: dict | list | None = None,
+        status: int = 200,
+    ) -> None:
+        if response is None:
+            response = StubResponse.json(payload or {}, status=status) if payload is not None else StubResponse(status)
+        handler = response if callable(response) else (lambda _request, _response=response: _response)
+        with self._lock:
+            self._routes[method.upper(), path] = handler
+
+    def calls(self, method: str, path: str) -> list[RecordedRequest]:
+        with self._lock:
+            return [request for request in self.requests if request.method == method and request.path == path]
+
+    def start(self) -> StubApi:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _dispatch(self, request: RecordedRequest) -> StubResponse:
+        with self._lock:
+            self.requests.append(request)
+            handler = self._routes.get((request.method, request.path))
+        if handler is None:
+            return StubResponse.json({"message": "Not found"}, status=404)
+        return handler(request)
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format: str, *args) -> None:
+                return
+
+            def _handle(self) -> None:
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                request = RecordedRequest(
+                    method=self.command,
+                    path=parts.path,
+                    query=parse_qs(parts.query),
+                    headers=dict(self.headers.items()),
+                    body=self.rfile.read(length) if length else b"",
+                )
+                response = stub._dispatch(request)
+                if response.delay:
+                    time.sleep(response.delay)
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                if response.upgrade is not None:
+                    self.end_headers()
+                    self.wfile.flush()
+                    self.close_connection = True
+                    response.upgrade(self.rfile, self.wfile)
+                    return
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                if response.body and self.command != "HEAD":
+                    self.wfile.write(response.body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+        return Handler
+
+
+class StubMailHog:
+    """
+    MailHog stand-in on top of ``StubApi``: ``deliver`` adds a message, ``/api/v2/messages`` lists newest first,
+    ``/api/v2/search?kind=to`` filters by recipient and ``DELETE /api/v1/messages/{id}`` removes one message.
+    After ``enable_stream`` every delivered message is also pushed to ``/api/v2/websocket`` subscribers, and their
+    pings are answered; ``stall`` turns open streams half-open (no pushes, no pongs) and ``close`` drops them.
+    """
+
+    def __init__(self, api: StubApi):
+        self.api = api
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._stalled = threading.Event()
+        self._subscribers: list[queue.Queue[dict]] = []
+        self.messages: list[dict] = []
+        api.add("GET", "/api/v2/messages", self._list)
+        api.add("GET", "/api/v2/search", self._search)
+
+    @property
+    def base_url(self) -> str:
+        return self.api.base_url
+
+    def deliver(self, to: str, body: str, created: datetime | None = None) -> str:
+        mailbox, _, domain = to.partition("@")
+        message_id = f"{uuid.uuid4().hex}@mailhog.example"
+        message = {
+            "ID": message_id,
+            "To": [{"Mailbox": mailbox, "Domain": domain}],
+            "Content": {"Headers": {"To": [to]}, "Body": body},
+            "Created": (created or datetime.now(UTC)).isoformat(timespec="microseconds").replace("+00:00", "Z"),
+        }
+        with self._lock:
+            self.messages.insert(0, message)
+            for subscriber in self._subscribers:
+                subscriber.put(message)
+        self.api.add("DELETE", f"/api/v1/messages/{message_id}", lambda _request: self._delete(message_id))
+        return message_id
+
+    @staticmethod
+    def _page(request: RecordedRequest, messages: list[dict]) -> StubResponse:
+        start = int(request.query.get("start", ["0"])[0])
+        limit = int(request.query.get("limit", ["50"])[0])
+        items = messages[start : start + limit]
+        return StubResponse.json({"total": len(messages), "count": len(items), "start": start, "items": items})
+
+    def _list(self, request: RecordedRequest) -> StubResponse:
+        with self._lock:
+            messages = list(self.messages)
+        return self._page(request, messages)
+
+    def _search(self, request: RecordedRequest) -> StubResponse:
+        if request.query.get("kind") != ["to"]:
+            return StubResponse.json({"message": "Unsupported search kind"}, status=400)
+        query = request.query.get("query", [""])[0].lower()
+        with self._lock:
+            messages = [
+                message
+                for message in self.messages
+                if any(query in recipient.lower() for recipient in message["Content"]["Headers"]["To"])
+            ]
+        return self._page(request, messages)
+
+    def enable_stream(self) -> None:
+        self.api.add("GET", "/api/v2/websocket", self._upgrade)
+
+    def subscribers(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def stall(self) -> None:
+        self._stalled.set()
+
+    def close(self) -> None:
+        self._closed.set()
+
+    def _upgrade(self, request: RecordedRequest) -> StubResponse:
+        headers = {name.lower(): value for name, value in request.headers.items()}
+        accept = _accept_key(headers.get("sec-websocket-key", ""))
+        return StubResponse(
+            status=101,
+            headers={"Upgrade": "websocket", "Connection": "Upgrade", "Sec-WebSocket-Accept": accept},
+            upgrade=self._push,
+        )
+
+    def _push(self, rfile: BinaryIO, wfile: BinaryIO) -> None:
+        subscriber: queue.Queue[dict] = queue.Queue()
+        write_lock = threading.Lock()
+
+        def send(opcode: int, payload: bytes) -> None:
+            with write_lock:
+                wfile.write(_server_frame(opcode, payload))
+                wfile.flush()
+
+        def answer_pings() -> None:
+            try:
+                while True:
+                    opcode, payload = _read_client_frame(rfile)
+                    if opcode == _OP_CLOSE:
+                        return
+                    if opcode == _OP_PING and not self._stalled.is_set():
+                        send(_OP_PONG, payload)
+            except EOFError, OSError, ValueError:
+                return
+
+        with self._lock:
+            self._subscribers.append(subscriber)
+        reader = threading.Thread(target=answer_pings, daemon=True)
+        reader.start()
+        try:
+            while not self._closed.is_set():
+                try:
+                    message = subscriber.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if not self._stalled.is_set():
+                    send(_OP_TEXT, json.dumps(message).encode("utf-8"))
+            send(_OP_CLOSE, struct.pack("!H", 1001))
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
+            # The handler closes rfile once this returns, which must not race the reader.
+            reader.join(timeout=2)
+
+    def _delete(self, message_id: str) -> StubResponse:
+        with self._lock:
+            remaining = [message for message in self.messages if message["ID"] != message_id]
+            found = len(remaining) != len(self.messages)
+            self.messages = remaining
+        return StubResponse(200 if found else 404)
+
+
+@pytest.fixture(scope="function")
+def stub_api() -> StubApi:
+    stub = StubApi().start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture(scope="function")
+def clean_latency_metrics() -> None:
+    latency_metrics.reset()
+    yield
+    latency_metrics.reset()
+
+
+@pytest.fixture(scope="function")
+def stub_mailhog(stub_api: StubApi) -> StubMailHog:
+    stub = StubMailHog(stub_api)
+    yield stub
+    stub.close()
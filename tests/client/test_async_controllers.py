@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.api.controllers.async_base_controller import AsyncBaseController
+from src.api.controllers.game.game_controller import AsyncGameApi
+from src.api.controllers.game.post_controller import AsyncPostApi
+from tests.fixtures.allure_helpers import step
+
+ROOM_ID = "room-1"
+OTHER_BASE_URL = "http://127.0.0.1:9"
+
+
+@pytest.mark.regression
+def test_get_and_post_round_trip(stub_api):
+    with step("Register post list and post creation endpoints"):
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", payload={"resources": [{"id": "post-1"}], "paging": {}})
+        stub_api.add("POST", f"/v1/rooms/{ROOM_ID}/posts", payload={"resource": {"id": "post-2"}}, status=201)
+
+    async def round_trip():
+        post_api = AsyncPostApi(base_url=stub_api.base_url, auth_token="token")
+        try:
+            posts = await post_api.get_posts(room_id=ROOM_ID, skip=10)
+            created = await post_api.post_post(room_id=ROOM_ID, payload={"text": "Бросок"})
+            return posts, created
+        finally:
+            await AsyncPostApi.close_all_clients()
+
+    with step("Get posts and create a post through the async controller"):
+        posts, created = asyncio.run(round_trip())
+    with step("Verify responses were parsed and requests carried query, headers and body"):
+        assert [post.id for post in posts.resources] == ["post-1"]
+        assert created.resource.id == "post-2"
+        (listed,) = stub_api.calls("GET", f"/v1/rooms/{ROOM_ID}/posts")
+        assert listed.query == {"skip": ["10"]}
+        assert listed.headers["X-Dm-Auth-Token"] == "token"
+        (posted,) = stub_api.calls("POST", f"/v1/rooms/{ROOM_ID}/posts")
+        assert json.loads(posted.body) == {"text": "Бросок"}
+        assert posted.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.regression
+def test_client_errors_raise_http_status_error(stub_api):
+    with step("Register a missing game"):
+        stub_api.add("GET", "/v1/games/game-0", payload={"message": "Not found"}, status=404)
+
+    async def get_game():
+        try:
+            return await AsyncGameApi(base_url=stub_api.base_url, auth_token="token").get_game(id="game-0")
+        finally:
+            await AsyncGameApi.close_all_clients()
+
+    with step("Verify the status surfaces as httpx.HTTPStatusError with the parsed body"):
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            asyncio.run(get_game())
+        assert exc_info.value.response.status_code == 404
+        assert exc_info.value.response.json() == {"message": "Not found"}
+
+
+@pytest.mark.regression
+def test_clients_are_shared_per_event_loop_and_base_url(stub_api):
+    async def clients() -> tuple[httpx.AsyncClient, ...]:
+        post_api = AsyncPostApi(base_url=stub_api.base_url, auth_token="token")
+        game_api = AsyncGameApi(base_url=stub_api.base_url, auth_token="token")
+        other_api = AsyncGameApi(base_url=OTHER_BASE_URL, auth_token="token")
+        return post_api._client, game_api._client, other_api._client
+
+    async def close_all() -> tuple[tuple[httpx.AsyncClient, ...], bool]:
+        shared = await clients()
+        await AsyncBaseController.close_all_clients()
+        return shared, asyncio.get_running_loop() in AsyncBaseController._shared_clients
+
+    with step("Get the clients of controllers in two event loops"):
+        first = asyncio.run(clients())
+        second, registered = asyncio.run(close_all())
+    with step("Verify controllers of one base URL share a client within a loop"):
+        assert first[0] is first[1]
+        assert first[2] is not first[0]
+        assert second[0] is second[1]
+    with step("Verify every loop gets its own client"):
+        assert second[0] is not first[0]
+    with step("Verify close_all_clients closed and forgot the clients of its loop"):
+        assert all(client.is_closed for client in second)
+        assert not registered
+        assert not any(client.is_closed for client in first)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from src.api.batch import BatchExecutor, call
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.game.post_controller import PostApi
+from tests.client.conftest import RecordedRequest, StubResponse
+from tests.fixtures.allure_helpers import step
+
+ROOM_ID = "room-1"
+POSTS = 40
+
+
+class CreatePost:
+    """Echoes the posted text as the new post id, fails texts starting with ``fail`` and tracks concurrency."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+
+    def __call__(self, request: RecordedRequest) -> StubResponse:
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            time.sleep(self.delay)
+            text = json.loads(request.body)["text"]
+            if text.startswith("fail"):
+                return StubResponse.json({"message": "Bad post"}, status=400)
+            return StubResponse.json({"resource": {"id": text}}, status=201)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+
+@pytest.mark.regression
+def test_batch_keeps_input_order_and_isolates_failures(stub_api):
+    with step("Register a post endpoint that rejects every fifth post"):
+        stub_api.add("POST", f"/v1/rooms/{ROOM_ID}/posts", CreatePost())
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+        texts = [f"fail-{index}" if index % 5 == 0 else f"post-{index}" for index in range(POSTS)]
+    with step(f"Create {POSTS} posts in one batch"):
+        report = BatchExecutor().run(call(post_api.post_post, ROOM_ID, {"text": text}) for text in texts)
+    with step("Verify results and errors line up with the input"):
+        for text, value, error in zip(texts, report.results, report.errors, strict=True):
+            if text.startswith("fail"):
+                assert value is None
+                assert isinstance(error, requests.HTTPError)
+                assert error.response.status_code == 400
+            else:
+                assert error is None
+                assert value.resource.id == text
+        assert report.failures == POSTS // 5
+        assert report.summary()["calls"] == POSTS
+        assert report.throughput > 0
+    with step("Verify failures can be raised together"), pytest.raises(ExceptionGroup) as raised:
+        report.raise_for_failures()
+    assert len(raised.value.exceptions) == POSTS // 5
+
+
+@pytest.mark.regression
+def test_batch_is_bounded_by_pool_size(stub_api):
+    with step("Register a slow post endpoint"):
+        handler = CreatePost(delay=0.05)
+        stub_api.add("POST", f"/v1/rooms/{ROOM_ID}/posts", handler)
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Map post creation over the executor"):
+        executor = BatchExecutor()
+        report = executor.map(post_api.post_post, [ROOM_ID] * POSTS, [{"text": f"post-{i}"} for i in range(POSTS)])
+    with step("Verify the worker count matches the HTTP pool and was never exceeded"):
+        assert executor.max_workers == BaseController.pool_maxsize()
+        assert report.failures == 0
+        assert 1 < handler.max_active <= executor.max_workers
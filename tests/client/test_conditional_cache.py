@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.forum.forum_controller import ForumApi
+from src.api.controllers.game.game_controller import GameApi
+from src.api.models.forum.forum_model import ForumListEnvelope
+from tests.client.conftest import RecordedRequest, StubResponse
+from tests.fixtures.allure_helpers import step
+
+ETAG = '"fora-v1"'
+
+
+def _fora_handler(request: RecordedRequest) -> StubResponse:
+    if request.headers.get("If-None-Match") == ETAG:
+        return StubResponse(status=304, headers={"ETag": ETAG})
+    return StubResponse.json({"resources": [{"id": "common"}]}, headers={"ETag": ETAG})
+
+
+@pytest.fixture(scope="function")
+def conditional_cache():
+    cache = BaseController._conditional_cache
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.mark.regression
+def test_get_fora_revalidates_with_etag(stub_api, conditional_cache):
+    with step("Serve fora with an ETag and honour If-None-Match"):
+        stub_api.add("GET", "/v1/fora", _fora_handler)
+        forum_api = ForumApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Get fora twice"):
+        first = forum_api.get_fora()
+        second = forum_api.get_fora()
+    with step("Verify second call revalidated and reused the parsed envelope"):
+        calls = stub_api.calls("GET", "/v1/fora")
+        assert len(calls) == 2
+        assert "If-None-Match" not in calls[0].headers
+        assert calls[1].headers["If-None-Match"] == ETAG
+        assert isinstance(second, ForumListEnvelope)
+        assert second is first
+        assert conditional_cache.hits == 1
+
+
+@pytest.mark.regression
+def test_conditional_cache_is_keyed_by_auth_token(stub_api, conditional_cache):
+    with step("Serve fora with an ETag"):
+        stub_api.add("GET", "/v1/fora", _fora_handler)
+    with step("Get fora with two different tokens"):
+        ForumApi(base_url=stub_api.base_url, auth_token="first").get_fora()
+        ForumApi(base_url=stub_api.base_url, auth_token="second").get_fora()
+    with step("Verify the second token did not send validators"):
+        calls = stub_api.calls("GET", "/v1/fora")
+        assert all("If-None-Match" not in call.headers for call in calls)
+
+
+@pytest.mark.regression
+def test_responses_without_validators_are_not_cached(stub_api, conditional_cache):
+    with step("Serve tags without validators"):
+        stub_api.add("GET", "/v1/games/tags", payload={"resources": []})
+        game_api = GameApi(base_url=stub_api.base_url)
+    with step("Get tags twice"):
+        game_api.get_tags()
+        game_api.get_tags()
+    with step("Verify nothing was cached"):
+        assert len(conditional_cache) == 0
+        assert all("If-None-Match" not in call.headers for call in stub_api.calls("GET", "/v1/games/tags"))
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.game.game_controller import GameApi
+from src.api.metrics import pool_metrics
+from tests.client.conftest import StubResponse
+from tests.fixtures.allure_helpers import step
+from tests.fixtures.mailhog import MailHogIndexer
+
+GAME_ID = "game-1"
+
+
+@pytest.fixture(scope="function")
+def cold_pools(monkeypatch):
+    previous = BaseController.coalesce_gets
+    BaseController.coalesce_gets = False
+    monkeypatch.setenv("DM_HTTP_POOL_MAXSIZE", "4")
+    BaseController.close_all_sessions()
+    pool_metrics.reset()
+    yield
+    BaseController.coalesce_gets = previous
+    BaseController.close_all_sessions()
+    pool_metrics.reset()
+
+
+@pytest.mark.regression
+def test_warmed_connections_serve_the_first_calls(stub_api, cold_pools):
+    with step("Warm up three connections to the API"):
+        assert BaseController.warm_up(stub_api.base_url, 3) == 3
+        assert stub_api.requests == []
+    with step("Run three concurrent first calls"):
+        response = replace(StubResponse.json({"resource": {"id": GAME_ID}}), delay=0.05)
+        stub_api.add("GET", f"/v1/games/{GAME_ID}", response)
+        game_api = GameApi(base_url=stub_api.base_url, auth_token="token")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: game_api.get_game(id=GAME_ID), range(3)))
+    with step("Verify no call had to open a connection"):
+        stats = pool_metrics.stats(stub_api.base_url)
+        assert stats.new_connections == 0
+        assert stats.reused_connections == 3
+
+
+@pytest.mark.regression
+def test_warm_up_is_bounded_and_tolerates_failures(stub_api, stub_mailhog, cold_pools):
+    with step("Verify warm-up never opens more than the pool holds and skips open connections"):
+        assert BaseController.warm_up(stub_api.base_url, 10) == 4
+        assert BaseController.warm_up(stub_api.base_url, 10) == 0
+    with step("Verify the fast transport pool is warmed as well"):
+        previous = BaseController.transport
+        BaseController.transport = "urllib3"
+        try:
+            assert BaseController.warm_up(stub_api.base_url, 2) == 2
+        finally:
+            BaseController.transport = previous
+    with step("Verify an unreachable host opens nothing and does not raise"):
+        assert BaseController.warm_up("http://127.0.0.1:9", 2) == 0
+    with step("Verify the MailHog indexer warms its own pool"):
+        indexer = MailHogIndexer(stub_api.base_url, stream=False)
+        try:
+            assert indexer.warm_up(2) == 2
+        finally:
+            indexer.stop()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.community.userupload_controller import UserUploadApi
+from src.api.controllers.game.post_controller import PostApi
+from src.api.transport import select_transport
+from tests.client.conftest import StubResponse
+from tests.fixtures.allure_helpers import step
+
+ROOM_ID = "room-1"
+
+
+@pytest.fixture(scope="function")
+def fast_transport():
+    previous = BaseController.transport
+    BaseController.transport = "urllib3"
+    yield BaseController._get_or_create_fast_transport()
+    BaseController.transport = previous
+
+
+@pytest.mark.regression
+def test_get_and_post_go_through_the_pool_manager(stub_api, fast_transport):
+    with step("Register post list and post creation endpoints"):
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", payload={"resources": [{"id": "post-1"}], "paging": {}})
+        stub_api.add("POST", f"/v1/rooms/{ROOM_ID}/posts", payload={"resource": {"id": "post-2"}}, status=201)
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Get posts with a skipped parameter and create a post"):
+        posts = post_api.get_posts(room_id=ROOM_ID, skip=10, size=None)
+        created = post_api.post_post(room_id=ROOM_ID, payload={"text": "Бросок"})
+    with step("Verify responses were parsed and requests carried query, headers and body"):
+        assert [post.id for post in posts.resources] == ["post-1"]
+        assert created.resource.id == "post-2"
+        (listed,) = stub_api.calls("GET", f"/v1/rooms/{ROOM_ID}/posts")
+        assert listed.query == {"skip": ["10"]}
+        assert listed.headers["X-Dm-Auth-Token"] == "token"
+        assert listed.headers["User-Agent"].startswith("python-requests/")
+        (posted,) = stub_api.calls("POST", f"/v1/rooms/{ROOM_ID}/posts")
+        assert json.loads(posted.body) == {"text": "Бросок"}
+        assert posted.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.regression
+def test_errors_match_the_requests_transport(stub_api, fast_transport):
+    with step("Register a gone post list"):
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", payload={"message": "Gone"}, status=410)
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Verify the status surfaces as requests.HTTPError with the parsed body"):
+        with pytest.raises(requests.HTTPError) as exc_info:
+            post_api.get_posts(room_id=ROOM_ID)
+        assert exc_info.value.response.status_code == 410
+        assert exc_info.value.response.json() == {"message": "Gone"}
+    with step("Verify an unreachable host raises requests.ConnectionError"), pytest.raises(requests.ConnectionError):
+        PostApi(base_url="http://127.0.0.1:9", auth_token="token").get_posts(room_id=ROOM_ID)
+    with step("Verify unknown transports are rejected"), pytest.raises(ValueError, match="Unknown HTTP transport"):
+        select_transport("pycurl")
+
+
+@pytest.mark.regression
+def test_multipart_uploads_stay_on_the_session(stub_api, fast_transport):
+    with step("Upload a file with the fast transport selected"):
+        stub_api.add("POST", "/v1/users/player/uploads", payload={"resource": {"login": "player"}})
+        UserUploadApi(base_url=stub_api.base_url, auth_token="token").post_user_upload(login="player", file=b"png")
+    with step("Verify the multipart body was built by requests"):
+        (upload,) = stub_api.calls("POST", "/v1/users/player/uploads")
+        assert upload.headers["Content-Type"].startswith("multipart/form-data")
+        assert b"png" in upload.body
+
+
+@pytest.mark.regression
+def test_transport_lookup_does_not_take_the_session_lock(fast_transport):
+    with step("Hold the session lock from another thread"):
+        held, done = threading.Event(), threading.Event()
+
+        def hold_lock() -> None:
+            with BaseController._session_lock:
+                held.set()
+                done.wait(timeout=5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        held.wait(timeout=5)
+    with step("Verify concurrent callers get the existing transport without waiting for the lock"):
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                lookups = [executor.submit(BaseController._get_or_create_fast_transport) for _ in range(8)]
+                assert {id(lookup.result(timeout=1)) for lookup in lookups} == {id(fast_transport)}
+        finally:
+            done.set()
+            holder.join()
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize("transport", ["requests", "urllib3"])
+def test_redirects_are_followed_like_the_session(stub_api, transport):
+    with step("Redirect the post list and the post creation of one room to another"):
+        moved = f"/v1/rooms/{ROOM_ID}-moved/posts"
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", StubResponse(302, headers={"Location": moved}))
+        stub_api.add("POST", f"/v1/rooms/{ROOM_ID}/posts", StubResponse(307, headers={"Location": moved}))
+        stub_api.add("GET", moved, payload={"resources": [{"id": "post-1"}], "paging": {}})
+        stub_api.add("POST", moved, payload={"resource": {"id": "post-2"}}, status=201)
+        previous = BaseController.transport
+        BaseController.transport = transport
+    with step(f"Get posts and create a post through the {transport} transport"):
+        try:
+            post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+            posts = post_api.get_posts(room_id=ROOM_ID)
+            created = post_api.post_post(room_id=ROOM_ID, payload={"text": "Бросок"})
+        finally:
+            BaseController.transport = previous
+    with step("Verify both calls reached the new location with their token and body"):
+        assert [post.id for post in posts.resources] == ["post-1"]
+        assert created.resource.id == "post-2"
+        (listed,) = stub_api.calls("GET", moved)
+        assert listed.headers["X-Dm-Auth-Token"] == "token"
+        (posted,) = stub_api.calls("POST", moved)
+        assert json.loads(posted.body) == {"text": "Бросок"}
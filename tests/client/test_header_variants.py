@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pytest
+
+from src.api.controllers.forum.comment_controller import CommentController
+from tests.fixtures.allure_helpers import step
+
+COMMENT_ID = "comment-1"
+
+
+@pytest.mark.regression
+def test_header_variants_are_reused_until_token_changes():
+    with step("Create a controller with default headers"):
+        comment_api = CommentController(base_url="http://dm.local", auth_token="first", default_headers={"X-Run": "1"})
+    with step("Verify each request shape reuses one prebuilt header set"):
+        plain = comment_api._headers()
+        json_body = comment_api._headers(content_type=True)
+        html = comment_api._headers(extra_headers={"X-Dm-Bb-Render-Mode": "Html"})
+        assert comment_api._headers() is plain
+        assert comment_api._headers(content_type=True) is json_body
+        assert comment_api._headers(extra_headers={"X-Dm-Bb-Render-Mode": "Html"}) is html
+        assert dict(html) == {"X-Run": "1", "X-Dm-Auth-Token": "first", "X-Dm-Bb-Render-Mode": "Html"}
+        assert json_body["Content-Type"] == "application/json"
+    with step("Verify header sets cannot be mutated by callers"), pytest.raises(TypeError):
+        plain["X-Dm-Auth-Token"] = "stolen"
+    with step("Verify assigning a token or default headers rebuilds the variants"):
+        comment_api.auth_token = "second"
+        assert comment_api._headers()["X-Dm-Auth-Token"] == "second"
+        comment_api.default_headers = {"X-Run": "2"}
+        assert dict(comment_api._headers()) == {"X-Run": "2", "X-Dm-Auth-Token": "second"}
+        comment_api.auth_token = None
+        assert "X-Dm-Auth-Token" not in comment_api._headers()
+
+
+@pytest.mark.regression
+def test_requests_carry_the_prebuilt_headers(stub_api):
+    with step("Register the comment endpoint"):
+        stub_api.add("GET", f"/v1/forum/comments/{COMMENT_ID}", payload={"resource": {"id": COMMENT_ID}})
+        comment_api = CommentController(base_url=stub_api.base_url, auth_token="token")
+    with step("Get the comment in two render modes"):
+        comment_api.get_comment(id=COMMENT_ID, render_mode="Html")
+        comment_api.get_comment(id=COMMENT_ID, render_mode="Text")
+    with step("Verify the render mode overlay and the token reached the server"):
+        calls = stub_api.calls("GET", f"/v1/forum/comments/{COMMENT_ID}")
+        assert [call.headers["X-Dm-Bb-Render-Mode"] for call in calls] == ["Html", "Text"]
+        assert {call.headers["X-Dm-Auth-Token"] for call in calls} == {"token"}
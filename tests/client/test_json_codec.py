@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.api.codec import available_codecs, select_codec
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.game.post_controller import PostApi
+from tests.fixtures.allure_helpers import step
+
+ROOM_ID = "room-1"
+PAYLOAD = {"text": "Привет, мир", "nested": {"values": [1, 2.5, None, True]}}
+
+
+@pytest.fixture(scope="function", params=available_codecs())
+def controller_codec(request):
+    previous = BaseController.codec
+    BaseController.codec = select_codec(request.param)
+    yield BaseController.codec
+    BaseController.codec = previous
+
+
+@pytest.mark.regression
+def test_codec_roundtrip(controller_codec):
+    with step(f"Encode and decode a payload with {controller_codec.name}"):
+        encoded = controller_codec.dumps(PAYLOAD)
+    with step("Verify bytes are UTF-8 JSON the stdlib agrees with"):
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded.decode("utf-8")) == PAYLOAD
+        assert controller_codec.loads(encoded) == PAYLOAD
+
+
+@pytest.mark.regression
+def test_request_body_and_response_use_selected_codec(stub_api, controller_codec):
+    with step("Register post endpoint that echoes a resource"):
+        stub_api.add("POST", f"/v1/rooms/{ROOM_ID}/posts", payload={"resource": {"id": "post-1"}})
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+    with step(f"Create a post with {controller_codec.name}"):
+        envelope = post_api.post_post(room_id=ROOM_ID, payload=PAYLOAD)
+    with step("Verify the server received a JSON body"):
+        (call,) = stub_api.calls("POST", f"/v1/rooms/{ROOM_ID}/posts")
+        assert call.headers["Content-Type"] == "application/json"
+        assert json.loads(call.body) == PAYLOAD
+        assert envelope.resource.id == "post-1"
+
+
+@pytest.mark.regression
+def test_unknown_codec_is_rejected():
+    with step("Select an unknown codec"), pytest.raises(ValueError, match="Unknown JSON codec"):
+        select_codec("yaml")
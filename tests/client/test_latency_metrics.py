@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import requests
+
+from src.api.controllers.game.post_controller import PostApi
+from src.api.metrics import LatencyHistogram, LatencyRecorder, latency_metrics
+from tests.fixtures.allure_helpers import step
+
+
+@pytest.mark.regression
+def test_histogram_percentiles_within_precision():
+    with step("Record 1..10000 microseconds"):
+        histogram = LatencyHistogram()
+        for value in range(1, 10_001):
+            histogram.record(value)
+    with step("Verify percentiles stay within HDR relative error"):
+        for percent, expected in ((50, 5_000), (95, 9_500), (99, 9_900)):
+            assert abs(histogram.percentile(percent) - expected) / expected < 0.02
+        assert histogram.percentile(100) == 10_000
+        assert histogram.min == 1
+        assert histogram.max == 10_000
+
+
+@pytest.mark.regression
+def test_recorder_roundtrip_and_merge(tmp_path):
+    with step("Record latencies in two recorders"):
+        first, second = LatencyRecorder(), LatencyRecorder()
+        first.record("get", "/v1/games/{id}", 0.010)
+        second.record("GET", "/v1/games/{id}", 0.030)
+    with step("Dump second recorder and merge it back from JSON"):
+        path = second.dump_json(tmp_path / "latency.json")
+        first.merge(LatencyRecorder.from_dict(json.loads(path.read_text(encoding="utf-8"))))
+    with step("Verify merged summary"):
+        summary = first.snapshot()["GET /v1/games/{id}"]
+        assert summary["count"] == 2
+        assert summary["min_ms"] == 10.0
+        assert summary["max_ms"] == 30.0
+
+
+@pytest.mark.regression
+def test_controller_records_route_template(stub_api, clean_latency_metrics):
+    with step("Register posts endpoint for two rooms"):
+        for room_id in ("room-1", "room-2"):
+            stub_api.add("GET", f"/v1/rooms/{room_id}/posts", payload={"resources": []})
+        stub_api.add("DELETE", "/v1/posts/missing", status=404)
+    with step("Call controller for both rooms and a failing delete"):
+        post_api = PostApi(base_url=stub_api.base_url)
+        post_api.get_posts(room_id="room-1")
+        post_api.get_posts(room_id="room-2")
+        with pytest.raises(requests.HTTPError):
+            post_api.delete_post(post_id="missing")
+    with step("Verify latencies are grouped by route template"):
+        snapshot = latency_metrics.snapshot()
+        assert snapshot["GET /v1/rooms/{room_id}/posts"]["count"] == 2
+        assert snapshot["DELETE /v1/posts/{post_id}"]["count"] == 1
+        assert not any("room-1" in key for key in snapshot)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from tests.client.conftest import StubResponse
+from tests.fixtures.allure_helpers import step
+from tests.fixtures.mailhog import MailHogIndexer
+
+POLL_INTERVAL = 0.05
+
+
+@pytest.fixture(scope="function")
+def indexer(stub_mailhog):
+    indexer = MailHogIndexer(stub_mailhog.base_url, poll_interval=POLL_INTERVAL, page_size=10)
+    yield indexer
+    indexer.stop()
+
+
+def _activation_mail(token: str) -> str:
+    return f"Follow https://dm.am/activate/{token} to activate your account"
+
+
+@pytest.mark.regression
+def test_waiter_wakes_when_mail_arrives(stub_mailhog, indexer):
+    with step("Start waiting for a mail that has not been sent yet"):
+        token = str(uuid.uuid4())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            waiting = executor.submit(indexer.wait_for_token, "new_user@example.com", 5)
+            time.sleep(0.2)
+            started = time.monotonic()
+            stub_mailhog.deliver("new_user@example.com", _activation_mail(token))
+            result = waiting.result()
+            elapsed = time.monotonic() - started
+    with step("Verify the token was delivered within a poll interval or two"):
+        assert result == token
+        assert elapsed < 1.0
+
+
+@pytest.mark.regression
+def test_polls_search_only_pending_recipients(stub_mailhog, indexer):
+    with step("Fill the inbox with old mail"):
+        old = datetime.now(UTC) - timedelta(days=1)
+        for index in range(95):
+            stub_mailhog.deliver(f"old_{index}@example.com", _activation_mail(str(uuid.uuid4())), created=old)
+    with step("Resolve two users registered one after another"):
+        for login in ("first", "second"):
+            token = str(uuid.uuid4())
+            stub_mailhog.deliver(f"{login}@example.com", _activation_mail(token))
+            assert indexer.wait_for_token(f"{login}@example.com", timeout=5) == token
+    with step("Verify the poller searched by recipient and never listed the whole inbox"):
+        searches = stub_mailhog.api.calls("GET", "/api/v2/search")
+        assert {call.query["query"][0] for call in searches} == {"first@example.com", "second@example.com"}
+        assert {call.query["kind"][0] for call in searches} == {"to"}
+        assert stub_mailhog.api.calls("GET", "/api/v2/messages") == []
+
+
+@pytest.mark.regression
+def test_concurrent_waiters_share_one_poller(stub_mailhog, indexer):
+    with step("Wait for twenty users at once and deliver their mails"):
+        tokens = {f"user_{index}@example.com": str(uuid.uuid4()) for index in range(20)}
+        barrier = threading.Barrier(len(tokens) + 1)
+
+        def wait(email: str) -> str | None:
+            barrier.wait()
+            return indexer.wait_for_token(email, timeout=5)
+
+        with ThreadPoolExecutor(max_workers=len(tokens)) as executor:
+            futures = {email: executor.submit(wait, email) for email in tokens}
+            barrier.wait()
+            for email, token in tokens.items():
+                stub_mailhog.deliver(email, _activation_mail(token))
+            results = {email: future.result() for email, future in futures.items()}
+    with step("Verify every waiter got its own token from a single polling loop"):
+        assert results == tokens
+        searches = stub_mailhog.api.calls("GET", "/api/v2/search")
+        assert len(searches) < len(tokens) * 3
+
+
+@pytest.mark.regression
+def test_consumed_mail_is_deleted(stub_mailhog):
+    with step("Create an indexer that deletes consumed mail"):
+        indexer = MailHogIndexer(stub_mailhog.base_url, poll_interval=POLL_INTERVAL, delete_consumed=True)
+    with step("Deliver activation mail for two users and resolve the first one"):
+        token = str(uuid.uuid4())
+        consumed = stub_mailhog.deliver("consumed@example.com", _activation_mail(token))
+        kept = stub_mailhog.deliver("pending@example.com", _activation_mail(str(uuid.uuid4())))
+        try:
+            assert indexer.wait_for_token("consumed@example.com", timeout=5) == token
+        finally:
+            indexer.stop()
+    with step("Verify only the consumed mail was deleted"):
+        assert len(stub_mailhog.api.calls("DELETE", f"/api/v1/messages/{consumed}")) == 1
+        assert [message["ID"] for message in stub_mailhog.messages] == [kept]
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.mark.regression
+def test_stream_pushes_tokens_without_polling(stub_mailhog):
+    with step("Enable the websocket stream and create an indexer that would poll only every 30 seconds"):
+        stub_mailhog.enable_stream()
+        indexer = MailHogIndexer(stub_mailhog.base_url, poll_interval=30)
+    try:
+        with step("Start waiting and let the subscriber connect"), ThreadPoolExecutor(max_workers=1) as executor:
+            token = str(uuid.uuid4())
+            waiting = executor.submit(indexer.wait_for_token, "pushed@example.com", 5)
+            assert _wait_until(lambda: indexer.streaming and stub_mailhog.subscribers() == 1)
+            with step("Deliver the mail"):
+                started = time.monotonic()
+                stub_mailhog.deliver("pushed@example.com", _activation_mail(token))
+                result = waiting.result()
+                elapsed = time.monotonic() - started
+        with step("Verify the token was pushed long before the next poll"):
+            assert result == token
+            assert elapsed < 1.0
+            assert len(stub_mailhog.api.calls("GET", "/api/v2/search")) <= 2
+    finally:
+        indexer.stop()
+
+
+@pytest.mark.regression
+def test_dropped_stream_falls_back_to_polling(stub_mailhog):
+    with step("Connect an indexer to the websocket stream"):
+        stub_mailhog.enable_stream()
+        indexer = MailHogIndexer(stub_mailhog.base_url, poll_interval=POLL_INTERVAL)
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            waiting = executor.submit(indexer.wait_for_token, "dropped@example.com", 5)
+            assert _wait_until(lambda: indexer.streaming)
+            with step("Drop the stream on the server side"):
+                stub_mailhog.close()
+                assert _wait_until(lambda: not indexer.streaming)
+            with step("Deliver the mail"):
+                token = str(uuid.uuid4())
+                stub_mailhog.deliver("dropped@example.com", _activation_mail(token))
+                result = waiting.result()
+        with step("Verify the poller resolved the token"):
+            assert result == token
+    finally:
+        indexer.stop()
+
+
+@pytest.mark.regression
+def test_half_open_stream_is_dropped_by_the_ping_watchdog(stub_mailhog):
+    with step("Connect an indexer that pings the stream every 100 ms"):
+        stub_mailhog.enable_stream()
+        indexer = MailHogIndexer(stub_mailhog.base_url, poll_interval=POLL_INTERVAL, stream_ping_interval=0.1)
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            waiting = executor.submit(indexer.wait_for_token, "half_open@example.com", 5)
+            assert _wait_until(lambda: indexer.streaming)
+            with step("Verify answered pings keep the stream up"):
+                time.sleep(0.5)
+                assert indexer.streaming
+            with step("Stall the stream: no pushes and no pongs, but the connection stays open"):
+                stub_mailhog.stall()
+                assert _wait_until(lambda: not indexer.streaming)
+            with step("Deliver the mail"):
+                token = str(uuid.uuid4())
+                stub_mailhog.deliver("half_open@example.com", _activation_mail(token))
+                result = waiting.result()
+        with step("Verify the poller resolved the token"):
+            assert result == token
+    finally:
+        indexer.stop()
+
+
+@pytest.mark.regression
+def test_failed_catch_up_search_is_retried_while_streaming(stub_mailhog):
+    with step("Deliver a mail before the stream is up and make the first search fail"):
+        token = str(uuid.uuid4())
+        stub_mailhog.deliver("early@example.com", _activation_mail(token))
+        stub_mailhog.enable_stream()
+        failures = iter([True])
+
+        def flaky_search(request):
+            if next(failures, False):
+                return StubResponse.json({"message": "Unavailable"}, status=503)
+            return stub_mailhog._search(request)
+
+        stub_mailhog.api.add("GET", "/api/v2/search", flaky_search)
+        indexer = MailHogIndexer(stub_mailhog.base_url, poll_interval=POLL_INTERVAL)
+    try:
+        with step("Let the stream come up before anybody waits"):
+            indexer._ensure_started()
+            assert _wait_until(lambda: indexer.streaming)
+        with step("Verify the catch-up search is repeated after the failure"):
+            assert indexer.wait_for_token("early@example.com", timeout=5) == token
+            assert len(stub_mailhog.api.calls("GET", "/api/v2/search")) == 2
+    finally:
+        indexer.stop()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from src.api.controllers.forum.topic_controller import TopicController
+from src.api.controllers.game.post_controller import PostApi
+from src.api.models.game.post_model import PostListEnvelope
+from tests.client.conftest import StubResponse
+from tests.fixtures.allure_helpers import step
+
+ROOM_ID = "room-1"
+TOPIC_ID = "topic-1"
+
+
+@pytest.mark.regression
+def test_list_envelope_is_validated_from_raw_bytes(stub_api):
+    with step("Serve a page of posts"):
+        posts = [{"id": f"post-{index}", "created": "2024-01-01T00:00:00Z"} for index in range(50)]
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", payload={"resources": posts, "paging": {"pages": 1}})
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Get posts"):
+        envelope = post_api.get_posts(room_id=ROOM_ID)
+    with step("Verify the envelope was fully parsed"):
+        assert isinstance(envelope, PostListEnvelope)
+        assert [post.id for post in envelope.resources] == [post["id"] for post in posts]
+        assert envelope.paging.pages == 1
+
+
+@pytest.mark.regression
+def test_non_json_body_keeps_raw_fallback(stub_api):
+    with step("Serve a plain-text topic body"):
+        stub_api.add("GET", f"/v1/topics/{TOPIC_ID}", StubResponse(body=b"upstream says hi"))
+        topic_api = TopicController(base_url=stub_api.base_url, auth_token="token")
+    with step("Get the topic"):
+        envelope = topic_api.get_topic(id=TOPIC_ID)
+    with step("Verify the text surfaced through the raw field"):
+        assert envelope.resource is None
+        assert envelope.model_extra == {"raw": "upstream says hi"}
+
+
+@pytest.mark.regression
+def test_schema_errors_are_not_masked_by_fallback(stub_api):
+    with step("Serve posts with a malformed resources field"):
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", payload={"resources": "not-a-list"})
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Verify validation still fails"), pytest.raises(ValidationError):
+        post_api.get_posts(room_id=ROOM_ID)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.api.controllers.game.post_controller import AsyncPostApi, PostApi
+from tests.client.conftest import RecordedRequest, StubResponse
+from tests.fixtures.allure_helpers import step
+
+ROOM_ID = "room-1"
+TOTAL_POSTS = 23
+DEFAULT_SIZE = 5
+
+
+class PagedPosts:
+    """
+    Serves ``TOTAL_POSTS`` posts by ``skip``/``size``, capped at ``max_size``, and tracks how many pages are in flight.
+    """
+
+    def __init__(self, delay: float = 0.0, max_size: int | None = None):
+        self.delay = delay
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+
+    def __call__(self, request: RecordedRequest) -> StubResponse:
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            time.sleep(self.delay)
+            skip = int(request.query.get("skip", ["0"])[0])
+            size = int(request.query.get("size", [str(DEFAULT_SIZE)])[0])
+            size = min(size, self.max_size or size)
+            posts = [{"id": f"post-{index}"} for index in range(skip, min(skip + size, TOTAL_POSTS))]
+            pages = -(-TOTAL_POSTS // size)
+            return StubResponse.json({"resources": posts, "paging": {"pages": pages, "size": size}})
+        finally:
+            with self._lock:
+                self._active -= 1
+
+
+@pytest.mark.regression
+def test_iter_posts_yields_every_page_in_order(stub_api):
+    with step("Serve posts in pages of the server default size"):
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", PagedPosts())
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Iterate over all posts"):
+        post_ids = [post.id for post in post_api.iter_posts(room_id=ROOM_ID)]
+    with step("Verify posts arrive in order and later pages pin the default size"):
+        assert post_ids == [f"post-{index}" for index in range(TOTAL_POSTS)]
+        calls = stub_api.calls("GET", f"/v1/rooms/{ROOM_ID}/posts")
+        assert sorted(int(call.query["skip"][0]) for call in calls) == list(range(0, TOTAL_POSTS, DEFAULT_SIZE))
+        assert all(call.query["size"] == [str(DEFAULT_SIZE)] for call in calls[1:])
+
+
+@pytest.mark.regression
+def test_iter_posts_follows_the_page_size_the_server_served(stub_api):
+    with step("Serve posts in pages capped below the requested size"):
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", PagedPosts(max_size=DEFAULT_SIZE))
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Iterate over all posts asking for pages of ten"):
+        post_ids = [post.id for post in post_api.iter_posts(room_id=ROOM_ID, size=10)]
+    with step("Verify no post was skipped and later pages use the served size"):
+        assert post_ids == [f"post-{index}" for index in range(TOTAL_POSTS)]
+        calls = stub_api.calls("GET", f"/v1/rooms/{ROOM_ID}/posts")
+        assert sorted(int(call.query["skip"][0]) for call in calls) == list(range(0, TOTAL_POSTS, DEFAULT_SIZE))
+        assert all(call.query["size"] == [str(DEFAULT_SIZE)] for call in calls[1:])
+
+
+@pytest.mark.regression
+def test_iter_posts_prefetches_within_window(stub_api):
+    with step("Serve slow pages of two posts"):
+        pages = PagedPosts(delay=0.1)
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", pages)
+        post_api = PostApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Iterate with a window of three pages"):
+        post_ids = [post.id for post in post_api.iter_posts(room_id=ROOM_ID, size=2, window=3)]
+    with step("Verify pages overlapped but never exceeded the window"):
+        assert len(post_ids) == TOTAL_POSTS
+        assert pages.max_active == 3
+
+
+@pytest.mark.regression
+def test_async_iter_posts_yields_every_page_in_order(stub_api):
+    with step("Serve posts in pages"):
+        stub_api.add("GET", f"/v1/rooms/{ROOM_ID}/posts", PagedPosts())
+
+    async def collect() -> list[str]:
+        post_api = AsyncPostApi(base_url=stub_api.base_url, auth_token="token")
+        post_ids = [post.id async for post in post_api.iter_posts(room_id=ROOM_ID, size=4)]
+        await AsyncPostApi.close_all_clients()
+        return post_ids
+
+    with step("Iterate over all posts through the async controller"):
+        post_ids = asyncio.run(collect())
+    with step("Verify posts arrive in order"):
+        assert post_ids == [f"post-{index}" for index in range(TOTAL_POSTS)]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.game.game_controller import GameApi
+from src.api.metrics import PoolRecorder, pool_metrics
+from tests.client.conftest import StubResponse
+from tests.fixtures.allure_helpers import step
+
+GAME_ID = "game-1"
+RESPONSE_DELAY = 0.05
+
+
+@pytest.fixture(scope="function")
+def pool_env(monkeypatch):
+    previous = BaseController.coalesce_gets
+    BaseController.coalesce_gets = False
+    BaseController.close_all_sessions()
+    pool_metrics.reset()
+    yield monkeypatch
+    BaseController.coalesce_gets = previous
+    BaseController.close_all_sessions()
+    pool_metrics.reset()
+
+
+def _concurrent_gets(stub_api, calls: int) -> None:
+    response = replace(StubResponse.json({"resource": {"id": GAME_ID}}), delay=RESPONSE_DELAY)
+    stub_api.add("GET", f"/v1/games/{GAME_ID}", response)
+    game_api = GameApi(base_url=stub_api.base_url, auth_token="token")
+    with ThreadPoolExecutor(max_workers=calls) as executor:
+        list(executor.map(lambda _: game_api.get_game(id=GAME_ID), range(calls)))
+
+
+@pytest.mark.regression
+def test_pool_reports_waits_and_connection_reuse(stub_api, pool_env):
+    with step("Run six concurrent calls through a pool of two connections"):
+        pool_env.setenv("DM_HTTP_POOL_MAXSIZE", "2")
+        _concurrent_gets(stub_api, calls=6)
+    with step("Verify queued callers were counted as pool waits"):
+        stats = pool_metrics.stats(stub_api.base_url)
+        assert stats.maxsize == 2
+        assert stats.checkouts == 6
+        assert stats.waits >= 3
+        assert stats.wait_seconds >= RESPONSE_DELAY
+        assert stats.grown == 0
+    with step("Verify two connections were opened and then reused"):
+        assert stats.new_connections == 2
+        assert stats.reused_connections == 4
+        assert stats.peak_in_use == 2
+        assert stats.in_use == 0
+    with step("Verify worker reports merge into one"):
+        merged = PoolRecorder()
+        merged.merge(PoolRecorder.from_dict(pool_metrics.to_dict()))
+        merged.merge(pool_metrics)
+        assert merged.stats(stub_api.base_url).checkouts == 12
+
+
+@pytest.mark.regression
+def test_adaptive_pool_grows_to_concurrency_up_to_cap(stub_api, pool_env):
+    with step("Run eight concurrent calls through an adaptive pool of one connection capped at four"):
+        pool_env.setenv("DM_HTTP_POOL_MAXSIZE", "1")
+        pool_env.setenv("DM_HTTP_POOL_ADAPTIVE", "1")
+        pool_env.setenv("DM_HTTP_POOL_MAXSIZE_CAP", "4")
+        _concurrent_gets(stub_api, calls=8)
+    with step("Verify the pool grew to the cap and only waited beyond it"):
+        stats = pool_metrics.stats(stub_api.base_url)
+        assert stats.maxsize == 4
+        assert stats.grown == 3
+        assert stats.new_connections == 4
+        assert stats.peak_in_use == 4
+        assert 0 < stats.waits <= 4
+        assert stats.in_use == 0
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.game.game_controller import GameApi
+from src.api.rate_limit import RateLimiter, RateLimitRule, SharedTokenBucket, parse_rules
+from tests.fixtures.allure_helpers import step
+
+GAME_ID = "game-1"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _reserve_many(path: str, count: int) -> float:
+    bucket = SharedTokenBucket(path, rate=20, burst=1)
+    started = time.monotonic()
+    for _ in range(count):
+        time.sleep(bucket.reserve())
+    return time.monotonic() - started
+
+
+@pytest.fixture(scope="function")
+def controller_rate_limiter(tmp_path):
+    previous = BaseController.rate_limiter
+    BaseController.rate_limiter = RateLimiter([RateLimitRule(prefix="", rate=20, burst=1)], tmp_path)
+    yield BaseController.rate_limiter
+    BaseController.rate_limiter = previous
+
+
+@pytest.mark.regression
+def test_bucket_allows_burst_then_spaces_requests(tmp_path):
+    with step("Create a 10 rps bucket with a burst of 3"):
+        clock = FakeClock()
+        bucket = SharedTokenBucket(tmp_path / "bucket", rate=10, burst=3, clock=clock)
+    with step("Reserve six tokens at the same instant"):
+        delays = [bucket.reserve() for _ in range(6)]
+    with step("Verify the burst is free and the rest queue 100 ms apart"):
+        assert delays == pytest.approx([0, 0, 0, 0.1, 0.2, 0.3])
+    with step("Verify the bucket refills over time but never above the burst"):
+        clock.now += 60
+        assert [bucket.reserve() for _ in range(4)] == pytest.approx([0, 0, 0, 0.1])
+
+
+@pytest.mark.regression
+def test_bucket_state_is_shared_between_processes(tmp_path):
+    with step("Reserve five tokens from each of two processes on one 20 rps bucket"):
+        path = str(tmp_path / "shared.bucket")
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(2) as pool:
+            elapsed = pool.starmap(_reserve_many, [(path, 5), (path, 5)])
+    with step("Verify the processes drew from one budget"):
+        assert max(elapsed) >= (10 - 1) / 20 * 0.9
+
+
+@pytest.mark.regression
+def test_rules_match_longest_route_prefix(tmp_path):
+    with step("Configure a global limit and per-family limits"):
+        limiter = RateLimiter(parse_rules("/v1/account=2:1,/v1/account/login=1:1"), tmp_path)
+        limiter.rules.append(RateLimitRule(prefix="", rate=100, burst=100))
+    with step("Verify each route maps to the global rule plus its most specific family"):
+        assert [rule.prefix for rule in limiter._matching_rules("/v1/account/login")] == ["", "/v1/account/login"]
+        assert [rule.prefix for rule in limiter._matching_rules("/v1/account/password")] == ["", "/v1/account"]
+        assert [rule.prefix for rule in limiter._matching_rules("/v1/games/{id}")] == [""]
+    with step("Verify malformed rules and non-positive rates or bursts are rejected"):
+        for spec in ("v1/games", "/v1/games=fast", "/x=0:5", "/x=-2", "/x=5:0", "/x=5:-1"):
+            with pytest.raises(ValueError, match="Invalid rate limit rule"):
+                parse_rules(spec)
+
+
+@pytest.mark.regression
+def test_controller_requests_are_throttled(stub_api, controller_rate_limiter):
+    with step("Register game endpoint"):
+        stub_api.add("GET", f"/v1/games/{GAME_ID}", payload={"resource": {"id": GAME_ID}})
+        game_api = GameApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Get the game five times under a 20 rps limit"):
+        started = time.monotonic()
+        for _ in range(5):
+            game_api.get_game(id=GAME_ID)
+        elapsed = time.monotonic() - started
+    with step("Verify requests were spaced by the limiter"):
+        assert elapsed >= (5 - 1) / 20 * 0.9
+        assert len(stub_api.calls("GET", f"/v1/games/{GAME_ID}")) == 5
+
+
+@pytest.mark.regression
+def test_async_acquire_reserves_off_the_event_loop(tmp_path):
+    with step("Acquire from a coroutine on a limiter that records the reserving thread"):
+        limiter = RateLimiter([RateLimitRule(prefix="", rate=20, burst=1)], tmp_path)
+        reserving_threads = []
+        delay_for = limiter.delay_for
+
+        def recording_delay_for(base_url: str, route: str) -> float:
+            reserving_threads.append(threading.current_thread())
+            return delay_for(base_url, route)
+
+        limiter.delay_for = recording_delay_for
+
+        async def acquire_twice() -> threading.Thread:
+            await limiter.acquire_async("http://dm.local", "/v1/games/{id}")
+            await limiter.acquire_async("http://dm.local", "/v1/games/{id}")
+            return threading.current_thread()
+
+        loop_thread = asyncio.run(acquire_twice())
+    with step("Verify the file-locked reservation never ran on the loop thread"):
+        assert len(reserving_threads) == 2
+        assert loop_thread not in reserving_threads
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import requests
+
+from src.api.auth import StoredCredentials, TokenStore
+from src.api.controllers.game.game_controller import AsyncGameApi, GameApi
+from tests.client.conftest import RecordedRequest, StubResponse
+from tests.fixtures.allure_helpers import step
+
+LOGIN = "autotest_user"
+GAMES = 8
+
+
+class FakeLogin:
+    """Issues numbered tokens; the stub only accepts the latest one."""
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.current = "token-0"
+        self.logins = 0
+
+    def __call__(self) -> str:
+        with self._lock:
+            self.logins += 1
+            self.current = f"token-{next(self._ids)}"
+            return self.current
+
+    def handler(self, game_id: str):
+        def handle(request: RecordedRequest) -> StubResponse:
+            if request.headers.get("X-Dm-Auth-Token") != self.current:
+                return StubResponse.json({"message": "Unauthorized"}, status=401)
+            return StubResponse.json({"resource": {"id": game_id}})
+
+        return handle
+
+
+@pytest.fixture(scope="function")
+def fake_login(stub_api) -> FakeLogin:
+    login = FakeLogin()
+    for index in range(GAMES):
+        stub_api.add("GET", f"/v1/games/game-{index}", login.handler(f"game-{index}"))
+    return login
+
+
+@pytest.fixture(scope="function")
+def credentials(tmp_path, stub_api, fake_login) -> StoredCredentials:
+    store = TokenStore(stub_api.base_url, directory=tmp_path)
+    store.put(LOGIN, "expired-token")
+    return StoredCredentials(store, LOGIN, fake_login)
+
+
+@pytest.mark.regression
+def test_concurrent_401s_refresh_once_and_replay(stub_api, fake_login, credentials):
+    with step("Create a controller whose stored token the server no longer accepts"):
+        game_api = GameApi(base_url=stub_api.base_url, credentials=credentials)
+        assert game_api.auth_token == "expired-token"
+    with step(f"Get {GAMES} games from parallel threads"):
+        barrier = threading.Barrier(GAMES)
+
+        def get_game(index: int) -> str:
+            barrier.wait()
+            return game_api.get_game(id=f"game-{index}").resource.id
+
+        with ThreadPoolExecutor(max_workers=GAMES) as executor:
+            games = list(executor.map(get_game, range(GAMES)))
+    with step("Verify every request was replayed after a single re-login"):
+        assert games == [f"game-{index}" for index in range(GAMES)]
+        assert fake_login.logins == 1
+        assert game_api.auth_token == "token-1"
+        assert credentials.store.peek(LOGIN).token == "token-1"
+
+
+@pytest.mark.regression
+def test_async_controller_replays_after_refresh(stub_api, fake_login, credentials):
+    with step("Get a game through the async controller with a rejected token"):
+        game_api = AsyncGameApi(base_url=stub_api.base_url, credentials=credentials)
+
+        async def get_game() -> str:
+            try:
+                return (await game_api.get_game(id="game-0")).resource.id
+            finally:
+                await AsyncGameApi.close_all_clients()
+
+        game_id = asyncio.run(get_game())
+    with step("Verify the request was replayed with the refreshed token"):
+        assert game_id == "game-0"
+        assert fake_login.logins == 1
+        tokens = [call.headers.get("X-Dm-Auth-Token") for call in stub_api.calls("GET", "/v1/games/game-0")]
+        assert tokens == ["expired-token", "token-1"]
+
+
+@pytest.mark.regression
+def test_401_is_raised_when_refresh_does_not_help(stub_api, fake_login, tmp_path):
+    with step("Create controllers without credentials and with a login that keeps failing"):
+        store = TokenStore(stub_api.base_url, directory=tmp_path)
+        store.put(LOGIN, "expired-token")
+        failing = StoredCredentials(store, LOGIN, lambda: None)
+        plain_api = GameApi(base_url=stub_api.base_url, auth_token="expired-token")
+        failing_api = GameApi(base_url=stub_api.base_url, credentials=failing)
+    with step("Verify both surface the 401 after at most one attempt each"):
+        for game_api in (plain_api, failing_api):
+            with pytest.raises(requests.HTTPError) as exc_info:
+                game_api.get_game(id="game-0")
+            assert exc_info.value.response.status_code == 401
+        assert len(stub_api.calls("GET", "/v1/games/game-0")) == 2
+    with step("Verify the async twin raises the same status"):
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            asyncio.run(AsyncGameApi(base_url=stub_api.base_url, auth_token="expired-token").get_game(id="game-0"))
+        assert exc_info.value.response.status_code == 401
+
+
+@pytest.mark.regression
+def test_explicit_token_of_the_caller_is_not_replaced(stub_api, fake_login, credentials):
+    with step("Get a game with a token the caller passed explicitly"):
+        game_api = GameApi(base_url=stub_api.base_url, credentials=credentials)
+        with pytest.raises(requests.HTTPError) as exc_info:
+            game_api._get("/v1/games/game-0", headers={"X-Dm-Auth-Token": "caller-token"})
+    with step("Verify the 401 surfaced without a re-login or a replay under the session user"):
+        assert exc_info.value.response.status_code == 401
+        assert fake_login.logins == 0
+        tokens = [call.headers.get("X-Dm-Auth-Token") for call in stub_api.calls("GET", "/v1/games/game-0")]
+        assert tokens == ["caller-token"]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from src.api.controllers.game.game_controller import GameApi
+from tests.client.conftest import StubResponse
+from tests.fixtures.allure_helpers import step
+from tests.fixtures.reaper import ResourceReaper
+
+DELETE_DELAY = 0.2
+
+
+@pytest.fixture(scope="function")
+def reaper() -> ResourceReaper:
+    reaper = ResourceReaper(workers=4)
+    yield reaper
+    reaper._executor.shutdown(wait=True)
+
+
+@pytest.mark.regression
+def test_deletions_run_in_background_until_flush(stub_api, reaper):
+    with step("Register four slow game deletions"):
+        game_api = GameApi(base_url=stub_api.base_url, auth_token="token")
+        started = time.monotonic()
+        for index in range(4):
+            stub_api.add("DELETE", f"/v1/games/game-{index}", StubResponse(status=200, delay=DELETE_DELAY))
+            reaper.register(f"game {index}", game_api.delete_game, id=f"game-{index}")
+        registered = time.monotonic() - started
+    with step("Verify registering did not wait for the deletions"):
+        assert registered < DELETE_DELAY
+    with step("Verify flush waits for all of them, which ran in parallel"):
+        reaper.flush()
+        assert reaper.reaped == 4
+        assert time.monotonic() - started < DELETE_DELAY * 3
+        assert all(len(stub_api.calls("DELETE", f"/v1/games/game-{index}")) == 1 for index in range(4))
+
+
+@pytest.mark.regression
+def test_gone_resources_are_tolerated_and_errors_reported(stub_api, reaper):
+    with step("Register deletions answered with 403, 404, 410 and 500"):
+        game_api = GameApi(base_url=stub_api.base_url, auth_token="token")
+        for status in (403, 404, 410, 500):
+            stub_api.add("DELETE", f"/v1/games/game-{status}", status=status)
+            reaper.register(f"game {status}", game_api.delete_game, id=f"game-{status}")
+    with step("Verify flush raises only the unexpected failure"):
+        with pytest.raises(ExceptionGroup, match="game 500") as exc_info:
+            reaper.flush()
+        assert [error.response.status_code for error in exc_info.value.exceptions] == [500]
+        assert reaper.reaped == 3
+    with step("Verify reported failures are not raised twice"):
+        reaper.flush()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+import requests
+
+from src.api.cache import response_cache
+from src.api.controllers.forum.topic_controller import AsyncTopicController, TopicController
+from src.api.controllers.game.room_controller import RoomApi
+from tests.fixtures.allure_helpers import step
+
+TOPIC_ID = "topic-1"
+GAME_ID = "game-1"
+
+
+@pytest.fixture(scope="function")
+def enabled_response_cache():
+    previous = response_cache.enabled
+    response_cache.clear()
+    response_cache.enabled = True
+    yield response_cache
+    response_cache.enabled = previous
+    response_cache.clear()
+
+
+@pytest.mark.regression
+def test_get_topic_is_served_from_cache_until_put_topic(stub_api, enabled_response_cache):
+    with step("Register topic endpoints"):
+        stub_api.add("GET", f"/v1/topics/{TOPIC_ID}", payload={"resource": {"id": TOPIC_ID, "title": "old"}})
+        stub_api.add("PATCH", f"/v1/topics/{TOPIC_ID}", payload={"resource": {"id": TOPIC_ID, "title": "new"}})
+        topic_api = TopicController(base_url=stub_api.base_url, auth_token="token")
+    with step("Read the topic twice"):
+        first = topic_api.get_topic(id=TOPIC_ID)
+        second = topic_api.get_topic(id=TOPIC_ID)
+    with step("Verify the second read did not reach the server"):
+        assert second is first
+        assert len(stub_api.calls("GET", f"/v1/topics/{TOPIC_ID}")) == 1
+    with step("Update topic and read it again"):
+        topic_api.put_topic(id=TOPIC_ID, payload={"title": "new"})
+        topic_api.get_topic(id=TOPIC_ID)
+    with step("Verify the update evicted the cached topic"):
+        assert len(stub_api.calls("GET", f"/v1/topics/{TOPIC_ID}")) == 2
+
+
+@pytest.mark.regression
+def test_cache_key_includes_auth_token(stub_api, enabled_response_cache):
+    with step("Register topic endpoint"):
+        stub_api.add("GET", f"/v1/topics/{TOPIC_ID}", payload={"resource": {"id": TOPIC_ID}})
+    with step("Read the topic as two users"):
+        TopicController(base_url=stub_api.base_url, auth_token="first").get_topic(id=TOPIC_ID)
+        TopicController(base_url=stub_api.base_url, auth_token="second").get_topic(id=TOPIC_ID)
+    with step("Verify both reads reached the server"):
+        assert len(stub_api.calls("GET", f"/v1/topics/{TOPIC_ID}")) == 2
+
+
+@pytest.mark.regression
+def test_post_room_evicts_get_rooms(stub_api, enabled_response_cache):
+    with step("Register room endpoints"):
+        stub_api.add("GET", f"/v1/games/{GAME_ID}/rooms", payload={"resources": []})
+        stub_api.add("POST", f"/v1/games/{GAME_ID}/rooms", payload={"resource": {"id": "room-1"}})
+        room_api = RoomApi(base_url=stub_api.base_url, auth_token="token")
+    with step("List rooms, create a room, list rooms again"):
+        room_api.get_rooms(game_id=GAME_ID)
+        room_api.get_rooms(game_id=GAME_ID)
+        room_api.post_room(game_id=GAME_ID, payload={"title": "room"})
+        room_api.get_rooms(game_id=GAME_ID)
+    with step("Verify only the read after the write reached the server again"):
+        assert len(stub_api.calls("GET", f"/v1/games/{GAME_ID}/rooms")) == 2
+
+
+@pytest.mark.regression
+def test_failed_delete_still_invalidates(stub_api, enabled_response_cache):
+    with step("Register topic read and a failing delete"):
+        stub_api.add("GET", f"/v1/topics/{TOPIC_ID}", payload={"resource": {"id": TOPIC_ID}})
+        stub_api.add("DELETE", f"/v1/topics/{TOPIC_ID}", status=500)
+        topic_api = TopicController(base_url=stub_api.base_url, auth_token="token")
+    with step("Read, fail to delete, read again"):
+        topic_api.get_topic(id=TOPIC_ID)
+        with pytest.raises(requests.HTTPError):
+            topic_api.delete_topic(id=TOPIC_ID)
+        topic_api.get_topic(id=TOPIC_ID)
+    with step("Verify the cached topic was evicted"):
+        assert len(stub_api.calls("GET", f"/v1/topics/{TOPIC_ID}")) == 2
+
+
+@pytest.mark.regression
+def test_async_twin_uses_the_same_policy(stub_api, enabled_response_cache):
+    with step("Register topic endpoint"):
+        stub_api.add("GET", f"/v1/topics/{TOPIC_ID}", payload={"resource": {"id": TOPIC_ID}})
+
+    async def read_twice() -> None:
+        topic_api = AsyncTopicController(base_url=stub_api.base_url, auth_token="token")
+        await topic_api.get_topic(id=TOPIC_ID)
+        await topic_api.get_topic(id=TOPIC_ID)
+        await AsyncTopicController.close_all_clients()
+
+    with step("Read the topic twice through the async controller"):
+        asyncio.run(read_twice())
+    with step("Verify one request reached the server"):
+        assert len(stub_api.calls("GET", f"/v1/topics/{TOPIC_ID}")) == 1
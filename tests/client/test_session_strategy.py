@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.game.game_controller import GameApi
+from src.api.transport import select_session_strategy
+from tests.client.conftest import StubResponse
+from tests.fixtures.allure_helpers import step
+
+THREADS = 64
+CALLS_PER_THREAD = 5
+RESPONSE_DELAY = 0.005
+ROUNDS = 3
+
+
+@pytest.fixture(scope="function")
+def thread_local_sessions():
+    previous = BaseController.session_strategy, BaseController.coalesce_gets
+    BaseController.session_strategy = "thread_local"
+    BaseController.coalesce_gets = False
+    BaseController.close_all_sessions()
+    yield
+    BaseController.session_strategy, BaseController.coalesce_gets = previous
+    BaseController.close_all_sessions()
+
+
+def _register_games(stub_api) -> None:
+    for index in range(THREADS):
+        game_id = f"game-{index}"
+        response = replace(StubResponse.json({"resource": {"id": game_id}}), delay=RESPONSE_DELAY)
+        stub_api.add("GET", f"/v1/games/{game_id}", response)
+
+
+def _hammer(base_url: str) -> tuple[float, dict[int, set[str]], set[int], set[int]]:
+    """Run ``THREADS`` workers, each fetching its own game; return elapsed time, ids seen, sessions and adapters."""
+    seen: dict[int, set[str]] = {}
+    sessions: set[int] = set()
+    adapters: set[int] = set()
+    lock = threading.Lock()
+    barrier = threading.Barrier(THREADS)
+
+    def worker(index: int) -> None:
+        game_api = GameApi(base_url=base_url, auth_token="token")
+        barrier.wait()
+        ids = {game_api.get_game(id=f"game-{index}").resource.id for _ in range(CALLS_PER_THREAD)}
+        with lock:
+            seen[index] = ids
+            sessions.add(id(game_api._session))
+            adapters.add(id(game_api._session.get_adapter(base_url)))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(worker, range(THREADS)))
+    return time.perf_counter() - started, seen, sessions, adapters
+
+
+@pytest.mark.regression
+def test_thread_local_sessions_share_one_pool(stub_api, thread_local_sessions):
+    with step(f"Fetch {THREADS} games from {THREADS} threads"):
+        _register_games(stub_api)
+        _, seen, sessions, adapters = _hammer(stub_api.base_url)
+    with step("Verify every thread got only its own game back"):
+        assert seen == {index: {f"game-{index}"} for index in range(THREADS)}
+        assert len(stub_api.requests) == THREADS * CALLS_PER_THREAD
+    with step("Verify each thread had its own session over one shared adapter"):
+        assert len(sessions) == THREADS
+        assert adapters == {id(BaseController._get_or_create_adapter(stub_api.base_url))}
+        assert len(BaseController._get_or_create_adapter(stub_api.base_url).poolmanager.pools) == 1
+
+
+@pytest.mark.regression
+def test_thread_local_throughput_keeps_up_with_shared_session(stub_api):
+    with step("Run the same load with both session strategies"):
+        _register_games(stub_api)
+        previous = BaseController.session_strategy, BaseController.coalesce_gets
+        BaseController.coalesce_gets = False
+        elapsed = {}
+        try:
+            for strategy in ("shared", "thread_local") * ROUNDS:
+                BaseController.session_strategy = strategy
+                BaseController.close_all_sessions()
+                duration, seen, _, _ = _hammer(stub_api.base_url)
+                assert seen == {index: {f"game-{index}"} for index in range(THREADS)}
+                elapsed[strategy] = min(duration, elapsed.get(strategy, duration))
+        finally:
+            BaseController.session_strategy, BaseController.coalesce_gets = previous
+            BaseController.close_all_sessions()
+    with step("Verify per-thread sessions do not cost throughput"):
+        calls = THREADS * CALLS_PER_THREAD
+        assert calls / elapsed["thread_local"] >= 0.5 * calls / elapsed["shared"], elapsed
+
+
+@pytest.mark.regression
+def test_closing_sessions_rebuilds_thread_sessions(stub_api):
+    with step("Get a thread-local session, then close all sessions"):
+        base_url = stub_api.base_url
+        before = BaseController._get_or_create_thread_session(base_url)
+        assert BaseController._get_or_create_thread_session(base_url) is before
+        BaseController.close_all_sessions()
+    with step("Verify the thread gets a fresh session on the new shared adapter"):
+        after = BaseController._get_or_create_thread_session(base_url)
+        assert after is not before
+        assert after.get_adapter(base_url) is BaseController._get_or_create_adapter(base_url)
+    with step("Verify unknown strategies are rejected"), pytest.raises(ValueError, match="Unknown HTTP session"):
+        select_session_strategy("per_request")
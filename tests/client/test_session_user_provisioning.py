@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from tests.fixtures import api
+from tests.fixtures.allure_helpers import step
+from tests.fixtures.api import SessionUser, _leased_session_users
+
+ACTIVATION_DELAY = 0.3
+
+
+def _slow_user(_configs, _login_api, _account_api, prefix: str) -> SessionUser:
+    time.sleep(ACTIVATION_DELAY)
+    if prefix == "broken":
+        pytest.fail("Could not activate user broken")
+    return SessionUser(login=prefix, password="secret", email=f"{prefix}@example.com", token=f"{prefix}-token")
+
+
+@pytest.fixture(scope="function")
+def slow_registration(monkeypatch) -> None:
+    monkeypatch.setattr(api, "_create_active_session_user", _slow_user)
+
+
+@pytest.mark.regression
+def test_module_users_are_created_concurrently(slow_registration):
+    with step("Create three module users that each take one activation round trip"):
+        started = time.monotonic()
+        with _leased_session_users(None, None, None, None, prefixes=("forum", "forum_alt", "forum_third")) as users:
+            elapsed = time.monotonic() - started
+    with step("Verify users come back in prefix order after roughly one round trip"):
+        assert [user.login for user in users] == ["forum", "forum_alt", "forum_third"]
+        assert elapsed < ACTIVATION_DELAY * 2
+
+
+@pytest.mark.regression
+def test_failed_user_releases_the_obtained_ones(monkeypatch):
+    with step("Lease users for a module whose second user cannot be created"):
+        released = []
+
+        @contextmanager
+        def leased_session_user(_user_pool, configs, login_api, account_api, prefix: str):
+            user = _slow_user(configs, login_api, account_api, prefix)
+            try:
+                yield user
+            finally:
+                released.append(user.login)
+
+        monkeypatch.setattr(api, "_leased_session_user", leased_session_user)
+        with (
+            pytest.raises(pytest.fail.Exception, match="broken"),
+            _leased_session_users(None, None, None, None, prefixes=("forum", "broken", "forum_alt")),
+        ):
+            pass
+    with step("Verify the users that were obtained are released before the error propagates"):
+        assert sorted(released) == ["forum", "forum_alt"]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from src.api.concurrency import SingleFlight
+from src.api.controllers.base_controller import BaseController
+from src.api.controllers.game.game_controller import GameApi
+from tests.client.conftest import StubResponse
+from tests.fixtures.allure_helpers import step
+
+GAME_ID = "game-1"
+CALLERS = 16
+
+
+@pytest.fixture(scope="function")
+def coalescing():
+    previous = BaseController.coalesce_gets
+    BaseController.coalesce_gets = True
+    yield
+    BaseController.coalesce_gets = previous
+
+
+def _call_concurrently(function, callers: int = CALLERS) -> list:
+    barrier = threading.Barrier(callers)
+
+    def call(_index: int):
+        barrier.wait()
+        try:
+            return function()
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        return list(executor.map(call, range(callers)))
+
+
+@pytest.mark.regression
+def test_identical_concurrent_gets_share_one_request(stub_api, coalescing):
+    with step("Register a slow game endpoint"):
+        response = StubResponse.json({"resource": {"id": GAME_ID}})
+        response.delay = 0.3
+        stub_api.add("GET", f"/v1/games/{GAME_ID}", response)
+        game_api = GameApi(base_url=stub_api.base_url, auth_token="token")
+    with step(f"Get the same game from {CALLERS} threads at once"):
+        results = _call_concurrently(lambda: game_api.get_game(id=GAME_ID))
+    with step("Verify all callers got the game from a single request"):
+        assert all(result.resource.id == GAME_ID for result in results)
+        assert len(stub_api.calls("GET", f"/v1/games/{GAME_ID}")) == 1
+
+
+@pytest.mark.regression
+def test_gets_with_different_tokens_are_not_coalesced(stub_api, coalescing):
+    with step("Register a slow game endpoint"):
+        response = StubResponse.json({"resource": {"id": GAME_ID}})
+        response.delay = 0.3
+        stub_api.add("GET", f"/v1/games/{GAME_ID}", response)
+        apis = [GameApi(base_url=stub_api.base_url, auth_token=f"token-{index}") for index in range(2)]
+    with step("Get the game concurrently with two tokens"):
+        counter = iter(range(2 * CALLERS))
+        lock = threading.Lock()
+
+        def get_game():
+            with lock:
+                index = next(counter)
+            return apis[index % 2].get_game(id=GAME_ID)
+
+        _call_concurrently(get_game, callers=2 * CALLERS)
+    with step("Verify one request per token"):
+        tokens = {call.headers["X-Dm-Auth-Token"] for call in stub_api.calls("GET", f"/v1/games/{GAME_ID}")}
+        assert len(stub_api.calls("GET", f"/v1/games/{GAME_ID}")) == 2
+        assert tokens == {"token-0", "token-1"}
+
+
+@pytest.mark.regression
+def test_coalesced_callers_share_http_error(stub_api, coalescing):
+    with step("Register a slow failing game endpoint"):
+        stub_api.add("GET", f"/v1/games/{GAME_ID}", StubResponse(status=410, delay=0.3))
+        game_api = GameApi(base_url=stub_api.base_url, auth_token="token")
+    with step("Get the missing game from many threads"):
+        results = _call_concurrently(lambda: game_api.get_game(id=GAME_ID))
+    with step("Verify every caller saw the 410"):
+        assert all(isinstance(result, requests.HTTPError) for result in results)
+        assert {result.response.status_code for result in results} == {410}
+        assert len(stub_api.calls("GET", f"/v1/games/{GAME_ID}")) == 1
+
+
+@pytest.mark.regression
+def test_single_flight_forgets_completed_keys():
+    with step("Run the same key twice sequentially"):
+        flight = SingleFlight()
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+    with step("Verify both calls executed"):
+        assert flight.executed == 2
+        assert flight.coalesced == 0
+        assert flight.in_flight() == 0
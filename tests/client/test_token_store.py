@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.api.auth import TokenStore
+from tests.fixtures.allure_helpers import step
+
+BASE_URL = "http://dm.local"
+LOGIN = "autotest_user"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeLogin:
+    """Issues numbered tokens and counts logins."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.logins = 0
+
+    def __call__(self) -> str:
+        time.sleep(self.delay)
+        with self._lock:
+            self.logins += 1
+            return f"token-{next(self._ids)}"
+
+
+@pytest.mark.regression
+def test_token_is_reused_until_max_age(tmp_path):
+    with step("Create a store with a 60 second token lifetime"):
+        clock, login = FakeClock(), FakeLogin()
+        store = TokenStore(BASE_URL, directory=tmp_path, max_age=60, clock=clock)
+    with step("Get the token for one login from many tests"):
+        tokens = [store.get(LOGIN, login) for _ in range(10)]
+    with step("Verify only the first call logged in"):
+        assert tokens == ["token-1"] * 10
+        assert login.logins == 1
+    with step("Verify a token past its lifetime is re-issued"):
+        clock.now += 61
+        assert store.get(LOGIN, login) == "token-2"
+        assert store.peek(LOGIN).issued_at == clock.now
+
+
+@pytest.mark.regression
+def test_store_is_shared_between_instances(tmp_path):
+    with step("Issue a token through one store instance"):
+        login = FakeLogin()
+        TokenStore(BASE_URL, directory=tmp_path).get(LOGIN, login)
+    with step("Verify a second instance on the same directory reuses it"):
+        assert TokenStore(BASE_URL, directory=tmp_path).get(LOGIN, login) == "token-1"
+        assert login.logins == 1
+    with step("Verify stores for another base url are separate"):
+        assert TokenStore("http://other.local", directory=tmp_path).peek(LOGIN) is None
+
+
+@pytest.mark.regression
+def test_concurrent_refresh_of_rejected_token_logs_in_once(tmp_path):
+    with step("Store a token and let eight workers see it rejected at once"):
+        login = FakeLogin(delay=0.05)
+        stores = [TokenStore(BASE_URL, directory=tmp_path) for _ in range(2)]
+        rejected = stores[0].get(LOGIN, login)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            refreshed = list(executor.map(lambda index: stores[index % 2].refresh(LOGIN, rejected, login), range(8)))
+    with step("Verify a single re-login served every worker"):
+        assert refreshed == ["token-2"] * 8
+        assert login.logins == 2
+    with step("Verify a failed re-login drops the stored token"):
+        stores[0].refresh(LOGIN, "token-2", lambda: None)
+        assert stores[1].peek(LOGIN) is None
+
+
+@pytest.mark.regression
+def test_slow_login_does_not_block_other_logins_or_reads(tmp_path):
+    with step("Store a token for one login and start a slow login for another"):
+        store = TokenStore(BASE_URL, directory=tmp_path)
+        store.put("reader", "token-0")
+        slow, started = FakeLogin(delay=0.5), threading.Event()
+
+        def slow_login() -> str:
+            started.set()
+            return slow()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pending = executor.submit(store.get, LOGIN, slow_login)
+            started.wait(timeout=5)
+            with step("Verify reads and another login go on while it runs"):
+                began = time.monotonic()
+                assert store.get("reader", FakeLogin()) == "token-0"
+                assert store.get("other", FakeLogin()) == "token-1"
+                assert time.monotonic() - began < 0.25
+                assert not pending.done()
+        assert pending.result() == "token-1"
+    with step("Verify both logins were stored"):
+        assert store.peek(LOGIN).token == "token-1"
+        assert store.peek("other").token == "token-1"
+
+
+@pytest.mark.regression
+def test_expired_logins_are_dropped_on_write(tmp_path):
+    with step("Store a token and let it expire"):
+        clock = FakeClock()
+        store = TokenStore(BASE_URL, directory=tmp_path, max_age=60, clock=clock)
+        store.put("stale", "token-0")
+        clock.now += 61
+    with step("Store a token for another login"):
+        store.put(LOGIN, "token-1")
+    with step("Verify the expired login is gone from the file"):
+        assert store.peek("stale") is None
+        assert store.peek(LOGIN).token == "token-1"
+        assert "stale" not in store.path.read_text(encoding="utf-8")
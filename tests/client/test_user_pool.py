@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from tests.fixtures.allure_helpers import step
+from tests.fixtures.api import SessionUser
+from tests.fixtures.user_pool import PooledUser, UserPool
+
+BASE_URL = "http://dm.local"
+POOL_SIZE = 4
+
+
+class FakeAccounts:
+    """Stands in for register → activate → login; counts provisioning and re-login calls."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self.provisioned = 0
+        self.relogins: list[str] = []
+        self.rejected: set[str] = set()
+
+    def provision(self) -> SessionUser:
+        time.sleep(self.delay)
+        with self._lock:
+            self.provisioned += 1
+            index = next(self._ids)
+        return SessionUser(login=f"pool_{index}", password="secret", email=f"pool_{index}@example.com", token="t0")
+
+    def relogin(self, user: PooledUser) -> str | None:
+        self.relogins.append(user.login)
+        return None if user.login in self.rejected else f"{user.login}-fresh"
+
+
+def _pool(tmp_path, accounts: FakeAccounts, **kwargs) -> UserPool:
+    return UserPool(BASE_URL, POOL_SIZE, accounts.provision, accounts.relogin, directory=tmp_path, **kwargs)
+
+
+@pytest.mark.regression
+def test_pool_is_provisioned_in_parallel_once(tmp_path):
+    with step(f"Provision a pool of {POOL_SIZE} slow-to-create users"):
+        accounts = FakeAccounts(delay=0.2)
+        started = time.monotonic()
+        users = _pool(tmp_path, accounts).ensure()
+        elapsed = time.monotonic() - started
+    with step("Verify users were created concurrently"):
+        assert len(users) == POOL_SIZE
+        assert elapsed < POOL_SIZE * 0.2
+    with step("Verify a second pool on the same file reuses the persisted users"):
+        assert [user.login for user in _pool(tmp_path, accounts).ensure()] == [user.login for user in users]
+        assert accounts.provisioned == POOL_SIZE
+
+
+@pytest.mark.regression
+def test_leases_are_exclusive_and_released(tmp_path):
+    with step("Provision the pool and lease every user from two pool instances"):
+        accounts = FakeAccounts()
+        first, second = _pool(tmp_path, accounts), _pool(tmp_path, accounts)
+        first.ensure()
+        leased = [first.lease(), second.lease(), first.lease(), second.lease()]
+    with step("Verify no user was handed out twice"):
+        assert len({user.login for user in leased}) == POOL_SIZE
+    with step("Verify an exhausted pool grows instead of sharing a user"):
+        extra = second.lease()
+        assert extra.login not in {user.login for user in leased}
+        assert len(first.users()) == POOL_SIZE + 1
+    with step("Verify a released user can be leased again"):
+        first.release(leased[0])
+        assert second.lease().login == leased[0].login
+
+
+@pytest.mark.regression
+def test_stale_lease_of_dead_process_is_reclaimed(tmp_path):
+    with step("Provision the pool and mark every user as leased by a dead process"):
+        accounts = FakeAccounts()
+        pool = _pool(tmp_path, accounts)
+        for user in pool.ensure():
+            pool.lease_dir.mkdir(parents=True, exist_ok=True)
+            stale = {"pid": 2**22 + 1, "host": socket.gethostname(), "leased_at": time.time()}
+            (pool.lease_dir / f"{user.login}.lease").write_text(json.dumps(stale))
+    with step("Lease a user"):
+        user = pool.lease()
+    with step("Verify an existing user was reclaimed instead of provisioning a new one"):
+        assert accounts.provisioned == POOL_SIZE
+        assert user.login.startswith("pool_")
+
+
+@pytest.mark.regression
+def test_old_tokens_are_revalidated_and_dead_users_dropped(tmp_path):
+    with step("Provision the pool and reject re-login of the first user"):
+        accounts = FakeAccounts()
+        pool = _pool(tmp_path, accounts, revalidate_after=0)
+        users = pool.ensure()
+        accounts.rejected.add(users[0].login)
+    with step("Lease a user"):
+        leased = pool.lease()
+    with step("Verify the rejected user was dropped and the next one got a fresh token"):
+        assert accounts.relogins == [users[0].login, users[1].login]
+        assert leased.login == users[1].login
+        assert leased.token == f"{users[1].login}-fresh"
+        persisted = {user.login: user.token for user in pool.users()}
+        assert users[0].login not in persisted
+        assert persisted[users[1].login] == leased.token
+
+
+@pytest.mark.regression
+def test_pool_file_is_private_and_grown_user_is_leased_before_it_is_shared(tmp_path):
+    with step("Provision the pool and lease every user"):
+        accounts = FakeAccounts()
+        pool = _pool(tmp_path, accounts)
+        pool.ensure()
+        leased = {pool.lease().login for _ in range(POOL_SIZE)}
+    with step("Verify the pool file is readable by its owner only"):
+        assert pool.path.stat().st_mode & 0o777 == 0o600
+    with step("Let another worker take the first user grown for the exhausted pool"):
+        provision = accounts.provision
+        taken = []
+
+        def provision_taken_once() -> SessionUser:
+            user = provision()
+            if not taken:
+                taken.append(user.login)
+                pool.lease_dir.mkdir(parents=True, exist_ok=True)
+                (pool.lease_dir / f"{user.login}.lease").write_text(json.dumps({"leased_at": time.time()}))
+            return user
+
+        pool._provision = provision_taken_once
+        grown = pool.lease()
+    with step("Verify the pool grew again instead of failing"):
+        assert grown.login not in leased | set(taken)
+        assert {user.login for user in pool.users()} == leased | set(taken) | {grown.login}
+
+
+@pytest.mark.regression
+def test_old_lease_of_live_process_is_kept(tmp_path):
+    with step("Provision the pool and mark every user as leased by this process long ago"):
+        accounts = FakeAccounts()
+        pool = _pool(tmp_path, accounts, lease_ttl=60)
+        users = pool.ensure()
+        pool.lease_dir.mkdir(parents=True, exist_ok=True)
+        old = {"pid": os.getpid(), "host": socket.gethostname(), "leased_at": time.time() - 3600}
+        for user in users:
+            (pool.lease_dir / f"{user.login}.lease").write_text(json.dumps(old))
+    with step("Lease a user"):
+        user = pool.lease()
+    with step("Verify the live leases were kept and the pool grew instead"):
+        assert user.login not in {item.login for item in users}
+        assert accounts.provisioned == POOL_SIZE + 1
+    with step("Verify an old lease from another host is reclaimed"):
+        foreign = {"pid": os.getpid(), "host": "other-host", "leased_at": time.time() - 3600}
+        (pool.lease_dir / f"{users[0].login}.lease").write_text(json.dumps(foreign))
+        pool._reclaim_stale_leases(pool.users())
+        assert not (pool.lease_dir / f"{users[0].login}.lease").exists()
+        assert (pool.lease_dir / f"{users[1].login}.lease").exists()
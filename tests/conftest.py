@@ -2,4 +2,5 @@ pytest_plugins = [
     "tests.fixtures.config",
     "tests.fixtures.api",
     "tests.fixtures.hooks",
+    "tests.fixtures.reaper",
 ]
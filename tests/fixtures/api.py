@@ -1,22 +1,23 @@
 from __future__ import annotations
 
-import re
-import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 
 import pytest
 import requests
 from faker import Faker
 
+from src.api.auth import StoredCredentials, TokenStore
 from src.api.controllers.account.account_controller import AccountApi
 from src.api.controllers.account.login_controller import LoginApi
 from src.api.models.account.login_model import LoginCredentials
 from tests.fixtures.config import Config
+from tests.fixtures.mailhog import extract_activation_token_from_mailhog
+from tests.fixtures.user_pool import UserPool
 
 fake = Faker()
-UUID_RE = re.compile(
-    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
-)
 
 
 @dataclass(frozen=True)
@@ -27,41 +28,6 @@ class SessionUser:
     token: str
 
 
-def extract_activation_token_from_mailhog(mail_hog_url: str, email: str, timeout_sec: int = 60) -> str | None:
-    mailbox, _, domain = email.partition("@")
-    if not mailbox or not domain:
-        return None
-
-    deadline = time.time() + timeout_sec
-    endpoint = f"{mail_hog_url.rstrip('/')}/api/v2/messages"
-    while time.time() < deadline:
-        try:
-            response = requests.get(endpoint, timeout=15)
-            response.raise_for_status()
-            items = response.json().get("items", [])
-        except Exception:
-            time.sleep(2)
-            continue
-
-        for message in items:
-            recipients = message.get("To", [])
-            is_for_user = any(
-                recipient.get("Mailbox") == mailbox and recipient.get("Domain") == domain
-                for recipient in recipients
-            )
-            if not is_for_user:
-                continue
-
-            body = (message.get("Content", {}) or {}).get("Body", "")
-            match = UUID_RE.search(body)
-            if match:
-                return match.group(0)
-
-        time.sleep(2)
-
-    return None
-
-
 def _create_active_session_user(configs: Config, login_api: LoginApi, account_api: AccountApi, prefix: str) -> SessionUser:
     login = f"{prefix}_{fake.user_name()}_{fake.pyint(min_value=1000, max_value=9999)}"
     password = fake.password(length=14)
@@ -105,28 +71,108 @@ def account_api(configs: Config) -> AccountApi:
     return AccountApi(base_url=configs.base_url)
 
 
-@pytest.fixture(scope="session")
-def session_user(configs: Config, login_api: LoginApi, account_api: AccountApi) -> SessionUser:
-    return _create_active_session_user(configs, login_api, account_api, prefix="autotest")
-
-
-@pytest.fixture(scope="function")
-def auth_token(session_user: SessionUser, login_api: LoginApi, fresh_session_user: SessionUser) -> str:
-    # Refresh token per test to avoid random 401 when long suite invalidates old session token.
+def _relogin(login_api: LoginApi, user: SessionUser) -> str | None:
     try:
         logged_in = login_api.login(
             payload=LoginCredentials(
-                login=session_user.login,
-                password=session_user.password,
+                login=user.login,
+                password=user.password,
                 remember_me=True,
             )
         )
-        token = logged_in.metadata.get("token") if logged_in.metadata else None
-        if token:
-            return token
     except requests.HTTPError:
-        pass
+        return None
+    return logged_in.metadata.get("token") if logged_in.metadata else None
+
+
+@contextmanager
+def _leased_session_user(
+    user_pool: UserPool | None, configs: Config, login_api: LoginApi, account_api: AccountApi, prefix: str
+) -> Iterator[SessionUser]:
+    if user_pool is None:
+        yield _create_active_session_user(configs, login_api, account_api, prefix=prefix)
+        return
+    user = user_pool.lease()
+    try:
+        yield SessionUser(login=user.login, password=user.password, email=user.email, token=user.token)
+    finally:
+        user_pool.release(user)
+
+
+@contextmanager
+def _leased_session_users(
+    user_pool: UserPool | None,
+    configs: Config,
+    login_api: LoginApi,
+    account_api: AccountApi,
+    prefixes: Sequence[str],
+) -> Iterator[tuple[SessionUser, ...]]:
+    # Users are leased or registered on a thread pool, so a module pays one activation round trip instead of one
+    # per user. If any of them fails, the ones already obtained are released before the error propagates.
+    contexts = [_leased_session_user(user_pool, configs, login_api, account_api, prefix) for prefix in prefixes]
+    with ExitStack() as stack:
+        with ThreadPoolExecutor(max_workers=max(len(contexts), 1), thread_name_prefix="dm-session-user") as executor:
+            futures = [executor.submit(context.__enter__) for context in contexts]
+        users, errors = [], []
+        for context, future in zip(contexts, futures, strict=True):
+            try:
+                users.append(future.result())
+            except BaseException as error:
+                errors.append(error)
+            else:
+                stack.push(context)
+        if errors:
+            raise errors[0]
+        yield tuple(users)
 
+
+@pytest.fixture(scope="session")
+def user_pool(configs: Config, login_api: LoginApi, account_api: AccountApi) -> UserPool | None:
+    pool = UserPool.from_env(
+        configs.base_url,
+        provision=lambda: _create_active_session_user(configs, login_api, account_api, prefix="pool"),
+        relogin=lambda user: _relogin(login_api, user),
+    )
+    if pool is not None:
+        pool.ensure()
+    return pool
+
+
+@pytest.fixture(scope="session")
+def session_user(
+    configs: Config, login_api: LoginApi, account_api: AccountApi, user_pool: UserPool | None
+) -> Iterator[SessionUser]:
+    with _leased_session_user(user_pool, configs, login_api, account_api, prefix="autotest") as user:
+        yield user
+
+
+@pytest.fixture(scope="session")
+def token_store(configs: Config) -> TokenStore:
+    return TokenStore.from_env(configs.base_url)
+
+
+def _user_credentials(token_store: TokenStore, login_api: LoginApi, user: SessionUser) -> StoredCredentials:
+    # Controllers built with these credentials re-issue the token themselves on a 401 and replay the request.
+    return StoredCredentials(token_store, user.login, lambda: _relogin(login_api, user))
+
+
+@pytest.fixture(scope="session")
+def session_credentials(session_user: SessionUser, login_api: LoginApi, token_store: TokenStore) -> StoredCredentials:
+    return _user_credentials(token_store, login_api, session_user)
+
+
+@pytest.fixture(scope="function")
+def auth_token(
+    request: pytest.FixtureRequest, session_user: SessionUser, login_api: LoginApi, token_store: TokenStore
+) -> str:
+    # Tokens are shared per login across tests and xdist workers and re-issued once older than DM_TOKEN_MAX_AGE,
+    # so a long suite no longer logs in before every test. The fallback user is requested lazily:
+    # registering and activating one costs far more than the re-login.
+    token = token_store.get(session_user.login, lambda: _relogin(login_api, session_user))
+    if token:
+        return token
+
+    fresh_session_user: SessionUser = request.getfixturevalue("fresh_session_user")
     return fresh_session_user.token
 
 
@@ -141,8 +187,11 @@ def user_password(session_user: SessionUser) -> str:
 
 
 @pytest.fixture(scope="session")
-def another_session_user(configs: Config, login_api: LoginApi, account_api: AccountApi) -> SessionUser:
-    return _create_active_session_user(configs, login_api, account_api, prefix="autotest_alt")
+def another_session_user(
+    configs: Config, login_api: LoginApi, account_api: AccountApi, user_pool: UserPool | None
+) -> Iterator[SessionUser]:
+    with _leased_session_user(user_pool, configs, login_api, account_api, prefix="autotest_alt") as user:
+        yield user
 
 
 @pytest.fixture(scope="session")
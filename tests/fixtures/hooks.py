@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
 
 import pytest
 
+from src.api.metrics import LatencyRecorder, PoolRecorder, latency_metrics, pool_metrics
+
 FAILED_FIXTURE_STATUSES = {"failed", "broken"}
+SESSION_STARTED_AT = pytest.StashKey[float]()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -15,6 +20,10 @@ def pytest_runtest_makereport(item: pytest.Item):
     setattr(item, f"rep_{rep.when}", rep)
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[SESSION_STARTED_AT] = time.time()
+
+
 def _get_allure_results_dir(config: pytest.Config) -> Path | None:
     for option_name in ("alluredir", "--alluredir"):
         try:
@@ -46,8 +55,31 @@ def _filter_fixture_blocks(container_path: Path) -> None:
         container_path.write_text(json.dumps(data), encoding="utf-8")
 
 
+def _dump_report(config: pytest.Config, name: str, recorder: LatencyRecorder | PoolRecorder) -> None:
+    report_dir = Path(os.getenv("DM_LATENCY_REPORT_DIR", "test-result/latency"))
+    worker_id = getattr(config, "workerinput", {}).get("workerid")
+    if worker_id:
+        recorder.dump_json(report_dir / f"{name}-{worker_id}.json")
+        return
+
+    merged = type(recorder)()
+    merged.merge(recorder)
+    started_at = config.stash.get(SESSION_STARTED_AT, 0.0)
+    for worker_report in report_dir.glob(f"{name}-gw*.json"):
+        try:
+            if worker_report.stat().st_mtime >= started_at:
+                merged.merge(type(recorder).from_dict(json.loads(worker_report.read_text(encoding="utf-8"))))
+            worker_report.unlink()
+        except Exception:
+            continue
+    merged.dump_json(report_dir / f"{name}-report.json")
+
+
 def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     _ = exitstatus
+    _dump_report(session.config, "latency", latency_metrics)
+    _dump_report(session.config, "pool", pool_metrics)
+
     results_dir = _get_allure_results_dir(session.config)
     if not results_dir or not results_dir.exists():
         return
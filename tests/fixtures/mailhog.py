@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from websockets.exceptions import WebSocketException
+from websockets.sync.client import ClientConnection, connect
+
+from src.api.env import env_flag, env_float
+from src.api.pool import session_pool, warm_pool
+
+UUID_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+_FRACTION_RE = re.compile(r"(\.\d{6})\d+")
+
+
+def _recipients(message: dict) -> list[str]:
+    return [
+        f"{recipient.get('Mailbox')}@{recipient.get('Domain')}".lower()
+        for recipient in message.get("To") or []
+        if recipient.get("Mailbox") and recipient.get("Domain")
+    ]
+
+
+def _created_at(message: dict) -> float | None:
+    created = message.get("Created")
+    if not created:
+        return None
+    try:
+        return datetime.fromisoformat(_FRACTION_RE.sub(r"\1", created).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _activation_token(message: dict) -> str | None:
+    body = (message.get("Content", {}) or {}).get("Body", "")
+    match = UUID_RE.search(body)
+    return match.group(0) if match else None
+
+
+class MailHogIndexer:
+    """
+    One background poller per MailHog instance that maps recipient → latest activation token.
+
+    Each poll asks ``/api/v2/search?kind=to`` only for the recipients somebody is currently waiting for, over one
+    keep-alive session, so its cost follows the number of pending registrations rather than the inbox size.
+    Fixtures block in ``wait_for_token`` on a condition variable; the poller only runs while somebody is waiting.
+    With ``delete_consumed`` the activation mail is deleted once its token has been handed out, which keeps
+    the inbox from growing run after run.
+
+    With ``stream`` enabled a second thread subscribes to ``/api/v2/websocket`` and indexes every new message
+    the moment MailHog pushes it. While the stream is up, each recipient is searched successfully once to catch up
+    on mail that arrived before the subscription. The subscriber pings every ``stream_ping_interval`` seconds and
+    drops a connection whose pong does not arrive in time, so a half-open stream is noticed. If the stream is
+    refused or drops, the poller takes over again and the subscriber retries every ``stream_retry`` seconds.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        poll_interval: float = 1.0,
+        page_size: int = 50,
+        lookback: float = 300.0,
+        delete_consumed: bool = False,
+        stream: bool = True,
+        stream_retry: float = 30.0,
+        stream_ping_interval: float = 10.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.poll_interval = poll_interval
+        self.page_size = page_size
+        self.delete_consumed = delete_consumed
+        self.stream = stream
+        self.stream_retry = stream_retry
+        self.stream_ping_interval = stream_ping_interval
+        self._since = time.time() - lookback
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._tokens: dict[str, tuple[str, str | None]] = {}
+        self._seen: set[str] = set()
+        self._pending: dict[str, int] = {}
+        self._thread: threading.Thread | None = None
+        self._stream_thread: threading.Thread | None = None
+        self._websocket: ClientConnection | None = None
+        self._searched_live: set[str] | None = None
+
+    def _search(self, recipient: str) -> list[dict]:
+        response = self._session.get(
+            f"{self.base_url}/api/v2/search",
+            params={"kind": "to", "query": recipient, "start": 0, "limit": self.page_size},
+            timeout=15,
+        )
+        response.raise_for_status()
+        return [
+            message
+            for message in response.json().get("items") or []
+            if message.get("ID") not in self._seen
+            and ((created := _created_at(message)) is None or created >= self._since)
+        ]
+
+    def index(self, messages: list[dict]) -> None:
+        """Record activation tokens from ``messages``, given newest first, and wake matching waiters."""
+        with self._condition:
+            for message in reversed(messages):
+                message_id = message.get("ID")
+                if message_id:
+                    self._seen.add(message_id)
+                token = _activation_token(message)
+                if token:
+                    for recipient in _recipients(message):
+                        self._tokens[recipient] = (token, message_id)
+            self._condition.notify_all()
+
+    @property
+    def streaming(self) -> bool:
+        return self._searched_live is not None
+
+    def _due_recipients_waiting(self) -> bool:
+        if self._searched_live is None:
+            return bool(self._pending)
+        return any(recipient not in self._searched_live for recipient in self._pending)
+
+    def _due_recipients(self) -> list[str]:
+        recipients = list(self._pending)
+        if self._searched_live is not None:
+            recipients = [recipient for recipient in recipients if recipient not in self._searched_live]
+        return [recipient for recipient in recipients if recipient not in self._tokens]
+
+    def _searched(self, recipient: str, live: set[str] | None) -> None:
+        # Only a search that completed while the same stream was up counts as the catch-up for that stream.
+        with self._condition:
+            if live is not None and self._searched_live is live:
+                live.add(recipient)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            with self._condition:
+                self._condition.wait_for(lambda: self._due_recipients_waiting() or self._stopped.is_set())
+                recipients = self._due_recipients()
+                live = self._searched_live
+            if self._stopped.is_set():
+                return
+            for recipient in recipients:
+                try:
+                    messages = self._search(recipient)
+                except requests.RequestException, ValueError:
+                    continue
+                if messages:
+                    self.index(messages)
+                self._searched(recipient, live)
+            self._stopped.wait(self.poll_interval)
+
+    def _subscribe(self) -> None:
+        url = self.base_url.replace("http", "ws", 1) + "/api/v2/websocket"
+        while not self._stopped.is_set():
+            connected = False
+            try:
+                with connect(
+                    url,
+                    open_timeout=5,
+                    ping_interval=self.stream_ping_interval,
+                    ping_timeout=self.stream_ping_interval,
+                    close_timeout=1,
+                    max_size=None,
+                ) as websocket:
+                    connected = True
+                    self._stream(websocket)
+            except OSError, WebSocketException:
+                pass
+            if not connected:
+                self._stopped.wait(self.stream_retry)
+
+    def _stream(self, websocket: ClientConnection) -> None:
+        with self._condition:
+            self._websocket = websocket
+            self._searched_live = set()
+            self._condition.notify_all()
+        try:
+            for frame in websocket:
+                try:
+                    message = json.loads(frame)
+                except ValueError:
+                    continue
+                if isinstance(message, dict):
+                    self.index([message])
+        finally:
+            with self._condition:
+                self._websocket = None
+                self._searched_live = None
+                self._condition.notify_all()
+
+    def _ensure_started(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="mailhog-indexer", daemon=True)
+            self._thread.start()
+        if self.stream and (self._stream_thread is None or not self._stream_thread.is_alive()):
+            self._stream_thread = threading.Thread(target=self._subscribe, name="mailhog-stream", daemon=True)
+            self._stream_thread.start()
+
+    def _delete(self, message_id: str) -> None:
+        try:
+            self._session.delete(f"{self.base_url}/api/v1/messages/{message_id}", timeout=15)
+        except requests.RequestException:
+            pass
+
+    def wait_for_token(self, email: str, timeout: float = 60.0) -> str | None:
+        key = email.lower()
+        with self._condition:
+            if key not in self._tokens:
+                self._pending[key] = self._pending.get(key, 0) + 1
+                self._ensure_started()
+                self._condition.notify_all()
+                try:
+                    self._condition.wait_for(lambda: key in self._tokens, timeout)
+                finally:
+                    self._pending[key] -= 1
+                    if not self._pending[key]:
+                        del self._pending[key]
+            found = self._tokens.get(key)
+        if found is None:
+            return None
+        token, message_id = found
+        if self.delete_consumed and message_id:
+            self._delete(message_id)
+        return token
+
+    def warm_up(self, connections: int) -> int:
+        """Open up to ``connections`` connections to MailHog before the first search needs them."""
+        return warm_pool(session_pool(self._session, self.base_url), connections)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        with self._condition:
+            websocket = self._websocket
+            self._condition.notify_all()
+        if websocket is not None:
+            websocket.close()
+        for thread in (self._thread, self._stream_thread):
+            if thread is not None:
+                thread.join(timeout=5)
+        self._session.close()
+
+
+_indexers: dict[str, MailHogIndexer] = {}
+_indexers_lock = threading.Lock()
+
+
+def mailhog_indexer(mail_hog_url: str) -> MailHogIndexer:
+    key = mail_hog_url.rstrip("/")
+    with _indexers_lock:
+        indexer = _indexers.get(key)
+        if indexer is None:
+            indexer = MailHogIndexer(
+                key,
+                poll_interval=env_float("DM_MAILHOG_POLL_INTERVAL", 1.0, minimum=0.05),
+                delete_consumed=env_flag("DM_MAILHOG_DELETE_CONSUMED"),
+                stream=env_flag("DM_MAILHOG_STREAM", default=True),
+                stream_ping_interval=env_float("DM_MAILHOG_STREAM_PING", 10.0, minimum=0.05),
+            )
+            _indexers[key] = indexer
+        return indexer
+
+
+def extract_activation_token_from_mailhog(mail_hog_url: str, email: str, timeout_sec: int = 60) -> str | None:
+    mailbox, _, domain = email.partition("@")
+    if not mailbox or not domain:
+        return None
+    return mailhog_indexer(mail_hog_url).wait_for_token(email, timeout=timeout_sec)
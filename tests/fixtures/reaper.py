@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+import httpx
+import pytest
+import requests
+
+from src.api.env import env_int
+
+TOLERATED_STATUSES = frozenset({403, 404, 410})
+
+
+@dataclass(frozen=True)
+class ReapFailure:
+    label: str
+    error: BaseException
+
+
+def _status_code(error: Exception) -> int | None:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+class ResourceReaper:
+    """
+    Deletes resources created by fixtures on a background pool, so tests do not wait for cleanup round trips.
+
+    Fixtures ``register`` a delete call instead of making it in their teardown. Deletions answered with one of
+    ``tolerated`` statuses (already gone, or not ours to delete) count as done; any other error is collected
+    and raised from ``flush`` as an ``ExceptionGroup``.
+    """
+
+    def __init__(self, workers: int = 4, tolerated: frozenset[int] = TOLERATED_STATUSES):
+        self.tolerated = tolerated
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dm-reaper")
+        self._lock = threading.Lock()
+        self._pending: set[Future] = set()
+        self.failures: list[ReapFailure] = []
+        self.reaped = 0
+
+    def register(self, label: str, delete: Callable[..., object], *args, **kwargs) -> Future:
+        future = self._executor.submit(self._reap, label, delete, args, kwargs)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def _reap(self, label: str, delete: Callable[..., object], args: tuple, kwargs: dict) -> None:
+        try:
+            delete(*args, **kwargs)
+        except (requests.HTTPError, httpx.HTTPStatusError) as error:
+            if _status_code(error) not in self.tolerated:
+                self._fail(label, error)
+                return
+        except Exception as error:
+            self._fail(label, error)
+            return
+        with self._lock:
+            self.reaped += 1
+
+    def _fail(self, label: str, error: BaseException) -> None:
+        with self._lock:
+            self.failures.append(ReapFailure(label, error))
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait for every registered deletion and raise the failures collected so far."""
+        with self._lock:
+            pending = set(self._pending)
+        wait(pending, timeout=timeout)
+        with self._lock:
+            failures, self.failures = self.failures, []
+        if failures:
+            raise ExceptionGroup(
+                f"{len(failures)} resource(s) could not be deleted: {', '.join(failure.label for failure in failures)}",
+                [failure.error for failure in failures],
+            )
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+
+@pytest.fixture(scope="session")
+def resource_reaper() -> Iterator[ResourceReaper]:
+    reaper = ResourceReaper(workers=env_int("DM_REAPER_WORKERS", 4))
+    yield reaper
+    reaper.close()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Protocol
+
+from src.api.env import env_float, env_int
+from src.api.file_lock import FileLock
+
+
+class Credentials(Protocol):
+    login: str
+    password: str
+    email: str
+    token: str
+
+
+@dataclass(frozen=True)
+class PooledUser:
+    login: str
+    password: str
+    email: str
+    token: str
+    validated_at: float
+
+
+class UserPool:
+    """
+    Activated users provisioned ahead of time and persisted per ``BASE_URL``, reused across runs and xdist workers.
+
+    The pool file is only written under a ``FileLock`` (provisioning, token refresh, reclaiming stale leases).
+    Leasing itself is lock-free: a user is taken by creating its lease file with ``O_CREAT | O_EXCL``, so
+    exactly one worker wins. Leases of dead processes on this host, and leases from other hosts older than
+    ``lease_ttl`` seconds, are reclaimed. Tokens older than ``revalidate_after`` seconds are refreshed through
+    ``relogin`` when leased.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        size: int,
+        provision: Callable[[], Credentials],
+        relogin: Callable[[PooledUser], str | None],
+        directory: str | Path | None = None,
+        lease_ttl: float = 3600.0,
+        revalidate_after: float = 600.0,
+        workers: int = 8,
+    ):
+        digest = hashlib.sha1(base_url.rstrip("/").encode()).hexdigest()[:12]
+        directory = Path(directory or Path(tempfile.gettempdir()) / "dm-api-user-pool")
+        self.base_url = base_url
+        self.size = size
+        self.path = directory / f"users-{digest}.json"
+        self.lease_dir = directory / f"leases-{digest}"
+        self.lease_ttl = lease_ttl
+        self.revalidate_after = revalidate_after
+        self.workers = workers
+        self._provision = provision
+        self._relogin = relogin
+        self._lock = FileLock(directory / f"users-{digest}.lock")
+
+    @classmethod
+    def from_env(
+        cls, base_url: str, provision: Callable[[], Credentials], relogin: Callable[[PooledUser], str | None]
+    ) -> UserPool | None:
+        size = env_int("DM_USER_POOL_SIZE", 0, minimum=0)
+        if not size:
+            return None
+        return cls(
+            base_url,
+            size,
+            provision,
+            relogin,
+            directory=os.getenv("DM_USER_POOL_DIR") or None,
+            lease_ttl=env_float("DM_USER_POOL_LEASE_TTL", 3600.0, minimum=1.0),
+            revalidate_after=env_float("DM_USER_POOL_REVALIDATE_SEC", 600.0),
+        )
+
+    def _read(self) -> list[PooledUser]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError, ValueError:
+            return []
+        if payload.get("base_url") != self.base_url:
+            return []
+        return [PooledUser(**user) for user in payload.get("users", [])]
+
+    def _write(self, users: list[PooledUser]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(f".{os.getpid()}.tmp")
+        # The file holds passwords and tokens, so it is created owner-only like the lock and lease files.
+        fd = os.open(temporary, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump({"base_url": self.base_url, "users": [asdict(user) for user in users]}, file, indent=2)
+        os.replace(temporary, self.path)
+
+    def users(self) -> list[PooledUser]:
+        return self._read()
+
+    def _provision_users(self, count: int) -> list[PooledUser]:
+        if count <= 0:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.workers, count), thread_name_prefix="dm-user-pool") as executor:
+            created = list(executor.map(lambda _index: self._provision(), range(count)))
+        now = time.time()
+        return [PooledUser(user.login, user.password, user.email, user.token, validated_at=now) for user in created]
+
+    def ensure(self) -> list[PooledUser]:
+        """Top the pool up to ``size`` users, provisioning the missing ones in parallel."""
+        with self._lock:
+            users = self._read()
+            missing = self.size - len(users)
+            if missing > 0:
+                users += self._provision_users(missing)
+                self._write(users)
+            return users
+
+    def _lease_path(self, user: Credentials) -> Path:
+        return self.lease_dir / f"{user.login}.lease"
+
+    def _try_lease(self, user: PooledUser) -> bool:
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(self._lease_path(user), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as lease:
+            json.dump({"pid": os.getpid(), "host": socket.gethostname(), "leased_at": time.time()}, lease)
+        return True
+
+    def _is_stale(self, path: Path) -> bool:
+        try:
+            lease = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return False
+        except ValueError:
+            return time.time() - path.stat().st_mtime > self.lease_ttl
+        expired = time.time() - lease.get("leased_at", 0) > self.lease_ttl
+        pid = lease.get("pid")
+        if lease.get("host") != socket.gethostname() or not isinstance(pid, int):
+            return expired
+        # Session-scoped leases are held for the whole run, so a lease of a live process on this host is never
+        # taken away however old it is; ``lease_ttl`` only applies where the holder cannot be checked.
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+    def _reclaim_stale_leases(self, users: list[PooledUser]) -> None:
+        for user in users:
+            path = self._lease_path(user)
+            if path.exists() and self._is_stale(path):
+                path.unlink(missing_ok=True)
+
+    def _revalidate(self, user: PooledUser) -> PooledUser | None:
+        if time.time() - user.validated_at < self.revalidate_after:
+            return user
+        token = self._relogin(user)
+        with self._lock:
+            users = self._read()
+            if token is None:
+                refreshed = None
+                users = [item for item in users if item.login != user.login]
+            else:
+                refreshed = PooledUser(user.login, user.password, user.email, token, validated_at=time.time())
+                users = [refreshed if item.login == user.login else item for item in users]
+            self._write(users)
+        return refreshed
+
+    def lease(self) -> PooledUser:
+        """
+        Take an unused user, reclaiming stale leases once and then growing the pool by one while every user is taken.
+
+        A grown user is leased before it is written to the pool file, so no other worker can take it first.
+        """
+        reclaimed = False
+        while True:
+            users = self._read() or self.ensure()
+            for user in users:
+                if not self._try_lease(user):
+                    continue
+                valid = self._revalidate(user)
+                if valid is not None:
+                    return valid
+                self._lease_path(user).unlink(missing_ok=True)
+            with self._lock:
+                if not reclaimed:
+                    reclaimed = True
+                    self._reclaim_stale_leases(self._read())
+                    continue
+                (created,) = self._provision_users(1)
+                leased = self._try_lease(created)
+                self._write([*self._read(), created])
+            if leased:
+                return created
+
+    def release(self, user: Credentials) -> None:
+        self._lease_path(user).unlink(missing_ok=True)